@@ -0,0 +1,107 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from constants import ASYNC_MAX_WORKERS
+from .base_client import BaseApiClient, ApiResponse
+from .request_context import bind_request_context
+
+T = TypeVar('T')
+
+# Set while a blocking service method runs on the executor, so nested requests stay synchronous
+_in_blocking_call = contextvars.ContextVar('qualifaize_in_blocking_call', default=False)
+
+
+class _EventLoopThread:
+    """Long-lived event loop running on a daemon thread, shared by every Streamlit session."""
+
+    def __init__(self, max_workers: int = ASYNC_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="qualifaize-async")
+                )
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                threading.Thread(target=run, name="qualifaize-event-loop", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+
+_event_loop_thread = _EventLoopThread()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    return _event_loop_thread.loop
+
+
+def run_sync(awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run an awaitable on the shared event loop and block the calling script thread for its result."""
+
+    async def wrapper():
+        return await awaitable
+
+    future = asyncio.run_coroutine_threadsafe(wrapper(), get_event_loop())
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
+
+def gather_sync(*awaitables: Awaitable[Any], timeout: Optional[float] = None,
+                return_exceptions: bool = False) -> List[Any]:
+    """Await many calls at once from a page script; results come back in argument order."""
+
+    async def gather():
+        return await asyncio.gather(*awaitables, return_exceptions=return_exceptions)
+
+    return run_sync(gather(), timeout)
+
+
+class AsyncBaseApiClient(BaseApiClient):
+    """
+    Asyncio variant of BaseApiClient with the same get/post/put/patch/delete surface.
+
+    The request methods return awaitables resolving to ``ApiResponse`` (or raising
+    ``ApiException``). The auth context is captured when a method is called, so
+    calls must be created on the script thread; they can then be awaited on the
+    shared loop, e.g. ``gather_sync(service.get_all_users(), service.get_current_user_details())``.
+    """
+
+    def run_blocking(self, fn: Callable[..., T], *args, **kwargs) -> Awaitable[T]:
+        call = bind_request_context(self._call_blocking, fn, *args, **kwargs)
+        return self._run_in_executor(call)
+
+    @staticmethod
+    def _call_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+        _in_blocking_call.set(True)
+        return fn(*args, **kwargs)
+
+    @staticmethod
+    async def _run_in_executor(call: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, call)
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Awaitable[ApiResponse]:
+        if _in_blocking_call.get():
+            return BaseApiClient._make_request(self, method, endpoint, **kwargs)
+        return self.run_blocking(BaseApiClient._make_request, self, method, endpoint, **kwargs)
@@ -1,28 +1,125 @@
-import json
 import logging
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
 from urllib.parse import urljoin
-import streamlit as st
-
 import requests
 
 from constants import BACKEND_BASE_URL, BACKEND_BASE_PATH, DEFAULT_TIMEOUT, BEARER_PREFIX, HTTP_SUCCESS_MIN, \
-    HTTP_SUCCESS_MAX
+    HTTP_SUCCESS_MAX, HTTP_NOT_MODIFIED, HTTP_UNSUPPORTED_MEDIA_TYPE, ADAPTIVE_TIMEOUTS, RESPONSE_ENCODINGS, \
+    REQUEST_BODY_ENCODING, REQUEST_COMPRESSION_MIN_BYTES, STREAM_CHUNK_SIZE, STREAM_CACHE_MAX_ITEMS
+from .codec import decode_body, dumps
+from .compression import TransferStats, TransferTotals, accept_encoding_header, compress_body, \
+    get_transfer_totals, reject_request_compression, request_body_encoding, response_transfer_stats
+from .connection_pool import SessionPool, PoolTimeout, get_connection_pool
+from .request_context import current_auth_token, auth_scope
+from .response_cache import ResponseCache, get_response_cache
+from .streaming import ApiStream
+from .single_flight import SingleFlight, SingleFlightTimeout, get_single_flight
+from .endpoints import endpoint_template
+from .metrics import ClientMetrics, get_client_metrics
+from .transport import Transport, get_transport
+from .tracing import SPAN_KIND_CLIENT, STATUS_ERROR, Span, Tracer, get_tracer
+from .multipart import MultipartEncoder, ProgressCallback
+from .resilience import RetryPolicy, ResilienceRegistry, get_resilience_registry
+from .timeouts import LatencyTracker, default_profile, get_latency_tracker, get_timeout_profile
+from .validator_cache import CachedRepresentation, ValidatorCache, get_validator_cache, request_key
+
+
+_UNDECODED = object()
 
 
-@dataclass
 class ApiResponse:
-    success: bool
-    status_code: int
-    data: Optional[Any] = None
-    error: Optional[str] = None
-    headers: Optional[Dict[str, str]] = None
+    """
+    Result of an API call.
+
+    Slotted and lazy: the body is decoded on the first access to ``data`` and the
+    headers mapping is only copied into a dict on the first access to ``headers``,
+    so callers that only check ``is_success`` never pay for either. ``transfer`` holds the
+    byte counts of the call that produced it and is None when served from a client-side cache.
+    """
+
+    __slots__ = ('success', 'status_code', 'error', 'from_cache', 'transfer', '_data', '_body', '_content_type',
+                 '_encoding', '_headers', '_raw_headers')
+
+    def __init__(self, success: bool, status_code: int, data: Optional[Any] = None, error: Optional[str] = None,
+                 headers: Optional[Mapping[str, str]] = None, from_cache: bool = False):
+        self.success = success
+        self.status_code = status_code
+        self.error = error
+        self.from_cache = from_cache
+        self.transfer: Optional[TransferStats] = None
+        self._data = data
+        self._body = None
+        self._content_type = None
+        self._encoding = None
+        self._headers = None
+        self._raw_headers = headers
+
+    @classmethod
+    def from_body(cls, success: bool, status_code: int, body: bytes, content_type: Optional[str],
+                  encoding: Optional[str], headers: Optional[Mapping[str, str]]) -> 'ApiResponse':
+        response = cls(success=success, status_code=status_code, headers=headers)
+        response._data = _UNDECODED
+        response._body = body
+        response._content_type = content_type
+        response._encoding = encoding
+        return response
+
+    @property
+    def data(self) -> Optional[Any]:
+        if self._data is _UNDECODED:
+            body = self._body
+            # Another thread may have finished decoding between the two reads; it sets _data first
+            if body is not None:
+                self._data = decode_body(body, self._content_type, self._encoding)
+                self._body = None
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[Any]) -> None:
+        self._data = value
+        self._body = None
+
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        if self._headers is None and self._raw_headers is not None:
+            self._headers = dict(self._raw_headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Optional[Mapping[str, str]]) -> None:
+        self._raw_headers = value
+        self._headers = None
+
+    @property
+    def raw_headers(self) -> Optional[Mapping[str, str]]:
+        return self._raw_headers
+
+    def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Header lookup that stays case-insensitive when built from a requests response."""
+        if self._raw_headers is None:
+            return default
+        return self._raw_headers.get(name, default)
 
     @property
     def is_success(self) -> bool:
         return self.success and HTTP_SUCCESS_MIN <= self.status_code < HTTP_SUCCESS_MAX
 
+    def as_cached(self) -> 'ApiResponse':
+        """Copy flagged as served from a client-side cache; the decoded body is shared, not copied."""
+        return ApiResponse(success=self.success, status_code=self.status_code, data=self.data, error=self.error,
+                           headers=self._raw_headers, from_cache=True)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ApiResponse):
+            return NotImplemented
+        return (self.success, self.status_code, self.data, self.error, self.headers, self.from_cache) == \
+            (other.success, other.status_code, other.data, other.error, other.headers, other.from_cache)
+
+    def __repr__(self) -> str:
+        return (f"ApiResponse(success={self.success!r}, status_code={self.status_code!r}, data={self.data!r}, "
+                f"error={self.error!r}, headers={self.headers!r}, from_cache={self.from_cache!r})")
+
 
 class ApiException(Exception):
     def __init__(self, message: str, status_code: int = None, response_data: Any = None):
@@ -32,29 +129,61 @@ class ApiException(Exception):
 
 
 class BaseApiClient:
+    # Send If-None-Match/If-Modified-Since on GETs and serve 304s from the validator cache
+    conditional_requests = True
+    # Endpoint (relative to base_path) -> TTL in seconds for the shared response cache
+    cache_policies: Dict[str, float] = {}
+    # Share one backend call between identical concurrent GETs
+    coalesce_requests = True
+    # Retries apply to idempotent requests only; circuit breakers are per endpoint template
+    retry_policy = RetryPolicy()
+    circuit_breakers = True
+    # Derive read timeouts from each endpoint's observed p99 latency (see TIMEOUT_PROFILES)
+    adaptive_timeouts = ADAPTIVE_TIMEOUTS
+    # Accept-Encoding preferences, and the encoding for JSON bodies of at least compression_min_bytes
+    response_encodings = RESPONSE_ENCODINGS
+    request_encoding = REQUEST_BODY_ENCODING
+    compression_min_bytes = REQUEST_COMPRESSION_MIN_BYTES
+
     def __init__(self, auth_token: Optional[str] = None, timeout: int = DEFAULT_TIMEOUT,
-                 base_url: str = BACKEND_BASE_URL, base_path: str = BACKEND_BASE_PATH):
+                 base_url: str = BACKEND_BASE_URL, base_path: str = BACKEND_BASE_PATH,
+                 pool: Optional[SessionPool] = None, validator_cache: Optional[ValidatorCache] = None,
+                 response_cache: Optional[ResponseCache] = None, single_flight: Optional[SingleFlight] = None,
+                 resilience: Optional[ResilienceRegistry] = None, latency_tracker: Optional[LatencyTracker] = None,
+                 transfer_totals: Optional[TransferTotals] = None, metrics: Optional[ClientMetrics] = None,
+                 tracer: Optional[Tracer] = None, transport: Optional[Transport] = None):
         self.base_url = base_url.rstrip('/')
         self.base_path = base_path.strip('/')
         self.timeout = timeout
-        self.session = requests.Session()
+        # Sessions are shared process-wide per base URL, so nothing client specific may live on them
+        self.pool = pool or get_connection_pool(self.base_url)
+        self.validator_cache = validator_cache or get_validator_cache()
+        self.response_cache = response_cache or get_response_cache()
+        self.single_flight = single_flight or get_single_flight()
+        self.resilience = resilience or get_resilience_registry()
+        self.latency_tracker = latency_tracker or get_latency_tracker()
+        self.transfer_totals = transfer_totals or get_transfer_totals()
+        self.metrics = metrics or get_client_metrics()
+        self.tracer = tracer or get_tracer()
+        self.transport = transport or get_transport()
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # Set default headers for JSON requests only
-        self.session.headers.update({
-            'Accept': 'application/json'
-        })
+        self.default_headers = {
+            'Accept': 'application/json',
+            'Accept-Encoding': accept_encoding_header(self.response_encodings)
+        }
 
         if auth_token:
             self.set_auth_token(auth_token)
 
     def set_auth_token(self, token: str) -> None:
-        self.session.headers.update({
+        self.default_headers.update({
             'Authorization': f'{BEARER_PREFIX} {token}'
         })
 
     def clear_auth_token(self) -> None:
-        self.session.headers.pop('Authorization', None)
+        self.default_headers.pop('Authorization', None)
 
     def _build_url(self, endpoint: str) -> str:
         if endpoint.startswith('/'):
@@ -66,27 +195,46 @@ class BaseApiClient:
         return urljoin(f"{self.base_url}/", full_path)
 
     def _handle_response(self, response: requests.Response) -> ApiResponse:
-        try:
-            data = response.json() if response.content else None
-        except json.JSONDecodeError:
-            data = response.text if response.content else None
-
         success = HTTP_SUCCESS_MIN <= response.status_code < HTTP_SUCCESS_MAX
+        content_type = response.headers.get('Content-Type')
+
+        api_response = ApiResponse.from_body(
+            success=success,
+            status_code=response.status_code,
+            body=response.content,
+            content_type=content_type,
+            encoding=response.encoding,
+            headers=response.headers
+        )
 
-        error = None
         if not success:
+            data = api_response.data
             if isinstance(data, dict):
-                error = data.get('message', data.get('error', f'HTTP {response.status_code}'))
+                api_response.error = data.get('message', data.get('error', f'HTTP {response.status_code}'))
             else:
-                error = f'HTTP {response.status_code}: {response.reason}'
+                api_response.error = f'HTTP {response.status_code}: {response.reason}'
+
+        return api_response
+
+    def _remember_validators(self, cache_key, response: requests.Response, api_response: ApiResponse) -> None:
+        if not api_response.is_success:
+            return
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            # The response is stored as is, so its body is only decoded if a 304 ever reuses it
+            self.validator_cache.store(cache_key, CachedRepresentation(
+                response=api_response,
+                etag=etag,
+                last_modified=last_modified
+            ))
+        else:
+            self.validator_cache.discard(cache_key)
 
-        return ApiResponse(
-            success=success,
-            status_code=response.status_code,
-            data=data,
-            error=error,
-            headers=dict(response.headers)
-        )
+    def _not_modified_response(self, cached: CachedRepresentation) -> ApiResponse:
+        self.validator_cache.record_revalidation()
+        return cached.response.as_cached()
 
     def _make_request(
             self,
@@ -95,40 +243,117 @@ class BaseApiClient:
             data: Optional[Dict[str, Any]] = None,
             params: Optional[Dict[str, Any]] = None,
             files: Optional[Dict[str, Any]] = None,
-            headers: Optional[Dict[str, str]] = None
+            headers: Optional[Dict[str, str]] = None,
+            idempotent: Optional[bool] = None,
+            timeout_profile: Optional[str] = None,
+            progress_callback: Optional[ProgressCallback] = None,
+            content: Optional[bytes] = None
+    ) -> ApiResponse:
+        """
+        ``idempotent=False`` marks a request with side effects even though its method is
+        safe (several backend GETs mutate state); such requests are never coalesced or retried.
+        ``timeout_profile`` names an entry of TIMEOUT_PROFILES; without one the client's
+        own ``timeout`` is the read timeout. ``progress_callback(bytes_sent, total_bytes)``
+        reports the progress of a ``files`` upload. ``content`` sends raw bytes as
+        application/octet-stream instead of a JSON body.
+        """
+        template = endpoint_template(endpoint)
+        with self.tracer.start_span(f"{method} {template}", kind=SPAN_KIND_CLIENT) as span:
+            if span is not None:
+                span.set_attributes({'http.request.method': method, 'url.template': template,
+                                     'server.address': self.base_url})
+            api_response = self._execute_request(method, endpoint, data, params, files, headers, idempotent,
+                                                 timeout_profile, progress_callback, content)
+            if span is not None:
+                self._annotate_span(span, api_response)
+            return api_response
+
+    def _annotate_span(self, span: Span, api_response: ApiResponse) -> None:
+        span.set_attribute('http.response.status_code', api_response.status_code)
+        span.set_attribute('qualifaize.from_cache', api_response.from_cache)
+        transfer = api_response.transfer
+        if transfer is not None:
+            span.set_attributes({
+                'http.request.body.size': transfer.request_wire_bytes,
+                'http.response.body.size': transfer.response_wire_bytes,
+                'qualifaize.response.uncompressed_size': transfer.response_bytes
+            })
+        if api_response.status_code >= 500 or api_response.status_code == 0:
+            span.set_status(STATUS_ERROR, api_response.error)
+
+    def _execute_request(
+            self,
+            method: str,
+            endpoint: str,
+            data: Optional[Dict[str, Any]],
+            params: Optional[Dict[str, Any]],
+            files: Optional[Dict[str, Any]],
+            headers: Optional[Dict[str, str]],
+            idempotent: Optional[bool],
+            timeout_profile: Optional[str],
+            progress_callback: Optional[ProgressCallback],
+            content: Optional[bytes]
     ) -> ApiResponse:
         url = self._build_url(endpoint)
 
-        # Start with clean headers for this request
-        request_headers = {}
+        # Start with the client defaults for this request
+        request_headers = dict(self.default_headers)
 
-        # Get auth headers from session state
-        if st.session_state.authenticated_user is not None:
-            logged_user = st.session_state.authenticated_user
-            auth_token = logged_user.get("token")
-            if auth_token:
-                request_headers["Authorization"] = f"Bearer {auth_token}"
+        # Get auth headers from session state (or the context bound for a worker thread)
+        auth_token = current_auth_token()
+        if auth_token:
+            request_headers["Authorization"] = f"{BEARER_PREFIX} {auth_token}"
+        self.tracer.inject(request_headers)
+
+        cache_endpoint = endpoint.strip('/')
+        cache_ttl = self.cache_policies.get(cache_endpoint) if method == 'GET' and not files else None
+        cache_key = request_key(auth_scope(auth_token), url, params) if method == 'GET' else None
+
+        if cache_ttl:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                self.logger.debug("Serving %s %s from response cache", method, url)
+                self.metrics.cache_hits.inc(method=method, endpoint=endpoint_template(endpoint), cache='response')
+                return cached_response
+
+        validator_key = None
+        cached_representation = None
+        # Non-idempotent GETs (question generation, answers, status changes) are actions, never revalidated reads
+        if method == 'GET' and idempotent is not False and self.conditional_requests and not files:
+            validator_key = cache_key
+            cached_representation = self.validator_cache.get(validator_key)
+            if cached_representation is not None:
+                request_headers.update(cached_representation.conditional_headers())
 
         # Add any additional headers passed to the method
         if headers:
             request_headers.update(headers)
 
+        connect_timeout, read_timeout = self._resolve_timeout(endpoint, timeout_profile)
+        request_bytes = None
         kwargs = {
-            'timeout': self.timeout,
+            'timeout': (connect_timeout, read_timeout),
             'params': params,
         }
 
         if files:
-            # For multipart/form-data requests (file uploads)
-            kwargs['files'] = files
-            if data:
-                # Add form data alongside files
-                kwargs['data'] = data
+            # For multipart/form-data requests (file uploads), streamed from the file objects
+            # instead of letting requests assemble the whole body in memory
+            body = MultipartEncoder(fields=data, files=files, progress_callback=progress_callback)
+            kwargs['data'] = body
+            request_bytes = len(body)
 
-            # CRITICAL: Only add Accept header for file uploads, let requests handle Content-Type
             request_headers = {k: v for k, v in request_headers.items() if k != 'Content-Type'}
+            request_headers['Content-Type'] = body.content_type
+            request_headers['Accept'] = 'application/json'
+            kwargs['headers'] = request_headers
+
+        elif content is not None:
+            request_headers.setdefault('Content-Type', 'application/octet-stream')
             request_headers['Accept'] = 'application/json'
             kwargs['headers'] = request_headers
+            kwargs['data'] = content
+            request_bytes = len(content)
 
         else:
             # For regular JSON requests
@@ -137,30 +362,334 @@ class BaseApiClient:
             kwargs['headers'] = request_headers
 
             if data is not None:
-                kwargs['json'] = data
+                request_bytes = self._encode_json_body(data, request_headers, kwargs)
 
         try:
-            self.logger.debug(f"Making {method} request to {url}")
-            self.logger.debug(f"Headers: {kwargs.get('headers', {})}")
-            if files:
-                self.logger.debug(f"Files: {list(files.keys()) if files else None}")
-                self.logger.debug(f"Form data: {data}")
+            if method == 'GET' and idempotent is not False and self.coalesce_requests:
+                # Identical concurrent reads in the same auth scope share one backend call
+                flight_key = (cache_key, tuple(sorted(headers.items())) if headers else ())
+                # Followers wait as long as the leader may keep retrying, not just one attempt
+                flight_timeout = self.retry_policy.time_budget(connect_timeout + read_timeout, method, idempotent)
+                try:
+                    api_response = self.single_flight.do(
+                        flight_key,
+                        lambda: self._send_resilient(method, endpoint, url, kwargs, idempotent, validator_key,
+                                                     cached_representation, request_bytes),
+                        timeout=flight_timeout
+                    )
+                except SingleFlightTimeout:
+                    raise ApiException(f"Request timeout after {flight_timeout:.0f} seconds")
+            else:
+                api_response = self._send_resilient(method, endpoint, url, kwargs, idempotent, validator_key,
+                                                    cached_representation, request_bytes)
+                if api_response.status_code == HTTP_UNSUPPORTED_MEDIA_TYPE and 'Content-Encoding' in request_headers:
+                    # The backend cannot decode compressed bodies and rejected this one unprocessed:
+                    # send it again as is, and stop compressing bodies for this backend
+                    self.logger.info("%s rejected a %s request body; sending uncompressed bodies from now on",
+                                     self.base_url, request_headers['Content-Encoding'])
+                    reject_request_compression(self.base_url)
+                    del request_headers['Content-Encoding']
+                    kwargs.pop('data', None)
+                    request_bytes = self._encode_json_body(data, request_headers, kwargs)
+                    api_response = self._send_resilient(method, endpoint, url, kwargs, idempotent, validator_key,
+                                                        cached_representation, request_bytes)
+        except ApiException:
+            self.metrics.observe_exception(method, endpoint_template(endpoint))
+            raise
+
+        if cache_ttl and api_response.is_success:
+            self.response_cache.put(cache_key, cache_endpoint, api_response, cache_ttl)
+
+        return api_response
+
+    def _encode_json_body(self, data: Any, request_headers: Dict[str, str], kwargs: Dict[str, Any]) -> Optional[int]:
+        """
+        Serialize a JSON body into ``kwargs``, compressing it when request compression is
+        configured, the backend has not rejected it and the body is large enough. Returns the
+        uncompressed size, or None when requests is left to serialize the body itself.
+        """
+        encoding = request_body_encoding(self.request_encoding, self.base_url)
+        if encoding is None:
+            kwargs['json'] = data
+            return None
+
+        body = dumps(data)
+        if len(body) >= self.compression_min_bytes:
+            kwargs['data'] = compress_body(body, encoding)
+            request_headers['Content-Encoding'] = encoding
+        else:
+            kwargs['data'] = body
+        return len(body)
 
-            response = self.session.request(method, url, **kwargs)
+    def _resolve_timeout(self, endpoint: str, profile_name: Optional[str]) -> Tuple[float, float]:
+        profile = get_timeout_profile(profile_name) if profile_name else default_profile(self.timeout)
+        if not self.adaptive_timeouts:
+            return profile.as_tuple()
+        read = self.latency_tracker.adaptive_read_timeout(self.base_url, endpoint_template(endpoint), profile)
+        return profile.connect, read
 
-            api_response = self._handle_response(response)
+    def _backend_unavailable_response(self, endpoint: str) -> ApiResponse:
+        return ApiResponse(
+            success=False,
+            status_code=503,
+            error=f"Backend unavailable: {endpoint} is failing, retrying shortly"
+        )
+
+    def _send_resilient(
+            self,
+            method: str,
+            endpoint: str,
+            url: str,
+            kwargs: Dict[str, Any],
+            idempotent: Optional[bool],
+            validator_key=None,
+            cached_representation: Optional[CachedRepresentation] = None,
+            request_bytes: Optional[int] = None
+    ) -> ApiResponse:
+        template = endpoint_template(endpoint)
+        breaker = self.resilience.breaker(self.base_url, template) if self.circuit_breakers else None
+        policy = self.retry_policy
+        max_attempts = policy.max_attempts if policy.can_retry(method, idempotent) else 1
+
+        attempt = 1
+        while True:
+            if breaker is not None and not breaker.allow_request():
+                self.resilience.record_short_circuit()
+                self.metrics.short_circuits.inc(method=method, endpoint=template)
+                self.logger.warning("Circuit open for %s, failing fast", template)
+                return self._backend_unavailable_response(template)
+
+            self.resilience.record_attempt()
+            started = time.monotonic()
+            try:
+                with self.metrics.track_in_flight(method, template):
+                    api_response = self._send(method, url, kwargs, validator_key, cached_representation,
+                                              request_bytes)
+                elapsed = time.monotonic() - started
+                self.latency_tracker.record(self.base_url, template, elapsed)
+                transfer = api_response.transfer
+                if transfer is not None:
+                    self.transfer_totals.record(template, transfer)
+                self.metrics.observe_response(
+                    method, template, elapsed, api_response.status_code,
+                    transfer.request_wire_bytes if transfer is not None else None,
+                    transfer.response_wire_bytes if transfer is not None else None
+                )
+            except ApiException as e:
+                self.metrics.observe_error(method, template, time.monotonic() - started, e)
+                if breaker is not None:
+                    breaker.record_failure()
+                # Only retry when the request never reached the backend; a read timeout may have been processed
+                reached_backend = not isinstance(e.__cause__, requests.exceptions.ConnectionError)
+                delay = policy.delay(attempt) if attempt < max_attempts and not reached_backend else None
+                if delay is None:
+                    if max_attempts > 1:
+                        self.resilience.record_exhausted()
+                    raise
+            else:
+                retryable_status = api_response.status_code in policy.retry_statuses
+                if breaker is not None:
+                    if retryable_status or api_response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                if not retryable_status or attempt >= max_attempts:
+                    if retryable_status and max_attempts > 1:
+                        self.resilience.record_exhausted()
+                    return api_response
+
+                retry_after = api_response.header('Retry-After')
+                delay = policy.delay(attempt, retry_after)
+                if delay is None:
+                    return api_response
+
+            self.resilience.record_retry(template)
+            self.logger.info("Retrying %s %s in %.2fs (attempt %d of %d)", method, template, delay, attempt + 1,
+                             max_attempts)
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+            self,
+            method: str,
+            url: str,
+            kwargs: Dict[str, Any],
+            validator_key=None,
+            cached_representation: Optional[CachedRepresentation] = None,
+            request_bytes: Optional[int] = None
+    ) -> ApiResponse:
+        try:
+            self.logger.debug("Making %s request to %s", method, url)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Headers: %s", kwargs.get('headers', {}))
+                if isinstance(kwargs.get('data'), MultipartEncoder):
+                    self.logger.debug("Multipart body: %d bytes", len(kwargs['data']))
+
+            with self.pool.session() as session:
+                response = self.transport.request(session, method, url, **kwargs)
+
+            if cached_representation is not None and response.status_code == HTTP_NOT_MODIFIED:
+                api_response = self._not_modified_response(cached_representation)
+            else:
+                api_response = self._handle_response(response)
+                if validator_key is not None:
+                    self._remember_validators(validator_key, response, api_response)
+
+            api_response.transfer = self._transfer_stats(response, request_bytes)
 
             if not api_response.is_success:
-                self.logger.warning(f"API request failed: {api_response.error}")
+                self.logger.warning("API request failed: %s", api_response.error)
 
             return api_response
 
-        except requests.exceptions.Timeout:
-            raise ApiException(f"Request timeout after {self.timeout} seconds")
-        except requests.exceptions.ConnectionError:
-            raise ApiException(f"Connection error to {url}")
+        except PoolTimeout as e:
+            raise ApiException(str(e)) from e
+        except requests.exceptions.ConnectTimeout as e:
+            raise ApiException(f"Connection error to {url}") from e
+        except requests.exceptions.Timeout as e:
+            raise ApiException(f"Request timeout after {kwargs['timeout'][1]:g} seconds") from e
+        except requests.exceptions.ConnectionError as e:
+            raise ApiException(f"Connection error to {url}") from e
+        except requests.exceptions.RequestException as e:
+            raise ApiException(f"Request failed: {str(e)}") from e
+
+    def _transfer_stats(self, response: requests.Response, request_bytes: Optional[int]) -> TransferStats:
+        sent_body = response.request.body if response.request is not None else None
+        # Streaming bodies without a known length (generators, raw files) have nothing to report
+        wire_bytes = len(sent_body) if hasattr(sent_body, '__len__') else None
+        stats = response_transfer_stats(response, TransferStats(
+            request_bytes=request_bytes if request_bytes is not None else wire_bytes,
+            request_wire_bytes=wire_bytes,
+            request_encoding=response.request.headers.get('Content-Encoding') if response.request is not None else None
+        ))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Transferred %s: request %s/%s bytes, response %s/%s bytes (%s)", response.url,
+                              stats.request_wire_bytes, stats.request_bytes, stats.response_wire_bytes,
+                              stats.response_bytes, stats.response_encoding or 'identity')
+        return stats
+
+    def get_stream(
+            self,
+            endpoint: str,
+            params: Optional[Dict[str, Any]] = None,
+            timeout_profile: Optional[str] = None,
+            chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> ApiStream:
+        """
+        GET a JSON array endpoint for incremental consumption through ``ApiStream.iter_items()``.
+
+        A fresh entry in the response cache is replayed instead of calling the backend. A streamed
+        list is only cached when it has at most STREAM_CACHE_MAX_ITEMS items, so long lists are
+        never held in memory. Streams bypass coalescing and retries; the read timeout applies to
+        each chunk.
+        """
+        url = self._build_url(endpoint)
+        request_headers = dict(self.default_headers)
+        auth_token = current_auth_token()
+        if auth_token:
+            request_headers["Authorization"] = f"{BEARER_PREFIX} {auth_token}"
+
+        cache_endpoint = endpoint.strip('/')
+        cache_ttl = self.cache_policies.get(cache_endpoint)
+        cache_key = request_key(auth_scope(auth_token), url, params)
+        if cache_ttl:
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                self.metrics.cache_hits.inc(method='GET', endpoint=endpoint_template(endpoint), cache='response')
+                return ApiStream(status_code=cached_response.status_code, headers=cached_response.raw_headers,
+                                 items=cached_response.data or (), from_cache=True)
+
+        template = endpoint_template(endpoint)
+        breaker = self.resilience.breaker(self.base_url, template) if self.circuit_breakers else None
+        if breaker is not None and not breaker.allow_request():
+            self.resilience.record_short_circuit()
+            self.metrics.short_circuits.inc(method='GET', endpoint=template)
+            unavailable = self._backend_unavailable_response(template)
+            return ApiStream(status_code=unavailable.status_code, error=unavailable.error)
+
+        timeout = self._resolve_timeout(endpoint, timeout_profile)
+        try:
+            session = self.pool.acquire()
+        except PoolTimeout as e:
+            raise ApiException(str(e)) from e
+
+        started = time.monotonic()
+        try:
+            # The span covers the wait for the response headers; the body is read at the caller's pace
+            with self.tracer.start_span(f"GET {template}", kind=SPAN_KIND_CLIENT) as span, \
+                    self.metrics.track_in_flight('GET', template):
+                if span is not None:
+                    span.set_attributes({'http.request.method': 'GET', 'url.template': template,
+                                         'server.address': self.base_url, 'qualifaize.streamed': True})
+                self.tracer.inject(request_headers)
+                response = self.transport.request(session, 'GET', url, params=params, headers=request_headers,
+                                                  timeout=timeout, stream=True)
+                if span is not None:
+                    span.set_attribute('http.response.status_code', response.status_code)
+        except requests.exceptions.RequestException as e:
+            self.pool.release(session, discard=isinstance(e, requests.exceptions.ConnectionError))
+            if breaker is not None:
+                breaker.record_failure()
+            # Time to first byte only: the body is consumed later, at the caller's pace
+            self.metrics.observe_error('GET', template, time.monotonic() - started, e)
+            self.metrics.observe_exception('GET', template)
+            if isinstance(e, (requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError)):
+                raise ApiException(f"Connection error to {url}") from e
+            if isinstance(e, requests.exceptions.Timeout):
+                raise ApiException(f"Request timeout after {timeout[1]:g} seconds") from e
+            raise ApiException(f"Request failed: {str(e)}") from e
+        elapsed = time.monotonic() - started
+        self.latency_tracker.record(self.base_url, template, elapsed)
+        self.metrics.observe_response('GET', template, elapsed, response.status_code)
+
+        if breaker is not None:
+            if response.status_code in self.retry_policy.retry_statuses or response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        if not HTTP_SUCCESS_MIN <= response.status_code < HTTP_SUCCESS_MAX:
+            try:
+                api_response = self._handle_response(response)
+            finally:
+                response.close()
+                self.pool.release(session)
+            self.logger.warning("API stream failed: %s", api_response.error)
+            return ApiStream(status_code=api_response.status_code, headers=response.headers,
+                             error=api_response.error)
+
+        def close(failed: bool) -> None:
+            response.close()
+            self.pool.release(session, discard=failed)
+
+        def cache_items(items) -> None:
+            self.response_cache.put(cache_key, cache_endpoint, ApiResponse(
+                success=True,
+                status_code=response.status_code,
+                data=items,
+                headers=response.headers
+            ), cache_ttl)
+
+        return ApiStream(status_code=response.status_code, headers=response.headers,
+                         chunks=self._iter_chunks(response, url, chunk_size), encoding=response.encoding,
+                         on_close=close, on_complete=cache_items if cache_ttl else None,
+                         collect_limit=STREAM_CACHE_MAX_ITEMS)
+
+    def _iter_chunks(self, response: requests.Response, url: str, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size=chunk_size)
+        except requests.exceptions.Timeout as e:
+            raise ApiException(f"Stream from {url} stalled") from e
         except requests.exceptions.RequestException as e:
-            raise ApiException(f"Request failed: {str(e)}")
+            raise ApiException(f"Stream from {url} was interrupted: {e}") from e
+
+    def iter_items(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Iterator[Any]:
+        """Items of a JSON array endpoint, one at a time; raises ApiException if the request fails."""
+        with self.get_stream(endpoint, params=params, **kwargs) as stream:
+            if not stream.is_success:
+                raise ApiException(stream.error or f"HTTP {stream.status_code}", status_code=stream.status_code)
+            yield from stream.iter_items()
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> ApiResponse:
         return self._make_request('GET', endpoint, params=params, **kwargs)
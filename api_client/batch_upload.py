@@ -0,0 +1,91 @@
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from constants import BATCH_UPLOAD_CONCURRENCY, UPLOAD_MAX_CONCURRENT
+from .base_client import ApiResponse
+from .bulk import BulkOutcome, BulkResult, RateLimiter, run_bulk
+from .user_import import read_user_rows
+
+if TYPE_CHECKING:
+    from .services.document_service import DocumentService
+
+
+def title_from_filename(filename: str) -> str:
+    """``spring_boot-reference.v2.pdf`` -> ``spring boot reference.v2``"""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return re.sub(r'[\s_-]+', ' ', stem).strip() or filename
+
+
+def read_title_mapping(file: BinaryIO, filename: str) -> Dict[str, str]:
+    """``{filename: title}`` from the filename and title columns of a .csv or .xlsx file."""
+    mapping: Dict[str, str] = {}
+    for row in read_user_rows(file, filename):
+        if 'filename' not in row or 'title' not in row:
+            raise ValueError("The mapping file needs filename and title columns")
+        pdf_name = str(row['filename'] or '').strip()
+        title = str(row['title'] or '').strip()
+        if pdf_name and title:
+            mapping[os.path.basename(pdf_name)] = title
+    return mapping
+
+
+@dataclass
+class BatchUploadItem:
+    file: BinaryIO
+    filename: str
+    title: str
+    size: int
+
+    def describe(self) -> Dict[str, Any]:
+        return {'filename': self.filename, 'title': self.title, 'size': self.size}
+
+
+class UploadProgress:
+    """Bytes sent per item, written by the upload threads and read by the script thread."""
+
+    def __init__(self):
+        self._sent: Dict[int, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def callback(self, index: int) -> Callable[[int, int], None]:
+        def report(bytes_sent: int, total_bytes: int) -> None:
+            with self._lock:
+                self._sent[index] = (bytes_sent, total_bytes)
+        return report
+
+    def snapshot(self) -> Dict[int, Tuple[int, int]]:
+        with self._lock:
+            return dict(self._sent)
+
+
+def upload_documents(document_service: 'DocumentService', items: List[BatchUploadItem],
+                     concurrency: int = BATCH_UPLOAD_CONCURRENCY,
+                     progress_callback: Optional[Callable[[int, int, BulkOutcome[BatchUploadItem]], None]] = None,
+                     byte_progress: Optional[Callable[[Dict[int, Tuple[int, int]]], None]] = None
+                     ) -> BulkResult[BatchUploadItem]:
+    """
+    Upload every item through ``upload_pdf_from_buffer``, at most ``concurrency`` at a time
+    (capped at UPLOAD_MAX_CONCURRENT, the process-wide upload limit). A failed file does not
+    stop the others and is not retried automatically, since a multipart upload that failed
+    after reaching the backend may still have created the document; pass the failed items
+    again to retry them. ``byte_progress({item index: (bytes sent, total bytes)})`` is called
+    on the calling thread while uploads run.
+    """
+    progress = UploadProgress()
+    indexes = {id(item): index for index, item in enumerate(items)}
+
+    def upload(item: BatchUploadItem) -> ApiResponse:
+        item.file.seek(0)
+        return document_service.upload_pdf_from_buffer(
+            file_buffer=item.file,
+            secondary_file_name=item.title,
+            filename=item.filename,
+            progress_callback=progress.callback(indexes[id(item)])
+        )
+
+    tick = (lambda: byte_progress(progress.snapshot())) if byte_progress is not None else None
+    return run_bulk(items, upload, concurrency=min(concurrency, UPLOAD_MAX_CONCURRENT),
+                    rate_limiter=RateLimiter(rate=0), progress_callback=progress_callback, tick=tick)
@@ -0,0 +1,156 @@
+import csv
+import io
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, TypeVar
+
+from constants import BULK_MAX_WORKERS, BULK_CONCURRENCY, BULK_RATE_LIMIT, BULK_TICK_INTERVAL
+from .base_client import ApiResponse
+from .request_context import bind_request_context
+
+T = TypeVar('T')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=BULK_MAX_WORKERS, thread_name_prefix="qualifaize-bulk")
+    return _executor
+
+
+class RateLimiter:
+    """Token bucket: on average ``rate`` acquisitions per second, bursts of up to ``burst``."""
+
+    def __init__(self, rate: float = BULK_RATE_LIMIT, burst: int = BULK_CONCURRENCY):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available. A rate of 0 or less never waits."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+@dataclass
+class BulkOutcome(Generic[T]):
+    index: int
+    item: T
+    response: ApiResponse
+
+    @property
+    def success(self) -> bool:
+        return self.response.is_success
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.response.is_success:
+            return None
+        return self.response.error or f"HTTP {self.response.status_code}"
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    outcomes: List[BulkOutcome[T]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[BulkOutcome[T]]:
+        return [outcome for outcome in self.outcomes if outcome.success]
+
+    @property
+    def failed(self) -> List[BulkOutcome[T]]:
+        return [outcome for outcome in self.outcomes if not outcome.success]
+
+    def report_csv(self, describe: Callable[[T], Dict[str, Any]]) -> bytes:
+        """
+        One CSV row per item, in input order: ``describe(item)`` columns followed by the
+        result, HTTP status and error. Calls that never got a response have status 0.
+        """
+        buffer = io.StringIO()
+        writer = None
+        for outcome in self.outcomes:
+            row = dict(describe(outcome.item))
+            row.update({
+                'result': 'ok' if outcome.success else 'failed',
+                'status': outcome.response.status_code,
+                'error': outcome.error or ''
+            })
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+        # utf-8-sig so spreadsheet applications detect the encoding
+        return buffer.getvalue().encode('utf-8-sig')
+
+
+def _call(call: Callable[[T], ApiResponse], item: T, limiter: RateLimiter) -> ApiResponse:
+    limiter.acquire()
+    try:
+        return call(item)
+    except Exception as e:
+        # status_code 0 marks a call that never produced an HTTP response
+        return ApiResponse(success=False, status_code=0, error=str(e))
+
+
+def run_bulk(items: Iterable[T], call: Callable[[T], ApiResponse], concurrency: int = BULK_CONCURRENCY,
+             rate_limiter: Optional[RateLimiter] = None,
+             progress_callback: Optional[Callable[[int, int, BulkOutcome[T]], None]] = None,
+             tick: Optional[Callable[[], None]] = None, tick_interval: float = BULK_TICK_INTERVAL) -> BulkResult[T]:
+    """
+    Apply ``call`` (one service request) to every item, at most ``concurrency`` at a time and no
+    faster than ``rate_limiter`` allows, on a process-wide pool shared by all bulk runs.
+
+    A failing or raising call is recorded and the rest carry on. ``progress_callback(done,
+    total, outcome)`` is called on the calling thread after every call, so it may update
+    Streamlit elements; so is ``tick()``, every ``tick_interval`` seconds while calls run, for
+    progress the calls report from their worker threads. Must be called on the script thread.
+    """
+    pending: Sequence[T] = list(items)
+    limiter = rate_limiter or RateLimiter(burst=concurrency)
+    executor = _get_executor()
+    started = time.monotonic()
+
+    outcomes: List[Optional[BulkOutcome[T]]] = [None] * len(pending)
+    running: Dict[Future, int] = {}
+    next_index = 0
+    done = 0
+
+    while next_index < len(pending) or running:
+        while next_index < len(pending) and len(running) < max(1, concurrency):
+            future = executor.submit(bind_request_context(_call, call, pending[next_index], limiter))
+            running[future] = next_index
+            next_index += 1
+
+        finished, _ = wait(running, timeout=tick_interval if tick is not None else None,
+                           return_when=FIRST_COMPLETED)
+        if tick is not None:
+            tick()
+        for future in finished:
+            index = running.pop(future)
+            outcome = BulkOutcome(index, pending[index], future.result())
+            outcomes[index] = outcome
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, len(pending), outcome)
+
+    return BulkResult(outcomes=outcomes, elapsed=time.monotonic() - started)
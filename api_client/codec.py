@@ -0,0 +1,66 @@
+import json
+from typing import Any, Optional
+
+# Fastest available JSON codec: orjson, then msgspec, then the standard library
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+    JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+
+    def loads(body: bytes) -> Any:
+        return orjson.loads(body)
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = "msgspec"
+        JSON_DECODE_ERRORS = (msgspec.DecodeError,)
+        _decoder = msgspec.json.Decoder()
+        _encoder = msgspec.json.Encoder()
+
+        def loads(body: bytes) -> Any:
+            return _decoder.decode(body)
+
+        def dumps(value: Any) -> bytes:
+            return _encoder.encode(value)
+
+    except ImportError:
+        JSON_BACKEND = "json"
+        JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+        def loads(body: bytes) -> Any:
+            return json.loads(body)
+
+        def dumps(value: Any) -> bytes:
+            return json.dumps(value, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+
+def _decode_text(body: bytes, encoding: Optional[str]) -> str:
+    return body.decode(encoding or 'utf-8', errors='replace')
+
+
+def decode_body(body: bytes, content_type: Optional[str], encoding: Optional[str] = None) -> Any:
+    """
+    Decode a response body according to its Content-Type.
+
+    JSON (``application/json``, ``application/problem+json``...) goes through the fast
+    decoder, ``text/*`` is returned as a string, and anything unlabelled is tried as
+    JSON first and falls back to text, matching the original client behaviour.
+    """
+    if not body:
+        return None
+
+    media_type = (content_type or '').split(';', 1)[0].strip().lower()
+
+    if media_type.startswith('text/'):
+        return _decode_text(body, encoding)
+
+    try:
+        return loads(body)
+    except JSON_DECODE_ERRORS:
+        return _decode_text(body, encoding)
@@ -0,0 +1,146 @@
+import gzip
+import importlib.util
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import requests
+
+
+def _module_available(*names: str) -> bool:
+    return any(importlib.util.find_spec(name) is not None for name in names)
+
+
+# urllib3 decodes br when brotli/brotlicffi is installed and zstd when zstandard is installed
+_DECODERS_AVAILABLE = {
+    'gzip': True,
+    'deflate': True,
+    'br': _module_available('brotli', 'brotlicffi'),
+    'zstd': _module_available('zstandard'),
+}
+
+
+def supported_encodings(preferred: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(encoding for encoding in preferred if _DECODERS_AVAILABLE.get(encoding, False))
+
+
+def accept_encoding_header(preferred: Iterable[str]) -> str:
+    """Accept-Encoding value listing the preferred encodings this process can actually decode, best first."""
+    encodings = supported_encodings(preferred)
+    count = len(encodings)
+    # Descending q-values make the preference order explicit to the server
+    return ', '.join(
+        encoding if index == 0 else f"{encoding};q={(count - index) / count:.1f}"
+        for index, encoding in enumerate(encodings)
+    ) or 'identity'
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6)
+    if encoding == 'deflate':
+        return zlib.compress(body, 6)
+    if encoding == 'br':
+        try:
+            import brotli
+        except ImportError:
+            import brotlicffi as brotli
+        return brotli.compress(body, quality=5)
+    if encoding == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    raise ValueError(f"Unsupported request body encoding: {encoding}")
+
+
+# Backends that answered a compressed request body with 415 Unsupported Media Type
+_uncompressed_backends: Set[str] = set()
+
+
+def request_body_encoding(configured: Optional[str], base_url: Optional[str] = None) -> Optional[str]:
+    """
+    The configured request body encoding if this process can produce it and ``base_url`` has not
+    rejected compressed bodies, else None.
+    """
+    if base_url is not None and base_url in _uncompressed_backends:
+        return None
+    if configured and (configured in ('gzip', 'deflate') or _DECODERS_AVAILABLE.get(configured, False)):
+        return configured
+    return None
+
+
+def reject_request_compression(base_url: str) -> None:
+    """Send only uncompressed request bodies to ``base_url`` for the rest of the process."""
+    _uncompressed_backends.add(base_url)
+
+
+@dataclass
+class TransferStats:
+    request_bytes: Optional[int] = None
+    request_wire_bytes: Optional[int] = None
+    request_encoding: Optional[str] = None
+    response_bytes: int = 0
+    response_wire_bytes: Optional[int] = None
+    response_encoding: Optional[str] = None
+
+    @property
+    def response_ratio(self) -> Optional[float]:
+        if not self.response_bytes or self.response_wire_bytes is None:
+            return None
+        return self.response_wire_bytes / self.response_bytes
+
+
+def response_transfer_stats(response: requests.Response, stats: TransferStats) -> TransferStats:
+    stats.response_bytes = len(response.content) if response.content else 0
+    stats.response_encoding = response.headers.get('Content-Encoding')
+
+    wire_bytes = None
+    tell = getattr(response.raw, 'tell', None)
+    if tell is not None:
+        try:
+            # urllib3 counts the bytes read off the socket, i.e. before decompression
+            wire_bytes = tell()
+        except (OSError, ValueError):
+            wire_bytes = None
+    if not wire_bytes:
+        content_length = response.headers.get('Content-Length')
+        wire_bytes = int(content_length) if content_length and content_length.isdigit() else None
+    if wire_bytes is None and not stats.response_encoding:
+        wire_bytes = stats.response_bytes
+
+    stats.response_wire_bytes = wire_bytes
+    return stats
+
+
+class TransferTotals:
+    """Process-wide uncompressed vs. on-the-wire byte counts per endpoint template."""
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, stats: TransferStats) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(endpoint, {
+                'calls': 0,
+                'request_bytes': 0,
+                'request_wire_bytes': 0,
+                'response_bytes': 0,
+                'response_wire_bytes': 0
+            })
+            totals['calls'] += 1
+            totals['request_bytes'] += stats.request_bytes or 0
+            totals['request_wire_bytes'] += stats.request_wire_bytes or 0
+            totals['response_bytes'] += stats.response_bytes
+            totals['response_wire_bytes'] += stats.response_wire_bytes or 0
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {endpoint: dict(totals) for endpoint, totals in self._totals.items()}
+
+
+_transfer_totals = TransferTotals()
+
+
+def get_transfer_totals() -> TransferTotals:
+    return _transfer_totals
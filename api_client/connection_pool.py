@@ -0,0 +1,227 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, List, Optional, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants import POOL_SIZE, POOL_KEEP_ALIVE, POOL_MAX_IDLE_SECONDS, POOL_ACQUIRE_TIMEOUT
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled session becomes available within the acquire timeout."""
+
+
+@dataclass
+class PoolStats:
+    base_url: str
+    pool_size: int
+    in_use: int
+    idle: int
+    created: int
+    reused: int
+    expired: int
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class _IdleSession:
+    __slots__ = ('session', 'released_at')
+
+    def __init__(self, session: requests.Session, released_at: float):
+        self.session = session
+        self.released_at = released_at
+
+
+class SessionPool:
+    """
+    Thread-safe pool of keep-alive ``requests.Session`` objects for one base URL.
+
+    Each checked-out session is used by exactly one thread at a time, so the TCP
+    connection it holds is reused across Streamlit reruns and sessions instead of
+    being torn down with a per-script ``requests.Session``.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = POOL_SIZE, keep_alive: bool = POOL_KEEP_ALIVE,
+                 max_idle: float = POOL_MAX_IDLE_SECONDS, acquire_timeout: float = POOL_ACQUIRE_TIMEOUT):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.max_idle = max_idle
+        self.acquire_timeout = acquire_timeout
+
+        self._condition = threading.Condition()
+        # Most recently released sessions sit at the end and are handed out first,
+        # which keeps the warmest connections busy and lets cold ones expire.
+        self._idle: List[_IdleSession] = []
+        self._in_use = 0
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+        self._closed = False
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # One connection per session: concurrency is bounded by the pool itself.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        # Sessions are shared by every user of the base URL, so a cookie set on one user's response
+        # (a login session, a load balancer's affinity) must never be sent on another's request
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def _expire_idle(self, now: float) -> List[requests.Session]:
+        expired = [entry for entry in self._idle if now - entry.released_at > self.max_idle]
+        if expired:
+            self._idle = [entry for entry in self._idle if now - entry.released_at <= self.max_idle]
+            self._expired += len(expired)
+        return [entry.session for entry in expired]
+
+    def acquire(self, timeout: Optional[float] = None) -> requests.Session:
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            if self._closed:
+                raise PoolTimeout(f"Connection pool for {self.base_url} is closed")
+
+            stale = self._expire_idle(time.monotonic())
+
+            while not self._idle and self._in_use >= self.pool_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(
+                        f"No connection available to {self.base_url} after {timeout} seconds "
+                        f"(pool size {self.pool_size})"
+                    )
+                self._condition.wait(remaining)
+
+            if self._idle:
+                session = self._idle.pop().session
+                self._reused += 1
+            else:
+                session = None
+                self._created += 1
+
+            self._in_use += 1
+
+        for stale_session in stale:
+            stale_session.close()
+
+        if session is None:
+            try:
+                session = self._create_session()
+            except Exception:
+                with self._condition:
+                    self._in_use -= 1
+                    self._condition.notify()
+                raise
+
+        return session
+
+    def release(self, session: requests.Session, discard: bool = False) -> None:
+        with self._condition:
+            self._in_use -= 1
+            keep = not discard and self.keep_alive and not self._closed
+            if keep:
+                self._idle.append(_IdleSession(session, time.monotonic()))
+            self._condition.notify()
+
+        if not keep:
+            session.close()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[requests.Session]:
+        session = self.acquire(timeout)
+        discard = False
+        try:
+            yield session
+        except requests.exceptions.ConnectionError:
+            # The underlying socket is in an unknown state; don't hand it out again.
+            discard = True
+            raise
+        finally:
+            self.release(session, discard=discard)
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                base_url=self.base_url,
+                pool_size=self.pool_size,
+                in_use=self._in_use,
+                idle=len(self._idle),
+                created=self._created,
+                reused=self._reused,
+                expired=self._expired
+            )
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for entry in idle:
+            entry.session.close()
+
+
+_pools: Dict[str, SessionPool] = {}
+_pools_lock = threading.Lock()
+_pool_defaults = {
+    'pool_size': POOL_SIZE,
+    'keep_alive': POOL_KEEP_ALIVE,
+    'max_idle': POOL_MAX_IDLE_SECONDS,
+    'acquire_timeout': POOL_ACQUIRE_TIMEOUT
+}
+
+
+def configure_connection_pools(**settings) -> None:
+    """
+    Change the settings used for pools created from now on
+    (pool_size, keep_alive, max_idle, acquire_timeout).
+    """
+    unknown = set(settings) - set(_pool_defaults)
+    if unknown:
+        raise ValueError(f"Unknown pool settings: {', '.join(sorted(unknown))}")
+
+    with _pools_lock:
+        _pool_defaults.update(settings)
+
+
+def get_connection_pool(base_url: str) -> SessionPool:
+    """Return the process-wide pool for ``base_url``, creating it on first use."""
+    key = base_url.rstrip('/')
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SessionPool(key, **_pool_defaults)
+            _pools[key] = pool
+        return pool
+
+
+def get_pool_stats() -> List[PoolStats]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
+
+
+def close_all_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from constants import DOCUMENT_CACHE_DIR, DOCUMENT_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Key of a document's table of contents; subsection names are never empty
+_TOC = ''
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    base_url TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    subsection TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (base_url, scope, document_id, subsection)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+
+class DocumentCache:
+    """
+    Persistent cache of document tables of contents and subsection contents, which do not
+    change once a PDF has been processed.
+
+    Bodies are stored once per SHA-256 of their JSON under ``blobs/``, so identical
+    subsections share a file; a SQLite index maps (backend, auth scope, document, subsection)
+    to a digest and records when each entry was last read. Once the blobs exceed ``max_bytes``,
+    least recently read entries are dropped, and with them blobs nothing refers to any more.
+    A hit serves a body without asking the backend, so entries are partitioned by auth scope
+    like the in-memory caches: a user only gets what the backend already gave that user.
+    Disk errors disable the cache for the process instead of failing requests;
+    ``max_bytes`` 0 disables it from the start.
+    """
+
+    def __init__(self, directory: str = DOCUMENT_CACHE_DIR, max_bytes: int = DOCUMENT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = max_bytes <= 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return not self._disabled
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened on first use, so importing the client never touches the disk
+        if self._connection is None:
+            os.makedirs(os.path.join(self.directory, 'blobs'), exist_ok=True)
+            connection = sqlite3.connect(os.path.join(self.directory, 'index.sqlite3'), timeout=30,
+                                         check_same_thread=False, isolation_level=None)
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(entries)")]
+            if columns and 'scope' not in columns:
+                # An index from before entries were partitioned by user; its entries cannot be attributed
+                connection.execute("DROP TABLE entries")
+                shutil.rmtree(os.path.join(self.directory, 'blobs'), ignore_errors=True)
+                os.makedirs(os.path.join(self.directory, 'blobs'), exist_ok=True)
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'blobs', digest[:2], digest)
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning("Document cache in %s disabled: %s", self.directory, error)
+        self._disabled = True
+
+    def get(self, base_url: str, scope: str, document_id: str, subsection: Optional[str] = None) -> Optional[Any]:
+        """The cached body of the table of contents (no subsection) or a subsection, or None."""
+        if self._disabled:
+            return None
+        key = (base_url, scope, document_id, subsection or _TOC)
+        with self._lock:
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT digest FROM entries "
+                    "WHERE base_url = ? AND scope = ? AND document_id = ? AND subsection = ?", key
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                try:
+                    with open(self._blob_path(row[0]), 'rb') as blob:
+                        body = blob.read()
+                    data = json.loads(body)
+                except (FileNotFoundError, ValueError):
+                    # Removed or damaged outside the cache; fetch it again
+                    connection.execute(
+                        "DELETE FROM entries WHERE base_url = ? AND scope = ? AND document_id = ? AND subsection = ?",
+                        key)
+                    self.misses += 1
+                    return None
+                connection.execute(
+                    "UPDATE entries SET accessed_at = ? "
+                    "WHERE base_url = ? AND scope = ? AND document_id = ? AND subsection = ?",
+                    (time.time(),) + key)
+                self.hits += 1
+                return data
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+                return None
+
+    def put(self, base_url: str, scope: str, document_id: str, subsection: Optional[str], data: Any) -> None:
+        if self._disabled or data is None:
+            return
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        if len(body) > self.max_bytes:
+            return
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            try:
+                connection = self._connect()
+                self._write_blob(digest, body)
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (base_url, scope, document_id, subsection, digest, size, "
+                    "accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (base_url, scope, document_id, subsection or _TOC, digest, len(body), time.time()))
+                self._evict(connection)
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+
+    def _write_blob(self, digest: str, body: bytes) -> None:
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written aside and renamed, so a crash or a concurrent reader never sees half a blob
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as blob:
+                blob.write(body)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _stored_bytes(self, connection: sqlite3.Connection) -> int:
+        row = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()
+        return row[0]
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        excess = self._stored_bytes(connection) - self.max_bytes
+        if excess <= 0:
+            return
+        oldest = connection.execute(
+            "SELECT base_url, scope, document_id, subsection, digest FROM entries ORDER BY accessed_at").fetchall()
+        for base_url, scope, document_id, subsection, digest in oldest:
+            connection.execute(
+                "DELETE FROM entries WHERE base_url = ? AND scope = ? AND document_id = ? AND subsection = ?",
+                (base_url, scope, document_id, subsection))
+            self.evictions += 1
+            excess -= self._release_blob(connection, digest)
+            if excess <= 0:
+                break
+
+    def _release_blob(self, connection: sqlite3.Connection, digest: str) -> int:
+        """Delete a blob no entry refers to any more; returns the bytes freed."""
+        if connection.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+            return 0
+        path = self._blob_path(digest)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def invalidate_document(self, base_url: str, document_id: str) -> None:
+        """Drop the table of contents and every subsection of a document, for every auth scope."""
+        if self._disabled:
+            return
+        with self._lock:
+            try:
+                connection = self._connect()
+                digests = [row[0] for row in connection.execute(
+                    "SELECT DISTINCT digest FROM entries WHERE base_url = ? AND document_id = ?",
+                    (base_url, document_id))]
+                connection.execute("DELETE FROM entries WHERE base_url = ? AND document_id = ?",
+                                   (base_url, document_id))
+                for digest in digests:
+                    self._release_blob(connection, digest)
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stored_bytes = 0
+            if not self._disabled:
+                try:
+                    stored_bytes = self._stored_bytes(self._connect())
+                except (OSError, sqlite3.Error) as e:
+                    self._disable(e)
+            return {
+                'enabled': not self._disabled,
+                'stored_bytes': stored_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+_document_cache: Optional[DocumentCache] = None
+_document_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    global _document_cache
+    if _document_cache is None:
+        with _document_cache_lock:
+            if _document_cache is None:
+                _document_cache = DocumentCache()
+    return _document_cache
@@ -0,0 +1,57 @@
+import re
+from typing import List, Tuple
+
+# Known backend routes relative to BACKEND_BASE_PATH. Literal routes are listed before
+# parameterised ones with the same prefix so that e.g. "user/me" is not read as "user/{id}".
+ROUTE_TEMPLATES: List[str] = [
+    "interview",
+    "interview/with-questions",
+    "interview/assigned",
+    "interview/history",
+    "interview/next/{id}",
+    "interview/answer/{id}",
+    "interview/{id}",
+    "user",
+    "user/me",
+    "user/auth/login",
+    "user/auth/register",
+    "user/promote/{id}",
+    "user/{id}",
+    "pdf",
+    "pdf/uploads",
+    "pdf/uploads/{id}",
+    "pdf/uploads/{id}/commit",
+    "pdf/uploads/{id}/parts/{part}",
+    "pdf/{id}",
+    "pdf/{id}/{subsection}",
+]
+
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$'
+)
+
+
+def _compile(template: str) -> Tuple[str, ...]:
+    return tuple(template.split('/'))
+
+
+_COMPILED_ROUTES = [(template, _compile(template)) for template in ROUTE_TEMPLATES]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Map a concrete endpoint such as ``interview/next/42`` to its route template
+    (``interview/next/{id}``) so per-endpoint state and labels stay bounded.
+    """
+    path = endpoint.split('?', 1)[0].strip('/')
+    segments = path.split('/') if path else []
+
+    for template, template_segments in _COMPILED_ROUTES:
+        if len(template_segments) != len(segments):
+            continue
+        if all(expected.startswith('{') or expected == actual
+               for expected, actual in zip(template_segments, segments)):
+            return template
+
+    # Unknown route: keep the shape, drop anything that looks like an identifier
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in segments)
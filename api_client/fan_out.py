@@ -0,0 +1,76 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from constants import FAN_OUT_MAX_WORKERS, FAN_OUT_CALL_TIMEOUT
+from .base_client import ApiResponse
+from .request_context import bind_request_context
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=FAN_OUT_MAX_WORKERS, thread_name_prefix="qualifaize-fan-out")
+    return _executor
+
+
+@dataclass
+class GatherResult:
+    responses: List[ApiResponse]
+    failures: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def all_succeeded(self) -> bool:
+        return not self.failures and all(response.is_success for response in self.responses)
+
+    def __iter__(self) -> Iterator[ApiResponse]:
+        return iter(self.responses)
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __getitem__(self, index: int) -> ApiResponse:
+        return self.responses[index]
+
+
+def _failed_response(message: str) -> ApiResponse:
+    # status_code 0 marks a call that never produced an HTTP response
+    return ApiResponse(success=False, status_code=0, error=message)
+
+
+def gather(*calls: Callable[[], ApiResponse], timeout: float = FAN_OUT_CALL_TIMEOUT) -> GatherResult:
+    """
+    Run independent service calls concurrently and return their responses in argument order.
+
+    Each call is a zero-argument callable such as ``user_service.get_all_users`` or a
+    ``functools.partial``. A call that raises or does not finish within ``timeout``
+    seconds is reported in ``failures`` and gets a failed ApiResponse in its slot,
+    so one slow endpoint cannot fail the others.
+    """
+    executor = _get_executor()
+    started = time.monotonic()
+    futures = [executor.submit(bind_request_context(call)) for call in calls]
+
+    responses: List[ApiResponse] = []
+    failures: Dict[int, str] = {}
+
+    for index, future in enumerate(futures):
+        remaining = max(0.0, timeout - (time.monotonic() - started))
+        try:
+            responses.append(future.result(remaining))
+        except FutureTimeoutError:
+            future.cancel()
+            failures[index] = f"Request timeout after {timeout} seconds"
+            responses.append(_failed_response(failures[index]))
+        except Exception as e:
+            failures[index] = str(e)
+            responses.append(_failed_response(failures[index]))
+
+    return GatherResult(responses=responses, failures=failures)
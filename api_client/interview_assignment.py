@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from constants import BULK_CONCURRENCY
+from .base_client import ApiResponse
+from .bulk import BulkOutcome, BulkResult, RateLimiter, run_bulk
+from .user_import import read_user_rows
+
+if TYPE_CHECKING:
+    from .services.interview_service import InterviewService
+
+
+@dataclass
+class InterviewAssignment:
+    user_id: str
+    username: str
+    scheduled_date: str
+
+    def describe(self) -> Dict[str, Any]:
+        return {'username': self.username, 'userId': self.user_id, 'scheduledDate': self.scheduled_date}
+
+
+def read_usernames(file: BinaryIO, filename: str) -> List[str]:
+    """Usernames from the ``username`` column of a .csv or .xlsx file, in file order without repeats."""
+    usernames: Dict[str, None] = {}
+    for row in read_user_rows(file, filename):
+        if 'username' not in row:
+            raise ValueError("The file has no username column")
+        username = str(row['username'] or '').strip().lstrip('@')
+        if username:
+            usernames[username] = None
+    return list(usernames)
+
+
+def resolve_usernames(usernames: Iterable[str],
+                      users: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, str], List[str]]:
+    """Map usernames (case-insensitively) to user ids; returns the matches and the unknown usernames."""
+    user_ids = {str(user.get('username', '')).lower(): user['userId'] for user in users if user.get('userId')}
+    resolved: Dict[str, str] = {}
+    unknown: List[str] = []
+    for username in usernames:
+        user_id = user_ids.get(username.lower())
+        if user_id is None:
+            unknown.append(username)
+        else:
+            resolved[username] = user_id
+    return resolved, unknown
+
+
+def staggered_assignments(users: Dict[str, str], start: datetime,
+                          interval: timedelta = timedelta(0)) -> List[InterviewAssignment]:
+    """One assignment per ``{username: user_id}``, the n-th scheduled ``n * interval`` after ``start``."""
+    return [InterviewAssignment(user_id=user_id, username=username,
+                                scheduled_date=(start + index * interval).isoformat() + "Z")
+            for index, (username, user_id) in enumerate(users.items())]
+
+
+def assign_interviews(interview_service: 'InterviewService', assignments: List[InterviewAssignment], name: str,
+                      document_id: str, description: Optional[str] = None, difficulty: str = "MEDIUM",
+                      concurrency: int = BULK_CONCURRENCY, rate_limiter: Optional[RateLimiter] = None,
+                      progress_callback: Optional[Callable[[int, int, BulkOutcome[InterviewAssignment]], None]] = None
+                      ) -> BulkResult[InterviewAssignment]:
+    """Create the same interview once per assignment through ``create_interview``."""
+
+    def create(assignment: InterviewAssignment) -> ApiResponse:
+        return interview_service.create_interview(
+            name=name,
+            document_id=document_id,
+            description=description,
+            difficulty=difficulty,
+            assigned_to_user_id=assignment.user_id,
+            scheduled_date=assignment.scheduled_date
+        )
+
+    return run_bulk(assignments, create, concurrency=concurrency, rate_limiter=rate_limiter,
+                    progress_callback=progress_callback)
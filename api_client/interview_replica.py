@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional
+
+from constants import ASSIGNED_SYNC_INTERVAL, ASSIGNED_FULL_SYNC_INTERVAL, ASSIGNED_REPLICA_MAX_USERS
+from .request_context import current_auth_scope
+from .response_cache import get_response_cache
+
+if TYPE_CHECKING:
+    from .services.interview_service import InterviewService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncResult:
+    changed: bool = False
+    error: Optional[str] = None
+
+
+class AssignedInterviewReplica:
+    """
+    Local copy of the interviews assigned to one user, kept current incrementally.
+
+    A sync asks ``interview/assigned?updatedSince=<cursor>`` for the interviews that changed
+    since the newest ``updatedAt`` seen so far and merges them in by ``interviewId``. Changes include
+    status transitions, so reads filtered by status stay correct. Interviews that disappear
+    from the backend (deleted, reassigned) are only noticed by the periodic full sync. A backend
+    that ignores ``updatedSince`` returns items without ``updatedAt``, and every sync is then a
+    full one.
+    """
+
+    def __init__(self, sync_interval: float = ASSIGNED_SYNC_INTERVAL,
+                 full_sync_interval: float = ASSIGNED_FULL_SYNC_INTERVAL):
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self._interviews: Dict[str, Dict[str, Any]] = {}
+        self._cursor: Optional[str] = None
+        self._synced_at: Optional[float] = None
+        self._full_synced_at: Optional[float] = None
+        self._stale = True
+        self._version = 0
+        self._lock = threading.Lock()
+        # One sync at a time per user; concurrent readers keep reading the current copy
+        self._sync_lock = threading.Lock()
+
+    @property
+    def synced(self) -> bool:
+        return self._synced_at is not None
+
+    @property
+    def last_synced_at(self) -> Optional[float]:
+        """Monotonic time of the last successful sync."""
+        return self._synced_at
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented by every sync that changed the interviews. A replica is shared by all the
+        sessions of its user, so each session compares this with the version it last rendered
+        rather than relying on the ``changed`` of its own syncs.
+        """
+        return self._version
+
+    def mark_stale(self) -> None:
+        self._stale = True
+
+    def _due(self, now: float) -> bool:
+        return self._stale or self._synced_at is None or now - self._synced_at >= self.sync_interval
+
+    def sync(self, service: 'InterviewService', force: bool = False) -> SyncResult:
+        """Fetch and apply the changes since the last sync, unless one ran within ``sync_interval``."""
+        with self._sync_lock:
+            now = time.monotonic()
+            if not force and not self._due(now):
+                return SyncResult()
+
+            full = (self._cursor is None or self._full_synced_at is None
+                    or now - self._full_synced_at >= self.full_sync_interval)
+            self._stale = False
+            response = service.get_assigned_interview_changes(None if full else self._cursor)
+            if not response.is_success:
+                self._stale = True
+                return SyncResult(error=response.error or f"HTTP {response.status_code}")
+
+            items = response.data or []
+            incremental = not full and all(item.get('updatedAt') for item in items)
+            changed = self._apply(items, replace=not incremental)
+            self._synced_at = now
+            if not incremental:
+                self._full_synced_at = now
+            return SyncResult(changed=changed)
+
+    def _apply(self, items: List[Dict[str, Any]], replace: bool) -> bool:
+        updated = {item['interviewId']: item for item in items if item.get('interviewId') is not None}
+        cursor = max((item['updatedAt'] for item in items if item.get('updatedAt')), default=None)
+        with self._lock:
+            if replace:
+                changed = updated != self._interviews
+                self._interviews = updated
+            else:
+                changed = any(self._interviews.get(interview_id) != item for interview_id, item in updated.items())
+                self._interviews.update(updated)
+            if changed:
+                self._version += 1
+            if cursor is not None and (self._cursor is None or cursor > self._cursor):
+                self._cursor = cursor
+            elif replace and cursor is None:
+                self._cursor = None
+        return changed
+
+    def interviews(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """The replicated interviews, optionally of one status, by scheduled date."""
+        with self._lock:
+            interviews = [interview for interview in self._interviews.values()
+                          if status is None or interview.get('status') == status]
+        interviews.sort(key=lambda interview: interview.get('scheduledDate') or '')
+        return interviews
+
+
+class ReplicaRegistry:
+    """One replica per auth scope, least recently used ones dropped beyond ``max_users``."""
+
+    def __init__(self, max_users: int = ASSIGNED_REPLICA_MAX_USERS):
+        self.max_users = max_users
+        self._replicas: "OrderedDict[str, AssignedInterviewReplica]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def replica(self, scope: str) -> AssignedInterviewReplica:
+        with self._lock:
+            replica = self._replicas.get(scope)
+            if replica is None:
+                replica = self._replicas[scope] = AssignedInterviewReplica()
+                while len(self._replicas) > self.max_users:
+                    self._replicas.popitem(last=False)
+            self._replicas.move_to_end(scope)
+            return replica
+
+    def mark_all_stale(self) -> None:
+        with self._lock:
+            replicas = list(self._replicas.values())
+        for replica in replicas:
+            replica.mark_stale()
+
+    def _on_invalidation(self, endpoints: FrozenSet[str]) -> None:
+        # Mutations that invalidate assigned interviews (create, status change) may concern any user
+        if "interview/assigned" in endpoints:
+            self.mark_all_stale()
+
+
+_registry = ReplicaRegistry()
+get_response_cache().add_invalidation_listener(_registry._on_invalidation)
+
+
+def get_assigned_interview_replica() -> AssignedInterviewReplica:
+    """Replica of the interviews assigned to the current user."""
+    return _registry.replica(current_auth_scope())
@@ -0,0 +1,350 @@
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import requests
+
+from constants import METRICS_HOST, METRICS_PORT, METRICS_LATENCY_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + '}'
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    samples = Counter.samples
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = METRICS_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last one is +Inf), sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = {key: (list(counts), total[0]) for key, (counts, total) in self._values.items()}
+
+        lines = []
+        bucket_labelnames = self.labelnames + ('le',)
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labelnames, key + (_format_value(bound),))} "
+                             f"{cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_class, name: str, documentation: str, labelnames: Sequence[str], **options):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_class) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} is already registered with a different type or labels")
+                return existing
+            metric = self._metrics[name] = metric_class(name, documentation, labelnames, **options)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = METRICS_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+class ClientMetrics:
+    """
+    API client instruments. ``endpoint`` labels are always route templates
+    (see endpoints.endpoint_template), never concrete paths.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        registry = registry or get_metrics_registry()
+        labels = ('method', 'endpoint')
+        self.requests = registry.counter(
+            'qualifaize_client_requests_total', 'Backend requests by response status', labels + ('status',))
+        self.duration = registry.histogram(
+            'qualifaize_client_request_duration_seconds', 'Backend request latency, per attempt', labels)
+        self.in_flight = registry.gauge(
+            'qualifaize_client_requests_in_flight', 'Backend requests currently waiting for a response', labels)
+        self.request_bytes = registry.counter(
+            'qualifaize_client_request_bytes_total', 'Request body bytes sent on the wire', labels)
+        self.response_bytes = registry.counter(
+            'qualifaize_client_response_bytes_total', 'Response body bytes received on the wire', labels)
+        self.timeouts = registry.counter(
+            'qualifaize_client_timeouts_total', 'Backend requests that timed out', labels)
+        self.exceptions = registry.counter(
+            'qualifaize_client_api_exceptions_total', 'ApiExceptions raised to callers', labels)
+        self.cache_hits = registry.counter(
+            'qualifaize_client_cache_hits_total', 'Requests answered by a client-side cache', labels + ('cache',))
+        self.short_circuits = registry.counter(
+            'qualifaize_client_short_circuits_total', 'Requests failed fast by an open circuit breaker', labels)
+
+    @contextmanager
+    def track_in_flight(self, method: str, endpoint: str) -> Iterator[None]:
+        self.in_flight.inc(method=method, endpoint=endpoint)
+        try:
+            yield
+        finally:
+            self.in_flight.dec(method=method, endpoint=endpoint)
+
+    def observe_response(self, method: str, endpoint: str, seconds: float, status_code: int,
+                         request_bytes: Optional[int] = None, response_bytes: Optional[int] = None) -> None:
+        self.requests.inc(method=method, endpoint=endpoint, status=str(status_code))
+        self.duration.observe(seconds, method=method, endpoint=endpoint)
+        if request_bytes:
+            self.request_bytes.inc(request_bytes, method=method, endpoint=endpoint)
+        if response_bytes:
+            self.response_bytes.inc(response_bytes, method=method, endpoint=endpoint)
+
+    def observe_error(self, method: str, endpoint: str, seconds: float, error: BaseException) -> None:
+        """A request that produced no HTTP response; ``error`` is the ApiException or its cause."""
+        cause = error.__cause__ or error
+        timed_out = isinstance(cause, requests.exceptions.Timeout)
+        self.requests.inc(method=method, endpoint=endpoint, status='timeout' if timed_out else 'error')
+        self.duration.observe(seconds, method=method, endpoint=endpoint)
+        if timed_out:
+            self.timeouts.inc(method=method, endpoint=endpoint)
+
+    def observe_exception(self, method: str, endpoint: str) -> None:
+        self.exceptions.inc(method=method, endpoint=endpoint)
+
+
+_client_metrics: Optional[ClientMetrics] = None
+_client_metrics_lock = threading.Lock()
+
+
+def get_client_metrics() -> ClientMetrics:
+    global _client_metrics
+    if _client_metrics is None:
+        with _client_metrics_lock:
+            if _client_metrics is None:
+                _client_metrics = ClientMetrics()
+    return _client_metrics
+
+
+class PageMetrics:
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        registry = registry or get_metrics_registry()
+        self.runs = registry.counter(
+            'qualifaize_page_script_runs_total', 'Streamlit script runs (reruns) by page and outcome',
+            ('page', 'outcome'))
+        self.duration = registry.histogram(
+            'qualifaize_page_script_duration_seconds', 'Streamlit script run duration by page', ('page',))
+
+    @contextmanager
+    def track_run(self, page: str) -> Iterator[None]:
+        """
+        Time one script run. st.rerun() and st.stop() end a run by raising, so those are
+        recorded as the ``rerun`` and ``stopped`` outcomes rather than errors.
+        """
+        started = time.perf_counter()
+        outcome = 'completed'
+        try:
+            yield
+        except BaseException as e:
+            name = type(e).__name__
+            outcome = 'rerun' if name == 'RerunException' else 'stopped' if name == 'StopException' else 'error'
+            raise
+        finally:
+            self.runs.inc(page=page, outcome=outcome)
+            self.duration.observe(time.perf_counter() - started, page=page)
+
+
+_page_metrics: Optional[PageMetrics] = None
+
+
+def get_page_metrics() -> PageMetrics:
+    global _page_metrics
+    if _page_metrics is None:
+        with _client_metrics_lock:
+            if _page_metrics is None:
+                _page_metrics = PageMetrics()
+    return _page_metrics
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        payload = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = METRICS_PORT, host: str = METRICS_HOST,
+                         registry: Optional[MetricsRegistry] = None) -> Optional[ThreadingHTTPServer]:
+    """
+    Serve ``/metrics`` on a side port from a daemon thread. Safe to call on every script
+    run: only the first call starts a server. A port of 0 or None disables it.
+    """
+    global _server, _server_failed
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None and not _server_failed:
+            handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry or get_metrics_registry()})
+            try:
+                _server = ThreadingHTTPServer((host, port), handler)
+            except OSError as e:
+                # Not retried on later runs; typically another process already owns the port
+                _server_failed = True
+                logger.warning("Metrics server not started on %s:%s: %s", host, port, e)
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="qualifaize-metrics", daemon=True).start()
+            logger.info("Serving Prometheus metrics on http://%s:%d/metrics", host, port)
+        return _server
@@ -0,0 +1,138 @@
+import io
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from constants import UPLOAD_CHUNK_SIZE, UPLOAD_MAX_CONCURRENT, UPLOAD_SLOT_TIMEOUT
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class UploadSlotTimeout(Exception):
+    pass
+
+
+def _quote(value: str) -> str:
+    # Same escaping browsers apply to multipart header parameters
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class _FilePart:
+    __slots__ = ('fileobj', 'remaining')
+
+    def __init__(self, fileobj: BinaryIO):
+        start = fileobj.tell()
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(start)
+        self.fileobj = fileobj
+        self.remaining = end - start
+
+
+class MultipartEncoder:
+    """
+    multipart/form-data body that is produced while it is sent.
+
+    File parts are read from their file objects ``UPLOAD_CHUNK_SIZE`` bytes at a time,
+    so the full body is never assembled in memory. The total length is known up front,
+    which lets requests send a Content-Length instead of chunked encoding.
+    ``progress_callback(bytes_sent, total_bytes)`` is called after every read.
+
+    ``files`` takes the same ``{field: (filename, fileobj_or_bytes, content_type)}`` shape as
+    requests' ``files=``. File objects must be seekable and are read from their current position.
+    """
+
+    def __init__(self, fields: Optional[Mapping[str, Any]] = None,
+                 files: Optional[Mapping[str, Tuple[str, Union[BinaryIO, bytes], str]]] = None,
+                 progress_callback: Optional[ProgressCallback] = None, boundary: Optional[str] = None,
+                 chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, _FilePart]] = []
+
+        for name, value in (fields or {}).items():
+            if value is None:
+                continue
+            self._parts.append(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(str(name))}"\r\n\r\n'
+                .encode('utf-8')
+            )
+            self._parts.append(value if isinstance(value, bytes) else str(value).encode('utf-8'))
+            self._parts.append(b'\r\n')
+
+        for name, (filename, content, file_content_type) in (files or {}).items():
+            self._parts.append(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(str(name))}"; '
+                f'filename="{_quote(filename)}"\r\nContent-Type: {file_content_type}\r\n\r\n'.encode('utf-8')
+            )
+            self._parts.append(content if isinstance(content, bytes) else _FilePart(content))
+            self._parts.append(b'\r\n')
+
+        self._parts.append(f'--{self.boundary}--\r\n'.encode('utf-8'))
+        self._length = sum(part.remaining if isinstance(part, _FilePart) else len(part) for part in self._parts)
+        self._sent = 0
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._sent
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._sent
+
+        output = io.BytesIO()
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, _FilePart):
+                data = part.fileobj.read(min(size, part.remaining))
+                if not data:
+                    raise IOError("Upload file ended before its reported size")
+                part.remaining -= len(data)
+                if not part.remaining:
+                    self._index += 1
+            else:
+                data = part[self._offset:self._offset + size]
+                self._offset += len(data)
+                if self._offset >= len(part):
+                    self._index += 1
+                    self._offset = 0
+            output.write(data)
+            size -= len(data)
+
+        chunk = output.getvalue()
+        if chunk:
+            self._sent += len(chunk)
+            if self.progress_callback is not None:
+                self.progress_callback(self._sent, self._length)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+_upload_slots = threading.BoundedSemaphore(UPLOAD_MAX_CONCURRENT)
+
+
+@contextmanager
+def upload_slot(timeout: float = UPLOAD_SLOT_TIMEOUT) -> Iterator[None]:
+    """Bound the number of uploads in flight across all sessions of the process."""
+    if not _upload_slots.acquire(timeout=timeout):
+        raise UploadSlotTimeout(
+            f"Too many uploads in progress ({UPLOAD_MAX_CONCURRENT}); try again in a moment"
+        )
+    try:
+        yield
+    finally:
+        _upload_slots.release()
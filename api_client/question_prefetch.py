@@ -0,0 +1,109 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Deque, Optional
+
+from constants import INTERVIEW_PREFETCH_DEPTH, PREFETCH_MAX_WORKERS
+from .base_client import ApiResponse
+from .metrics import get_metrics_registry
+from .request_context import bind_request_context
+
+if TYPE_CHECKING:
+    from .services.interview_service import InterviewService
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_prefetch_results = get_metrics_registry().counter(
+    'qualifaize_question_prefetch_total', 'Next-question lookups by prefetch outcome', ('outcome',))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS,
+                                               thread_name_prefix="qualifaize-prefetch")
+    return _executor
+
+
+class QuestionPrefetcher:
+    """
+    Next questions of one interview, requested in the background for one session.
+
+    ``interview/next/{id}`` generates a new question on every call, so questions are only
+    requested once the previous answer has been accepted (``schedule``), at most ``depth``
+    ahead and strictly one after another. ``take`` hands out the oldest one, waiting for it if
+    it is still being generated rather than asking the backend a second time. Deeper queues
+    hide more latency but generate questions before the backend has seen the answers in between.
+    """
+
+    def __init__(self, service: 'InterviewService', interview_id: str, depth: int = INTERVIEW_PREFETCH_DEPTH):
+        self.service = service
+        self.interview_id = interview_id
+        self.depth = depth
+        self._queue: Deque[Future] = deque()
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def schedule(self) -> None:
+        """Top the queue up to ``depth`` questions. Must be called on the script thread."""
+        with self._lock:
+            if self._cancelled:
+                return
+            previous = self._queue[-1] if self._queue else None
+            for _ in range(self.depth - len(self._queue)):
+                previous = _get_executor().submit(bind_request_context(self._fetch, previous))
+                self._queue.append(previous)
+
+    def _fetch(self, previous: Optional[Future]) -> Optional[ApiResponse]:
+        if previous is not None:
+            wait([previous])
+        if self._cancelled:
+            return None
+        return self.service.get_next_question(self.interview_id)
+
+    def ready(self) -> bool:
+        """Whether the next question can be taken without waiting."""
+        with self._lock:
+            return bool(self._queue) and self._queue[0].done()
+
+    def take(self) -> Optional[ApiResponse]:
+        """
+        The oldest prefetched response, or None when nothing was prefetched or the prefetch
+        failed in a way a fresh request might not (connection errors, 5xx); the caller then
+        requests the question itself. Client errors such as "no more questions" are returned.
+        """
+        with self._lock:
+            if self._cancelled or not self._queue:
+                _prefetch_results.inc(outcome='miss')
+                return None
+            future = self._queue.popleft()
+
+        _prefetch_results.inc(outcome='ready' if future.done() else 'waited')
+        try:
+            response = future.result()
+        except Exception as e:
+            logger.warning("Prefetching the next question of interview %s failed: %s", self.interview_id, e)
+            response = None
+
+        if response is None or not (response.is_success or 400 <= response.status_code < 500):
+            _prefetch_results.inc(outcome='discarded')
+            return None
+        return response
+
+    def cancel(self) -> None:
+        """
+        Drop every queued question. Requests that have not started are never sent; one that
+        is already waiting on the backend cannot be recalled and its result is discarded.
+        """
+        with self._lock:
+            self._cancelled = True
+            pending = list(self._queue)
+            self._queue.clear()
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,62 @@
+import contextvars
+import hashlib
+from typing import Callable, Optional, TypeVar
+
+import streamlit as st
+
+T = TypeVar('T')
+
+_UNBOUND = object()
+_bound_auth_token = contextvars.ContextVar('qualifaize_bound_auth_token', default=_UNBOUND)
+
+
+def _session_auth_token() -> Optional[str]:
+    logged_user = st.session_state.get('authenticated_user')
+    if logged_user is not None:
+        return logged_user.get("token")
+    return None
+
+
+def current_auth_token() -> Optional[str]:
+    """
+    Token of the user the current request is made for.
+
+    Inside a callable produced by ``bind_request_context`` this is the token captured
+    on the Streamlit script thread; otherwise it is read from the session state.
+    """
+    token = _bound_auth_token.get()
+    if token is not _UNBOUND:
+        return token
+    return _session_auth_token()
+
+
+def auth_scope(token: Optional[str]) -> str:
+    """Stable, non-reversible identifier of the caller, used to partition client-side caches."""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:32]
+
+
+def current_auth_scope() -> str:
+    return auth_scope(current_auth_token())
+
+
+def bind_request_context(fn: Callable[..., T], *args, **kwargs) -> Callable[[], T]:
+    """
+    Capture everything a request needs from the calling script thread so ``fn`` can
+    run on a worker thread, where ``st.session_state`` is not available.
+
+    Must be called on the script thread; the returned callable may run anywhere.
+    """
+    token = current_auth_token()
+    context = contextvars.copy_context()
+
+    def run() -> T:
+        def call():
+            _bound_auth_token.set(token)
+            return fn(*args, **kwargs)
+
+        # A fresh copy per run so the same bound callable can safely be retried
+        return context.copy().run(call)
+
+    return run
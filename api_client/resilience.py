@@ -0,0 +1,221 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from constants import RETRY_MAX_ATTEMPTS, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX, RETRY_AFTER_MAX, \
+    BREAKER_WINDOW_SIZE, BREAKER_MIN_REQUESTS, BREAKER_FAILURE_RATE, BREAKER_OPEN_SECONDS
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    backoff_base: float = RETRY_BACKOFF_BASE
+    backoff_max: float = RETRY_BACKOFF_MAX
+    # Longest Retry-After we are willing to sleep for; a longer one returns the response as is
+    retry_after_max: float = RETRY_AFTER_MAX
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+    def can_retry(self, method: str, idempotent: Optional[bool]) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given (1-based) failed attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None if the caller should not retry."""
+        if retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.retry_after_max else None
+        return self.backoff(attempt)
+
+    def time_budget(self, attempt_timeout: float, method: str, idempotent: Optional[bool]) -> float:
+        """
+        Longest a call under this policy can take when every attempt uses up ``attempt_timeout``
+        and every retry waits as long as allowed (the larger of the backoff ceiling and the
+        longest Retry-After honoured).
+        """
+        attempts = self.max_attempts if self.can_retry(method, idempotent) else 1
+        waits = sum(max(self.retry_after_max, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+                    for attempt in range(1, attempts))
+        return attempts * attempt_timeout + waits
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding window of recent outcomes.
+
+    CLOSED lets everything through. Once at least ``min_requests`` outcomes are in the
+    window and the failure rate reaches ``failure_rate``, it goes OPEN and rejects calls
+    for ``open_seconds``. After that it is HALF_OPEN: a single probe is let through and
+    its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, name: str, window_size: int = BREAKER_WINDOW_SIZE, min_requests: int = BREAKER_MIN_REQUESTS,
+                 failure_rate: float = BREAKER_FAILURE_RATE, open_seconds: float = BREAKER_OPEN_SECONDS):
+        self.name = name
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self._outcomes = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open(time.monotonic())
+                return
+
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (self._state == self.CLOSED and len(self._outcomes) >= self.min_requests
+                    and failures / len(self._outcomes) >= self.failure_rate):
+                self._open(time.monotonic())
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        self.times_opened += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            outcomes = list(self._outcomes)
+            return {
+                'state': state,
+                'window': len(outcomes),
+                'failures': outcomes.count(False),
+                'times_opened': self.times_opened,
+                'rejected': self.rejected
+            }
+
+
+@dataclass
+class RetryStats:
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    short_circuited: int = 0
+    per_endpoint_retries: Dict[str, int] = field(default_factory=dict)
+
+
+class ResilienceRegistry:
+    """Process-wide circuit breakers, keyed by base URL and endpoint template, plus retry counters."""
+
+    def __init__(self):
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.retry_stats = RetryStats()
+
+    def breaker(self, base_url: str, endpoint: str) -> CircuitBreaker:
+        key = (base_url, endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(f"{base_url} {endpoint}"))
+        return breaker
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self.retry_stats.attempts += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self.retry_stats.retries += 1
+            per_endpoint = self.retry_stats.per_endpoint_retries
+            per_endpoint[endpoint] = per_endpoint.get(endpoint, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.retry_stats.exhausted += 1
+
+    def record_short_circuit(self) -> None:
+        with self._lock:
+            self.retry_stats.short_circuited += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            breakers = dict(self._breakers)
+            retry_stats = {
+                'attempts': self.retry_stats.attempts,
+                'retries': self.retry_stats.retries,
+                'exhausted': self.retry_stats.exhausted,
+                'short_circuited': self.retry_stats.short_circuited,
+                'per_endpoint_retries': dict(self.retry_stats.per_endpoint_retries)
+            }
+        return {
+            'retries': retry_stats,
+            'breakers': {breaker.name: breaker.snapshot() for breaker in breakers.values()}
+        }
+
+
+_resilience = ResilienceRegistry()
+
+
+def get_resilience_registry() -> ResilienceRegistry:
+    return _resilience
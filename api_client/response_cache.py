@@ -0,0 +1,138 @@
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from constants import RESPONSE_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from .base_client import ApiResponse
+
+
+@dataclass
+class _Entry:
+    endpoint: str
+    response: "ApiResponse"
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Process-wide LRU of successful GET responses with a per-entry TTL.
+
+    Entries are keyed by auth scope, URL and params (see ``validator_cache.request_key``)
+    and remember the endpoint they belong to, so a mutation can drop every cached read
+    of that endpoint regardless of who made it.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._invalidation_listeners: List[Callable[[FrozenSet[str]], None]] = []
+
+    def add_invalidation_listener(self, listener: Callable[[FrozenSet[str]], None]) -> None:
+        """Call ``listener(endpoints)`` on every invalidation, e.g. to mark state derived from them stale."""
+        self._invalidation_listeners.append(listener)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional["ApiResponse"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response.as_cached()
+
+    def put(self, key: Tuple[Hashable, ...], endpoint: str, response: "ApiResponse", ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(endpoint=endpoint, response=response, expires_at=time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoints: Iterable[str]) -> int:
+        targets = frozenset(endpoint.strip('/') for endpoint in endpoints)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry.endpoint in targets]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        for listener in self._invalidation_listeners:
+            listener(targets)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    return _response_cache
+
+
+async def _invalidate_when_done(awaitable, cache: ResponseCache, endpoints: Tuple[str, ...]):
+    try:
+        return await awaitable
+    finally:
+        cache.invalidate(endpoints)
+
+
+def invalidates(*endpoints: str):
+    """
+    Mark a service method as a mutation of ``endpoints``: cached reads of them are
+    dropped once the call finishes, whether it succeeded or not. The cache is the
+    service's own ``response_cache``, or the shared one for objects without it.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            cache = getattr(args[0], 'response_cache', None) if args else None
+            if cache is None:
+                cache = _response_cache
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                cache.invalidate(endpoints)
+
+            if inspect.isawaitable(result):
+                # Async services: the request has not run yet, invalidate again after it has
+                return _invalidate_when_done(result, cache, endpoints)
+            return result
+
+        return wrapper
+
+    return decorator
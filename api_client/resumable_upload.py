@@ -0,0 +1,246 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, BinaryIO, Optional, Set, Tuple
+
+from constants import UPLOAD_PART_SIZE, UPLOAD_PARALLEL_PARTS, UPLOAD_PART_ROUNDS, UPLOAD_MANIFEST_DIR
+from .base_client import ApiResponse
+from .multipart import ProgressCallback
+from .request_context import bind_request_context, current_auth_scope
+
+if TYPE_CHECKING:
+    from .services.document_service import DocumentService
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+# Statuses of the session-opening call that mean the backend does not implement the protocol
+_UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+
+_unsupported_backends: Set[str] = set()
+
+
+class ResumableUploadUnsupported(Exception):
+    pass
+
+
+def resumable_uploads_supported(base_url: str) -> bool:
+    return base_url not in _unsupported_backends
+
+
+def file_sha256(file_buffer: BinaryIO) -> str:
+    """SHA-256 of a seekable buffer from its current position; the position is restored afterwards."""
+    start = file_buffer.tell()
+    digest = hashlib.sha256()
+    for block in iter(lambda: file_buffer.read(_HASH_BLOCK_SIZE), b''):
+        digest.update(block)
+    file_buffer.seek(start)
+    return digest.hexdigest()
+
+
+@dataclass
+class UploadManifest:
+    upload_id: str
+    sha256: str
+    size: int
+    part_size: int
+    total_parts: int
+    filename: str
+    secondary_file_name: str
+
+
+class ManifestStore:
+    """
+    Unfinished uploads, one JSON file per (user, file content, title). Lets a failed or
+    interrupted upload of the same file continue from the parts the backend already has.
+    """
+
+    def __init__(self, directory: str = UPLOAD_MANIFEST_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(scope: str, sha256: str, secondary_file_name: str) -> str:
+        return hashlib.sha256(f"{scope}:{sha256}:{secondary_file_name}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[UploadManifest]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as manifest_file:
+                return UploadManifest(**json.load(manifest_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Ignoring unreadable upload manifest %s: %s", key, e)
+            return None
+
+    def save(self, key: str, manifest: UploadManifest) -> None:
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temporary_path = f"{self._path(key)}.tmp"
+                with open(temporary_path, 'w', encoding='utf-8') as manifest_file:
+                    json.dump(asdict(manifest), manifest_file)
+                os.replace(temporary_path, self._path(key))
+            except OSError as e:
+                # Without a manifest the upload still works, it just cannot be resumed
+                logger.warning("Could not save upload manifest %s: %s", key, e)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not delete upload manifest %s: %s", key, e)
+
+
+_manifest_store = ManifestStore()
+
+
+def get_manifest_store() -> ManifestStore:
+    return _manifest_store
+
+
+class ResumableUpload:
+    """
+    One file uploaded through the chunked protocol:
+
+    1. ``POST pdf/uploads`` opens an upload session (or an existing one is resumed from its manifest),
+    2. ``PUT pdf/uploads/{id}/parts/{n}`` sends the missing parts, up to ``parallel_parts`` at a time,
+    3. parts that failed are sent again, up to ``rounds`` passes in total,
+    4. ``POST pdf/uploads/{id}/commit`` assembles the document and returns it like a regular upload.
+
+    Progress is reported per acknowledged part, always on the calling thread.
+    """
+
+    def __init__(self, service: 'DocumentService', file_buffer: BinaryIO, secondary_file_name: str, filename: str,
+                 progress_callback: Optional[ProgressCallback] = None, part_size: int = UPLOAD_PART_SIZE,
+                 parallel_parts: int = UPLOAD_PARALLEL_PARTS, rounds: int = UPLOAD_PART_ROUNDS,
+                 manifest_store: Optional[ManifestStore] = None):
+        self.service = service
+        self.file_buffer = file_buffer
+        self.secondary_file_name = secondary_file_name
+        self.filename = filename
+        self.progress_callback = progress_callback
+        self.part_size = part_size
+        self.parallel_parts = parallel_parts
+        self.rounds = rounds
+        self.manifest_store = manifest_store or get_manifest_store()
+        self._start = file_buffer.tell()
+        self._size = file_buffer.seek(0, os.SEEK_END) - self._start
+        file_buffer.seek(self._start)
+        self._read_lock = threading.Lock()
+
+    def _read_part(self, part_number: int, part_size: int) -> bytes:
+        with self._read_lock:
+            self.file_buffer.seek(self._start + (part_number - 1) * part_size)
+            return self.file_buffer.read(part_size)
+
+    def _part_length(self, manifest: UploadManifest, part_number: int) -> int:
+        return min(manifest.part_size, manifest.size - (part_number - 1) * manifest.part_size)
+
+    def _upload_part(self, manifest: UploadManifest, part_number: int) -> ApiResponse:
+        data = self._read_part(part_number, manifest.part_size)
+        return self.service.upload_part(manifest.upload_id, part_number, data, hashlib.sha256(data).hexdigest())
+
+    def _open_session(self, manifest_key: str,
+                      sha256: str) -> Tuple[Optional[UploadManifest], Set[int], Optional[ApiResponse]]:
+        """Resume the session recorded in the manifest if the backend still has it, else start a new one."""
+        manifest = self.manifest_store.load(manifest_key)
+        if manifest is not None:
+            status = self.service.get_upload_status(manifest.upload_id)
+            if status.is_success and isinstance(status.data, dict):
+                received = {int(part) for part in status.data.get('receivedParts', [])}
+                logger.info("Resuming upload %s with %d of %d parts already received", manifest.upload_id,
+                            len(received), manifest.total_parts)
+                return manifest, received, None
+            self.manifest_store.delete(manifest_key)
+
+        response = self.service.create_upload(self.filename, self.secondary_file_name, self._size, self.part_size,
+                                              sha256)
+        if response.status_code in _UNSUPPORTED_STATUSES:
+            # Remembered for the process so later uploads go straight to multipart
+            _unsupported_backends.add(self.service.base_url)
+            raise ResumableUploadUnsupported(f"{self.service.base_url} has no resumable upload endpoint")
+        if not response.is_success:
+            return None, set(), response
+
+        session = response.data or {}
+        part_size = int(session.get('partSize', self.part_size))
+        manifest = UploadManifest(
+            upload_id=str(session['uploadId']),
+            sha256=sha256,
+            size=self._size,
+            part_size=part_size,
+            total_parts=int(session.get('totalParts', max(1, -(-self._size // part_size)))),
+            filename=self.filename,
+            secondary_file_name=self.secondary_file_name
+        )
+        self.manifest_store.save(manifest_key, manifest)
+        return manifest, {int(part) for part in session.get('receivedParts', [])}, None
+
+    def run(self) -> ApiResponse:
+        sha256 = file_sha256(self.file_buffer)
+        manifest_key = ManifestStore.key(current_auth_scope(), sha256, self.secondary_file_name)
+
+        manifest, received, failure = self._open_session(manifest_key, sha256)
+        if manifest is None:
+            return failure
+
+        sent_bytes = sum(self._part_length(manifest, part) for part in received)
+        self._report(sent_bytes)
+
+        missing: Set[int] = set(range(1, manifest.total_parts + 1)) - received
+        last_failure: Optional[ApiResponse] = None
+        with ThreadPoolExecutor(max_workers=self.parallel_parts, thread_name_prefix="qualifaize-upload") as executor:
+            for _ in range(self.rounds):
+                if not missing:
+                    break
+                futures = {
+                    executor.submit(bind_request_context(self._upload_part, manifest, part)): part
+                    for part in sorted(missing)
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        part = futures[future]
+                        try:
+                            response = future.result()
+                        except Exception as e:
+                            response = ApiResponse(success=False, status_code=0, error=str(e))
+                        if response.is_success:
+                            missing.discard(part)
+                            sent_bytes += self._part_length(manifest, part)
+                            self._report(sent_bytes)
+                        else:
+                            last_failure = response
+                            logger.warning("Part %d of upload %s failed: %s", part, manifest.upload_id,
+                                           response.error)
+
+        if missing:
+            return ApiResponse(
+                success=False,
+                status_code=last_failure.status_code if last_failure is not None else 0,
+                error=f"{len(missing)} of {manifest.total_parts} parts could not be uploaded "
+                      f"({last_failure.error if last_failure is not None else 'unknown error'}); "
+                      f"upload the same file again to resume"
+            )
+
+        response = self.service.commit_upload(manifest.upload_id, manifest.sha256)
+        if response.is_success or 400 <= response.status_code < 500:
+            # Committed, or rejected for good (e.g. checksum mismatch); either way there is nothing to resume
+            self.manifest_store.delete(manifest_key)
+        return response
+
+    def _report(self, sent_bytes: int) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(sent_bytes, self._size)
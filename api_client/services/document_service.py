@@ -1,29 +1,75 @@
-from typing import Optional, BinaryIO
-from ..base_client import BaseApiClient, ApiResponse
+import os
+from typing import Optional, BinaryIO, Awaitable, Sequence
+
+from constants import CACHE_TTL_DOCUMENTS, RESUMABLE_UPLOAD_THRESHOLD
+from ..async_client import AsyncBaseApiClient
+from ..base_client import BaseApiClient, ApiResponse, ApiException
+from ..disk_cache import DocumentCache, get_document_cache
+from ..endpoints import endpoint_template
+from ..multipart import ProgressCallback, UploadSlotTimeout, upload_slot
+from ..request_context import current_auth_scope
+from ..response_cache import invalidates
+from ..resumable_upload import ResumableUpload, ResumableUploadUnsupported, resumable_uploads_supported
+from ..streaming import ApiStream
+from ..subsection_prefetch import SubsectionPrefetcher
 
 
 class DocumentService(BaseApiClient):
-    def __init__(self, auth_token: Optional[str] = None, **kwargs):
+    cache_policies = {"pdf": CACHE_TTL_DOCUMENTS}
+    # Files at least this large go through the chunked upload protocol; None always uses multipart
+    resumable_upload_threshold: Optional[int] = RESUMABLE_UPLOAD_THRESHOLD
+
+    def __init__(self, auth_token: Optional[str] = None, document_cache: Optional[DocumentCache] = None, **kwargs):
         super().__init__(auth_token=auth_token, **kwargs)
         self.base_endpoint = "pdf"
+        self.document_cache = document_cache or get_document_cache()
 
-    def upload_pdf(self, file_path: str, secondary_file_name: str) -> ApiResponse:
+    def upload_pdf(self, file_path: str, secondary_file_name: str,
+                   progress_callback: Optional[ProgressCallback] = None) -> ApiResponse:
         try:
             with open(file_path, 'rb') as file:
-                return self.upload_pdf_from_buffer(file, secondary_file_name, file_path)
+                return self.upload_pdf_from_buffer(file, secondary_file_name, file_path, progress_callback)
         except FileNotFoundError:
-            from ..base_client import ApiException
             raise ApiException(f"File not found: {file_path}")
 
+    @invalidates("pdf")
     def upload_pdf_from_buffer(
             self,
             file_buffer: BinaryIO,
             secondary_file_name: str,
-            filename: str = "document.pdf"
+            filename: str = "document.pdf",
+            progress_callback: Optional[ProgressCallback] = None
     ) -> ApiResponse:
         """
         Upload PDF from a file buffer (like Streamlit UploadedFile)
+
+        The file is streamed from the buffer's current position in chunks, and
+        ``progress_callback(bytes_sent, total_bytes)`` is called as it goes. Files of at
+        least ``resumable_upload_threshold`` bytes use the resumable protocol when the
+        backend supports it, and fall back to a single multipart request otherwise.
         """
+        try:
+            with upload_slot():
+                if self._use_resumable_upload(file_buffer):
+                    try:
+                        return ResumableUpload(self, file_buffer, secondary_file_name, filename,
+                                               progress_callback).run()
+                    except ResumableUploadUnsupported as e:
+                        self.logger.info("%s; falling back to a multipart upload", e)
+                return self._upload_multipart(file_buffer, secondary_file_name, filename, progress_callback)
+        except UploadSlotTimeout as e:
+            raise ApiException(str(e)) from e
+
+    def _use_resumable_upload(self, file_buffer: BinaryIO) -> bool:
+        if self.resumable_upload_threshold is None or not resumable_uploads_supported(self.base_url):
+            return False
+        position = file_buffer.tell()
+        size = file_buffer.seek(0, os.SEEK_END) - position
+        file_buffer.seek(position)
+        return size >= self.resumable_upload_threshold
+
+    def _upload_multipart(self, file_buffer: BinaryIO, secondary_file_name: str, filename: str,
+                          progress_callback: Optional[ProgressCallback]) -> ApiResponse:
         # Prepare the multipart form data
         files = {
             'file': (filename, file_buffer, 'application/pdf')
@@ -35,20 +81,118 @@ class DocumentService(BaseApiClient):
         }
 
         # Use the base client's _make_request with files parameter
-        return self._make_request('POST', self.base_endpoint, data=form_data, files=files)
+        return self._make_request('POST', self.base_endpoint, data=form_data, files=files, timeout_profile="upload",
+                                  progress_callback=progress_callback)
+
+    def create_upload(self, filename: str, secondary_file_name: str, size: int, part_size: int,
+                      sha256: str) -> ApiResponse:
+        upload_data = {
+            "filename": filename,
+            "secondaryFileName": secondary_file_name,
+            "size": size,
+            "partSize": part_size,
+            "sha256": sha256
+        }
+        return self.post(f"{self.base_endpoint}/uploads", data=upload_data, timeout_profile="fast")
+
+    def upload_part(self, upload_id: str, part_number: int, data: bytes, sha256: str) -> ApiResponse:
+        # PUT of a numbered part is idempotent, so the client retries it on connection errors and 5xx
+        return self._make_request('PUT', f"{self.base_endpoint}/uploads/{upload_id}/parts/{part_number}",
+                                  content=data, headers={"X-Content-SHA256": sha256}, timeout_profile="upload")
+
+    def get_upload_status(self, upload_id: str) -> ApiResponse:
+        return self.get(f"{self.base_endpoint}/uploads/{upload_id}", timeout_profile="fast")
+
+    def commit_upload(self, upload_id: str, sha256: str) -> ApiResponse:
+        return self.post(f"{self.base_endpoint}/uploads/{upload_id}/commit", data={"sha256": sha256},
+                         timeout_profile="upload")
+
+    def abort_upload(self, upload_id: str) -> ApiResponse:
+        return self.delete(f"{self.base_endpoint}/uploads/{upload_id}", timeout_profile="fast")
 
     def get_all_documents(self) -> ApiResponse:
-        return self.get(self.base_endpoint)
+        return self.get(self.base_endpoint, timeout_profile="default")
+
+    def stream_all_documents(self) -> ApiStream:
+        return self.get_stream(self.base_endpoint, timeout_profile="default")
 
     def get_document_with_toc(self, document_id: str) -> ApiResponse:
-        return self.get(f"{self.base_endpoint}/{document_id}")
+        return self._get_cached_document(f"{self.base_endpoint}/{document_id}", document_id)
 
     def get_document_content(self, document_id: str, subsection_name: str) -> ApiResponse:
-        return self.get(f"{self.base_endpoint}/{document_id}/{subsection_name}")
+        return self._get_cached_document(f"{self.base_endpoint}/{document_id}/{subsection_name}", document_id,
+                                         subsection_name)
+
+    def prefetch_subsections(self, document_id: str, subsection_names: Sequence[str],
+                             focus: Optional[str] = None) -> SubsectionPrefetcher:
+        """
+        Start fetching the contents of ``subsection_names`` (in table of contents order) in the
+        background, nearest to ``focus`` first. Read them through the returned prefetcher's
+        ``get`` and ``cancel`` it when the document is closed.
+        """
+        prefetcher = SubsectionPrefetcher(self, document_id, subsection_names)
+        prefetcher.start(focus)
+        return prefetcher
+
+    def _get_cached_document(self, endpoint: str, document_id: str,
+                             subsection_name: Optional[str] = None) -> ApiResponse:
+        """GET a table of contents or subsection through the on-disk document cache, in the caller's auth scope."""
+        scope = current_auth_scope()
+        data = self.document_cache.get(self.base_url, scope, document_id, subsection_name)
+        if data is not None:
+            self.metrics.cache_hits.inc(method='GET', endpoint=endpoint_template(endpoint), cache='disk')
+            return ApiResponse(success=True, status_code=200, data=data, from_cache=True)
 
+        response = self.get(endpoint, timeout_profile="default")
+        # Only complete representations; e.g. 202 while the PDF is still being processed is not stored
+        if response.status_code == 200:
+            self.document_cache.put(self.base_url, scope, document_id, subsection_name, response.data)
+        return response
+
+    @invalidates("pdf")
     def update_document_title(self, document_id: str, new_title: str) -> ApiResponse:
         params = {"title": new_title}
-        return self.patch(f"{self.base_endpoint}/{document_id}", params=params)
+        try:
+            return self.patch(f"{self.base_endpoint}/{document_id}", params=params, timeout_profile="fast")
+        finally:
+            self.document_cache.invalidate_document(self.base_url, document_id)
 
+    @invalidates("pdf")
     def delete_document(self, document_id: str) -> ApiResponse:
-        return self.delete(f"{self.base_endpoint}/{document_id}")
\ No newline at end of file
+        try:
+            return self.delete(f"{self.base_endpoint}/{document_id}", timeout_profile="fast")
+        finally:
+            self.document_cache.invalidate_document(self.base_url, document_id)
+
+
+class AsyncDocumentService(DocumentService, AsyncBaseApiClient):
+    """DocumentService whose methods return awaitables instead of ApiResponse"""
+
+    def upload_pdf(self, file_path: str, secondary_file_name: str,
+                   progress_callback: Optional[ProgressCallback] = None) -> Awaitable[ApiResponse]:
+        # Runs entirely on the executor so the file stays open until the upload finishes
+        return self.run_blocking(DocumentService.upload_pdf, self, file_path, secondary_file_name, progress_callback)
+
+    def upload_pdf_from_buffer(
+            self,
+            file_buffer: BinaryIO,
+            secondary_file_name: str,
+            filename: str = "document.pdf",
+            progress_callback: Optional[ProgressCallback] = None
+    ) -> Awaitable[ApiResponse]:
+        return self.run_blocking(DocumentService.upload_pdf_from_buffer, self, file_buffer, secondary_file_name,
+                                 filename, progress_callback)
+
+    # The document cache reads and writes files, and must be invalidated after the request rather than before
+
+    def get_document_with_toc(self, document_id: str) -> Awaitable[ApiResponse]:
+        return self.run_blocking(DocumentService.get_document_with_toc, self, document_id)
+
+    def get_document_content(self, document_id: str, subsection_name: str) -> Awaitable[ApiResponse]:
+        return self.run_blocking(DocumentService.get_document_content, self, document_id, subsection_name)
+
+    def update_document_title(self, document_id: str, new_title: str) -> Awaitable[ApiResponse]:
+        return self.run_blocking(DocumentService.update_document_title, self, document_id, new_title)
+
+    def delete_document(self, document_id: str) -> Awaitable[ApiResponse]:
+        return self.run_blocking(DocumentService.delete_document, self, document_id)
@@ -1,12 +1,47 @@
-from typing import Optional
+from typing import Any, Awaitable, Dict, Optional, Sequence
+from constants import CACHE_TTL_ASSIGNED_INTERVIEWS, CACHE_TTL_INTERVIEW_HISTORY, HISTORY_PAGE_SIZE, \
+    INTERVIEW_HISTORY_ENDPOINT
+from ..async_client import AsyncBaseApiClient
 from ..base_client import BaseApiClient, ApiResponse
+from ..response_cache import invalidates
+from ..streaming import ApiStream
+
+HISTORY_STATUSES = ("COMPLETED", "CANCELLED")
+# Statuses of the interview/history probe that mean the backend does not implement it. Backends
+# without it route the path to the interview/{id} status change, which answers 400
+_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 501})
+
+# Probe results per backend URL; a backend missing here has not been probed yet
+_history_endpoint_support: Dict[str, bool] = {}
+
+
+def _is_history_page(response: ApiResponse) -> bool:
+    return response.is_success and isinstance(response.data, dict) and isinstance(response.data.get('content'), list)
+
+
+def interview_summary(interview: Dict[str, Any]) -> Dict[str, Any]:
+    """An interview as interview/history returns it: no questions, only their counts."""
+    questions = interview.get('questions') or []
+    summary = {key: value for key, value in interview.items() if key not in ('questions', 'candidateReview')}
+    summary['questionCount'] = len(questions)
+    summary['answeredCount'] = sum(1 for q in questions if q.get('submittedAnswer') is not None)
+    summary['correctCount'] = sum(1 for q in questions if q.get('isCorrect') is True)
+    summary['hasReview'] = bool((interview.get('candidateReview') or '').strip())
+    return summary
 
 
 class InterviewService(BaseApiClient):
+    cache_policies = {
+        "interview/assigned": CACHE_TTL_ASSIGNED_INTERVIEWS,
+        "interview/history": CACHE_TTL_INTERVIEW_HISTORY,
+        "interview/with-questions": CACHE_TTL_INTERVIEW_HISTORY
+    }
+
     def __init__(self, auth_token: Optional[str] = None, **kwargs):
         super().__init__(auth_token=auth_token, **kwargs)
         self.base_endpoint = "interview"
 
+    @invalidates("interview/assigned")
     def create_interview(
             self,
             name: str,
@@ -29,29 +64,121 @@ class InterviewService(BaseApiClient):
         if scheduled_date:
             interview_data["scheduledDate"] = scheduled_date
 
-        return self.post(self.base_endpoint, data=interview_data)
+        return self.post(self.base_endpoint, data=interview_data, timeout_profile="default")
 
+    @invalidates("interview/assigned", "interview/history", "interview/with-questions")
     def change_interview_status(self, interview_id: str, new_status: str) -> ApiResponse:
+        # A status change over GET; not to be coalesced or revalidated like a read
         params = {"newStatus": new_status}
-        return self.get(f"{self.base_endpoint}/{interview_id}", params=params)
+        return self.get(f"{self.base_endpoint}/{interview_id}", params=params, idempotent=False,
+                        timeout_profile="fast")
 
     def get_interviews_with_questions(self, interview_id: Optional[str] = None) -> ApiResponse:
         if interview_id:
             params = {"interviewId": interview_id}
-            return self.get(f"{self.base_endpoint}/with-questions", params=params)
+            return self.get(f"{self.base_endpoint}/with-questions", params=params, timeout_profile="default")
         else:
-            return self.get(f"{self.base_endpoint}/with-questions")
+            return self.get(f"{self.base_endpoint}/with-questions", timeout_profile="default")
+
+    def stream_interviews_with_questions(self) -> ApiStream:
+        return self.get_stream(f"{self.base_endpoint}/with-questions", timeout_profile="default")
+
+    def get_interview_history(self, page: int = 0, size: int = HISTORY_PAGE_SIZE,
+                              statuses: Sequence[str] = HISTORY_STATUSES) -> ApiResponse:
+        """
+        One page of the caller's interview history, newest first, as summaries without questions
+        (``questionCount``, ``answeredCount``, ``correctCount``, ``hasReview`` instead). The data is
+        ``{"content": [...], "page", "size", "totalElements", "totalPages"}``. Backends without
+        ``interview/history`` are emulated from the full with-questions list, in linear time.
+
+        Whether the backend has the endpoint comes from INTERVIEW_HISTORY_ENDPOINT, or in "auto"
+        mode from the first call per backend: a page-shaped answer means it does, an answer in
+        ``_UNSUPPORTED_STATUSES`` or any other successful answer means it does not. Other failures
+        are returned without deciding, so the next call probes again.
+        """
+        supported = self.history_endpoint_supported()
+        if supported is False:
+            return self._emulate_history_page(page, size, statuses)
+
+        params = {"page": page, "size": size, "status": list(statuses)}
+        response = self.get(f"{self.base_endpoint}/history", params=params, timeout_profile="fast")
+        if supported is True:
+            return response
+        if _is_history_page(response):
+            _history_endpoint_support[self.base_url] = True
+            return response
+        if not response.is_success and response.status_code not in _UNSUPPORTED_STATUSES:
+            return response
+        # Remembered for the process so later pages go straight to the emulation
+        _history_endpoint_support[self.base_url] = False
+        self.logger.info("%s has no interview/history endpoint (HTTP %s); paging the full list instead",
+                         self.base_url, response.status_code)
+        return self._emulate_history_page(page, size, statuses)
+
+    def history_endpoint_supported(self) -> Optional[bool]:
+        """True or False when configured or already probed for this backend, None before the first probe."""
+        if INTERVIEW_HISTORY_ENDPOINT in ("on", "off"):
+            return INTERVIEW_HISTORY_ENDPOINT == "on"
+        return _history_endpoint_support.get(self.base_url)
+
+    def _emulate_history_page(self, page: int, size: int, statuses: Sequence[str]) -> ApiResponse:
+        with self.stream_interviews_with_questions() as stream:
+            if not stream.is_success:
+                return ApiResponse(success=False, status_code=stream.status_code, error=stream.error)
+            history = [interview_summary(interview) for interview in stream.iter_items()
+                       if interview.get('status') in statuses]
+
+        history.sort(key=lambda interview: interview.get('scheduledDate') or '', reverse=True)
+        start = page * size
+        return ApiResponse(success=True, status_code=stream.status_code, data={
+            "content": history[start:start + size],
+            "page": page,
+            "size": size,
+            "totalElements": len(history),
+            "totalPages": -(-len(history) // size) if size else 0
+        })
+
+    def get_interview_details(self, interview_id: str) -> ApiResponse:
+        """One interview with its questions; the data is the interview itself, or None if it is not found."""
+        response = self.get_interviews_with_questions(interview_id)
+        if response.is_success and isinstance(response.data, list):
+            return ApiResponse(success=True, status_code=response.status_code,
+                               data=response.data[0] if response.data else None)
+        return response
 
     def get_next_question(self, interview_id: str) -> ApiResponse:
-        return self.get(f"{self.base_endpoint}/next/{interview_id}")
+        # Generates a new question on every call
+        return self.get(f"{self.base_endpoint}/next/{interview_id}", idempotent=False, timeout_profile="generation")
 
     def get_assigned_interviews(self, status: Optional[str] = None) -> ApiResponse:
         if status:
             params = {"status": status}
-            return self.get(f"{self.base_endpoint}/assigned", params=params)
+            return self.get(f"{self.base_endpoint}/assigned", params=params, timeout_profile="fast")
         else:
-            return self.get(f"{self.base_endpoint}/assigned")
+            return self.get(f"{self.base_endpoint}/assigned", timeout_profile="fast")
 
+    def get_assigned_interview_changes(self, updated_since: Optional[str] = None) -> ApiResponse:
+        """
+        Assigned interviews of every status changed after ``updated_since`` (an ``updatedAt``
+        value), or all of them without it. Backends that do not know ``updatedSince`` ignore it and
+        return the full list.
+        """
+        params = {"updatedSince": updated_since} if updated_since else None
+        return self.get(f"{self.base_endpoint}/assigned", params=params, timeout_profile="fast")
+
+    @invalidates("interview/history", "interview/with-questions")
     def submit_answer(self, question_id: str, answer: str) -> ApiResponse:
         params = {"correctAnswer": answer.upper()}
-        return self.get(f"{self.base_endpoint}/answer/{question_id}", params=params)
\ No newline at end of file
+        return self.get(f"{self.base_endpoint}/answer/{question_id}", params=params, idempotent=False,
+                        timeout_profile="default")
+
+
+class AsyncInterviewService(InterviewService, AsyncBaseApiClient):
+    """InterviewService whose methods return awaitables instead of ApiResponse"""
+
+    def get_interview_history(self, page: int = 0, size: int = HISTORY_PAGE_SIZE,
+                              statuses: Sequence[str] = HISTORY_STATUSES) -> Awaitable[ApiResponse]:
+        return self.run_blocking(InterviewService.get_interview_history, self, page, size, statuses)
+
+    def get_interview_details(self, interview_id: str) -> Awaitable[ApiResponse]:
+        return self.run_blocking(InterviewService.get_interview_details, self, interview_id)
@@ -1,18 +1,31 @@
 from typing import Optional, List
+from constants import CACHE_TTL_USERS, CACHE_TTL_CURRENT_USER
+from ..async_client import AsyncBaseApiClient
 from ..base_client import BaseApiClient, ApiResponse
+from ..response_cache import invalidates
+from ..streaming import ApiStream
 
 
 class UserService(BaseApiClient):
+    cache_policies = {
+        "user": CACHE_TTL_USERS,
+        "user/me": CACHE_TTL_CURRENT_USER
+    }
+
     def __init__(self, auth_token: Optional[str] = None, **kwargs):
         super().__init__(auth_token=auth_token, **kwargs)
         self.base_endpoint = "user"
 
     def get_all_users(self) -> ApiResponse:
-        return self.get(f"{self.base_endpoint}")
+        return self.get(f"{self.base_endpoint}", timeout_profile="default")
+
+    def stream_all_users(self) -> ApiStream:
+        return self.get_stream(f"{self.base_endpoint}", timeout_profile="default")
 
     def get_current_user_details(self) -> ApiResponse:
-        return self.get(f"{self.base_endpoint}/me")
+        return self.get(f"{self.base_endpoint}/me", timeout_profile="fast")
 
+    @invalidates("user", "user/me")
     def update_user_details(
             self,
             user_id: str,
@@ -35,19 +48,21 @@ class UserService(BaseApiClient):
         if birth_date is not None:
             update_data["birthDate"] = birth_date
 
-        return self.put(f"{self.base_endpoint}/{user_id}", data=update_data)
+        return self.put(f"{self.base_endpoint}/{user_id}", data=update_data, timeout_profile="fast")
 
+    @invalidates("user", "user/me")
     def promote_user(self, user_id: str, role: str) -> ApiResponse:
         params = {"role": role}
-        return self.get(f"{self.base_endpoint}/promote/{user_id}", params=params)
+        return self.get(f"{self.base_endpoint}/promote/{user_id}", params=params, timeout_profile="fast")
 
     def login(self, username: str, password: str) -> ApiResponse:
         login_data = {
             "username": username,
             "password": password
         }
-        return self.post(f"{self.base_endpoint}/auth/login", data=login_data)
+        return self.post(f"{self.base_endpoint}/auth/login", data=login_data, timeout_profile="fast")
 
+    @invalidates("user", "user/me")
     def register(
             self,
             username: str,
@@ -70,7 +85,12 @@ class UserService(BaseApiClient):
             "birthDate": birth_date,
             "roles": roles
         }
-        return self.post(f"{self.base_endpoint}/auth/register", data=registration_data)
+        return self.post(f"{self.base_endpoint}/auth/register", data=registration_data, timeout_profile="fast")
 
+    @invalidates("user", "user/me")
     def delete_user(self, user_id: str) -> ApiResponse:
-        return self.delete(f"{self.base_endpoint}/{user_id}")
\ No newline at end of file
+        return self.delete(f"{self.base_endpoint}/{user_id}", timeout_profile="fast")
+
+
+class AsyncUserService(UserService, AsyncBaseApiClient):
+    """UserService whose methods return awaitables instead of ApiResponse"""
@@ -0,0 +1,83 @@
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlightTimeout(Exception):
+    """Raised to a waiter when the shared call outlives the leader's timeout."""
+
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error', 'deadline', 'waiters')
+
+    def __init__(self, deadline: float):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.deadline = deadline
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller (the leader) runs the function; callers arriving while it is in
+    flight wait for its result, at most until the leader's own timeout runs out.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T], timeout: float) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight(time.monotonic() + timeout)
+                self._flights[key] = flight
+                self.executed += 1
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if leader:
+            try:
+                flight.result = fn()
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._flights.pop(key, None)
+                flight.done.set()
+
+        if not flight.done.wait(max(0.0, flight.deadline - time.monotonic())):
+            raise SingleFlightTimeout(f"Shared request did not complete within {timeout} seconds")
+
+        if flight.error is not None:
+            # Each waiter gets its own exception instance so tracebacks don't pile up on one object
+            raise copy.copy(flight.error)
+        return flight.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'in_flight': len(self._flights),
+                'executed': self.executed,
+                'coalesced': self.coalesced
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
@@ -0,0 +1,182 @@
+import codecs
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional
+
+from constants import HTTP_SUCCESS_MIN, HTTP_SUCCESS_MAX
+
+_WHITESPACE = ' \t\n\r'
+_SELF_DELIMITING = '{["'
+# Characters a number or literal (true, false, null) can consist of, including partial ones like "2." or "-3e"
+_SCALAR = re.compile(r'[-+.0-9A-Za-z]*')
+
+_EXPECT_OPEN = 0
+_EXPECT_FIRST = 1
+_EXPECT_VALUE = 2
+_EXPECT_SEPARATOR = 3
+_DONE = 4
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonArrayParser:
+    """
+    Push parser for a top-level JSON array: ``feed`` text as it arrives and get back the
+    items completed so far. Only the unparsed tail is buffered, so memory stays at about
+    one chunk plus the largest single item.
+    """
+
+    def __init__(self):
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ''
+        self._state = _EXPECT_OPEN
+        # A partial item is not re-parsed until the buffer reaches this length, which keeps
+        # items spanning many chunks linear instead of quadratic
+        self._retry_length = 0
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        buffer = self._buffer + text if self._buffer else text
+        length = len(buffer)
+        state = self._state
+        items = []
+        pos = 0
+
+        while True:
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == length:
+                break
+
+            if state == _EXPECT_OPEN:
+                if buffer[pos] != '[':
+                    raise JsonStreamError("Expected a JSON array")
+                pos += 1
+                state = _EXPECT_FIRST
+
+            elif state == _EXPECT_FIRST or state == _EXPECT_VALUE:
+                if state == _EXPECT_FIRST and buffer[pos] == ']':
+                    pos += 1
+                    state = _DONE
+                    continue
+                if not final and length - pos < self._retry_length:
+                    break
+                # A number or literal reaching the buffer end may continue in the next chunk
+                if not final and buffer[pos] not in _SELF_DELIMITING and _SCALAR.match(buffer, pos).end() == length:
+                    break
+                try:
+                    value, end = self._raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final:
+                        raise JsonStreamError(f"Malformed JSON array item: {e}") from e
+                    self._retry_length = 2 * (length - pos)
+                    break
+                items.append(value)
+                pos = end
+                state = _EXPECT_SEPARATOR
+                self._retry_length = 0
+
+            elif state == _EXPECT_SEPARATOR:
+                separator = buffer[pos]
+                if separator == ',':
+                    state = _EXPECT_VALUE
+                elif separator == ']':
+                    state = _DONE
+                else:
+                    raise JsonStreamError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+                pos += 1
+
+            else:
+                raise JsonStreamError("Unexpected data after the JSON array")
+
+        self._buffer = buffer[pos:]
+        self._state = state
+
+        if final and state not in (_DONE, _EXPECT_OPEN):
+            raise JsonStreamError("JSON array ended before its closing bracket")
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: Optional[str] = None) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array from an iterable of byte chunks; an empty body yields nothing."""
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')()
+    parser = JsonArrayParser()
+
+    for chunk in chunks:
+        if chunk:
+            yield from parser.feed(decoder.decode(chunk))
+    yield from parser.feed(decoder.decode(b'', final=True), final=True)
+
+
+class ApiStream:
+    """
+    A GET whose JSON array body is consumed incrementally with ``iter_items()``.
+
+    The connection stays checked out of the pool until the items are exhausted or the
+    stream is closed, so use it as a context manager. Error responses are read in full
+    and exposed through ``error`` like an ApiResponse; their ``iter_items()`` yields nothing.
+
+    With ``on_complete``, items are also collected while there are at most ``collect_limit``
+    of them and the list is handed over once the array has been read to the end.
+    """
+
+    def __init__(self, status_code: int, headers: Optional[Mapping[str, str]] = None, error: Optional[str] = None,
+                 chunks: Optional[Iterable[bytes]] = None, encoding: Optional[str] = None,
+                 items: Optional[Iterable[Any]] = None, from_cache: bool = False,
+                 on_close: Optional[Callable[[bool], None]] = None,
+                 on_complete: Optional[Callable[[List[Any]], None]] = None, collect_limit: int = 0):
+        self.status_code = status_code
+        self.headers = headers
+        self.error = error
+        self.from_cache = from_cache
+        self._chunks = chunks
+        self._encoding = encoding
+        self._items = items
+        self._on_close = on_close
+        self._on_complete = on_complete
+        self._collect_limit = collect_limit
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None and HTTP_SUCCESS_MIN <= self.status_code < HTTP_SUCCESS_MAX
+
+    def iter_items(self) -> Iterator[Any]:
+        if not self.is_success:
+            return
+        if self._items is not None:
+            yield from self._items
+            return
+        if self._chunks is None:
+            return
+
+        chunks, self._chunks = self._chunks, None
+        failed = True
+        collected = [] if self._on_complete is not None else None
+        try:
+            for item in iter_json_array(chunks, self._encoding):
+                if collected is not None:
+                    collected.append(item)
+                    if len(collected) > self._collect_limit:
+                        collected = None
+                yield item
+            failed = False
+            if collected is not None:
+                self._on_complete(collected)
+        except GeneratorExit:
+            # Abandoned by the caller; the connection is closed with the response, not broken
+            failed = False
+            raise
+        finally:
+            self.close(failed)
+
+    def close(self, failed: bool = False) -> None:
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close(failed)
+
+    def __enter__(self) -> 'ApiStream':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(exc_type is not None)
@@ -0,0 +1,153 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from constants import SUBSECTION_PREFETCH_CONCURRENCY, SUBSECTION_PREFETCH_MAX_WORKERS
+from .base_client import ApiResponse
+from .metrics import get_metrics_registry
+from .request_context import bind_request_context
+
+if TYPE_CHECKING:
+    from .services.document_service import DocumentService
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_prefetch_results = get_metrics_registry().counter(
+    'qualifaize_subsection_prefetch_total', 'Subsection lookups by prefetch outcome', ('outcome',))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=SUBSECTION_PREFETCH_MAX_WORKERS,
+                                               thread_name_prefix="qualifaize-subsections")
+    return _executor
+
+
+class SubsectionPrefetcher:
+    """
+    Contents of a document's subsections, requested in the background for one session.
+
+    ``start`` runs up to ``concurrency`` workers that fetch the subsections one after another,
+    always the not yet requested one closest (in table of contents order) to the subsection in
+    ``focus``, so moving to a neighbouring subsection rarely waits. ``get`` returns a prefetched
+    subsection, waits for one in flight, or fetches it right away when no worker has reached
+    it yet. Fetches go through ``get_document_content``, so they also land in the document cache.
+    ``service`` must be a blocking DocumentService.
+    """
+
+    def __init__(self, service: 'DocumentService', document_id: str, subsections: Sequence[str],
+                 concurrency: int = SUBSECTION_PREFETCH_CONCURRENCY):
+        self.service = service
+        self.document_id = document_id
+        self.subsections: List[str] = list(dict.fromkeys(subsections))
+        self.concurrency = max(1, concurrency)
+        self._positions = {name: position for position, name in enumerate(self.subsections)}
+        self._results: Dict[str, Future] = {name: Future() for name in self.subsections}
+        self._pending: Set[int] = set(range(len(self.subsections)))
+        self._focus = 0
+        self._lock = threading.Lock()
+        self._started = False
+        self._cancelled = False
+
+    def start(self, focus: Optional[str] = None) -> None:
+        """Start the background workers. Must be called on the script thread."""
+        with self._lock:
+            if self._started or self._cancelled:
+                return
+            self._started = True
+            if focus in self._positions:
+                self._focus = self._positions[focus]
+            workers = min(self.concurrency, len(self._pending))
+        for _ in range(workers):
+            _get_executor().submit(bind_request_context(self._work))
+
+    def focus(self, subsection: str) -> None:
+        """Prefetch around ``subsection`` from now on, e.g. when the reader moves to it."""
+        with self._lock:
+            if subsection in self._positions:
+                self._focus = self._positions[subsection]
+
+    def _claim_next(self) -> Optional[Tuple[str, Future]]:
+        with self._lock:
+            if self._cancelled or not self._pending:
+                return None
+            position = min(self._pending, key=lambda candidate: (abs(candidate - self._focus), candidate))
+            self._pending.discard(position)
+            name = self.subsections[position]
+            return name, self._results[name]
+
+    def _work(self) -> None:
+        claimed = self._claim_next()
+        while claimed is not None:
+            self._fetch(*claimed)
+            claimed = self._claim_next()
+
+    def _fetch(self, name: str, result: Future) -> None:
+        if not result.set_running_or_notify_cancel():
+            return
+        try:
+            result.set_result(self.service.get_document_content(self.document_id, name))
+        except Exception as e:
+            result.set_exception(e)
+
+    def get(self, subsection: str) -> ApiResponse:
+        """The content of ``subsection``, prefetched when possible; also moves the focus to it."""
+        position = self._positions.get(subsection)
+        if position is None:
+            _prefetch_results.inc(outcome='miss')
+            return self.service.get_document_content(self.document_id, subsection)
+
+        with self._lock:
+            self._focus = position
+            claimed = position in self._pending and not self._cancelled
+            self._pending.discard(position)
+            result = self._results[subsection]
+
+        if claimed:
+            # No worker has reached it yet; fetch it here rather than queue behind the others
+            _prefetch_results.inc(outcome='miss')
+            self._fetch(subsection, result)
+        else:
+            _prefetch_results.inc(outcome='ready' if result.done() else 'waited')
+
+        try:
+            response = result.result()
+        except Exception as e:
+            if not result.cancelled():
+                logger.warning("Prefetching subsection %s of document %s failed: %s",
+                               subsection, self.document_id, e)
+            response = None
+        if response is None or not (response.is_success or 400 <= response.status_code < 500):
+            # Cancelled, or failed in a way a fresh request might not (connection errors, 5xx)
+            _prefetch_results.inc(outcome='discarded')
+            return self.service.get_document_content(self.document_id, subsection)
+        return response
+
+    def ready(self, subsection: str) -> bool:
+        """Whether ``subsection`` can be shown without waiting."""
+        result = self._results.get(subsection)
+        return result is not None and result.done() and not result.cancelled()
+
+    def progress(self) -> Tuple[int, int]:
+        """Subsections fetched so far, and the total."""
+        fetched = sum(1 for result in self._results.values() if result.done() and not result.cancelled())
+        return fetched, len(self.subsections)
+
+    def cancel(self) -> None:
+        """
+        Stop prefetching, e.g. when the reader leaves the document. Requests already waiting on
+        the backend finish and are kept; nothing else is requested.
+        """
+        with self._lock:
+            self._cancelled = True
+            pending = [self._results[self.subsections[position]] for position in self._pending]
+            self._pending.clear()
+        for result in pending:
+            result.cancel()
@@ -0,0 +1,91 @@
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from constants import TIMEOUT_PROFILES, DEFAULT_CONNECT_TIMEOUT, ADAPTIVE_TIMEOUT_WINDOW, \
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES, ADAPTIVE_TIMEOUT_MULTIPLIER
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    connect: float
+    read: float
+    # Bounds for the adaptive read timeout; default to the static read timeout as the ceiling
+    read_floor: Optional[float] = None
+    read_ceiling: Optional[float] = None
+
+    def as_tuple(self) -> Tuple[float, float]:
+        return self.connect, self.read
+
+
+def get_timeout_profile(name: str) -> TimeoutProfile:
+    try:
+        return TimeoutProfile(**TIMEOUT_PROFILES[name])
+    except KeyError:
+        raise ValueError(f"Unknown timeout profile: {name}")
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class LatencyTracker:
+    """Sliding window of observed latencies per endpoint template, used for adaptive read timeouts."""
+
+    def __init__(self, window: int = ADAPTIVE_TIMEOUT_WINDOW, min_samples: int = ADAPTIVE_TIMEOUT_MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, base_url: str, endpoint: str, seconds: float) -> None:
+        key = (base_url, endpoint)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, base_url: str, endpoint: str, fraction: float) -> Optional[float]:
+        with self._lock:
+            samples = self._samples.get((base_url, endpoint))
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return percentile(ordered, fraction)
+
+    def adaptive_read_timeout(self, base_url: str, endpoint: str, profile: TimeoutProfile) -> float:
+        """Read timeout derived from the endpoint's p99, clamped to the profile's floor and ceiling."""
+        p99 = self.percentile(base_url, endpoint, 0.99)
+        if p99 is None:
+            return profile.read
+
+        floor = profile.read_floor if profile.read_floor is not None else 0.0
+        ceiling = profile.read_ceiling if profile.read_ceiling is not None else profile.read
+        return min(ceiling, max(floor, p99 * ADAPTIVE_TIMEOUT_MULTIPLIER))
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            copies = {key: sorted(samples) for key, samples in self._samples.items()}
+        return {
+            f"{base_url} {endpoint}": {
+                'samples': len(ordered),
+                'p50': percentile(ordered, 0.5),
+                'p99': percentile(ordered, 0.99)
+            }
+            for (base_url, endpoint), ordered in copies.items() if ordered
+        }
+
+
+_latency_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _latency_tracker
+
+
+def default_profile(read_timeout: float) -> TimeoutProfile:
+    return TimeoutProfile(connect=min(DEFAULT_CONNECT_TIMEOUT, read_timeout), read=read_timeout)
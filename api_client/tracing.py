@@ -0,0 +1,321 @@
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional
+
+import requests
+
+from constants import TRACING_EXPORTER, TRACING_SAMPLE_RATIO, TRACING_FILE_PATH, TRACING_OTLP_ENDPOINT, \
+    TRACING_SERVICE_NAME, TRACING_QUEUE_SIZE, TRACING_EXPORT_BATCH_SIZE, TRACING_EXPORT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# st.rerun() and st.stop() end a script run by raising; they are not failures
+_CONTROL_FLOW_EXCEPTIONS = frozenset({'RerunException', 'StopException'})
+
+
+class Span:
+    """
+    One timed operation. Spans that were not sampled still carry ids, so the trace
+    context reaches the backend, but they record nothing and are never exported.
+    """
+
+    __slots__ = ('trace_id', 'span_id', 'parent_span_id', 'name', 'kind', 'sampled', 'start_ns', 'end_ns',
+                 'attributes', 'status', 'status_message')
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], sampled: bool,
+                 kind: int = SPAN_KIND_INTERNAL):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """W3C Trace Context header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled and value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def set_status(self, status: int, message: Optional[str] = None) -> None:
+        self.status = status
+        self.status_message = message
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns,
+            'durationMs': self.duration_ms,
+            'attributes': self.attributes,
+            'status': {'code': self.status, 'message': self.status_message}
+        }
+
+
+_current_span = contextvars.ContextVar('qualifaize_current_span', default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+class RatioSampler:
+    """
+    Samples a fixed fraction of traces, decided once at the root span from the trace id;
+    child spans follow their parent's decision so traces are never partially recorded.
+    """
+
+    def __init__(self, ratio: float = TRACING_SAMPLE_RATIO):
+        self.ratio = min(1.0, max(0.0, ratio))
+        self._bound = int(self.ratio * (1 << 64))
+
+    def should_sample(self, trace_id: str) -> bool:
+        return int(trace_id[16:], 16) < self._bound
+
+
+class SpanExporter:
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonLinesExporter(SpanExporter):
+    """Appends one JSON object per span to a local file."""
+
+    def __init__(self, path: str = TRACING_FILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = ''.join(json.dumps(span.to_dict(), default=str) + '\n' for span in spans)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as trace_file:
+                trace_file.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class OtlpHttpExporter(SpanExporter):
+    """Sends spans to an OpenTelemetry collector over OTLP/HTTP with the JSON encoding."""
+
+    def __init__(self, endpoint: str = TRACING_OTLP_ENDPOINT, service_name: str = TRACING_SERVICE_NAME,
+                 timeout: float = 10):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        # Deliberately not a BaseApiClient: exporting must not produce spans or metrics of its own
+        self._session = requests.Session()
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': self.service_name}}]},
+            'scopeSpans': [{
+                'scope': {'name': 'qualifaize.api_client'},
+                'spans': [{
+                    'traceId': span.trace_id,
+                    'spanId': span.span_id,
+                    **({'parentSpanId': span.parent_span_id} if span.parent_span_id else {}),
+                    'name': span.name,
+                    'kind': span.kind,
+                    'startTimeUnixNano': str(span.start_ns),
+                    'endTimeUnixNano': str(span.end_ns),
+                    'attributes': [{'key': key, 'value': _otlp_value(value)}
+                                   for key, value in span.attributes.items()],
+                    'status': {'code': span.status, **({'message': span.status_message}
+                                                        if span.status_message else {})}
+                } for span in spans]
+            }]
+        }]}
+
+    def export(self, spans: List[Span]) -> None:
+        response = self._session.post(self.endpoint, data=json.dumps(self._payload(spans)).encode('utf-8'),
+                                      headers={'Content-Type': 'application/json'}, timeout=self.timeout)
+        if response.status_code >= 400:
+            raise IOError(f"OTLP collector answered {response.status_code}")
+
+    def shutdown(self) -> None:
+        self._session.close()
+
+
+class BatchSpanProcessor:
+    """
+    Queues finished spans and exports them in batches from a daemon thread, so request
+    threads never wait on the exporter. Spans are dropped when the queue is full.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_queue_size: int = TRACING_QUEUE_SIZE,
+                 batch_size: int = TRACING_EXPORT_BATCH_SIZE, interval: float = TRACING_EXPORT_INTERVAL):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue: 'queue.Queue[Span]' = queue.Queue(maxsize=max_queue_size)
+        self._flush_requested = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="qualifaize-trace-export", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_requested.set()
+
+    def _drain(self) -> List[Span]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _export_pending(self) -> None:
+        batch = self._drain()
+        while batch:
+            try:
+                self.exporter.export(batch)
+            except Exception as e:
+                logger.warning("Dropped %d spans, export failed: %s", len(batch), e)
+            batch = self._drain()
+
+    def _run(self) -> None:
+        while True:
+            self._flush_requested.wait(self.interval)
+            self._flush_requested.clear()
+            self._export_pending()
+
+    def force_flush(self) -> None:
+        """Export everything queued so far on the calling thread."""
+        self._export_pending()
+
+
+class Tracer:
+    """
+    Creates spans and keeps the active one in a context variable, which
+    ``bind_request_context`` copies to worker threads together with the auth token.
+    Without a processor tracing is off and ``start_span`` costs a context manager call.
+    """
+
+    def __init__(self, processor: Optional[BatchSpanProcessor] = None, sampler: Optional[RatioSampler] = None):
+        self.processor = processor
+        self.sampler = sampler or RatioSampler()
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    @contextmanager
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL,
+                   attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+        """
+        Run the block inside a new span, a child of the active span if there is one and a
+        new (possibly unsampled) trace otherwise. Yields None when tracing is off.
+        """
+        if self.processor is None:
+            yield None
+            return
+
+        parent = _current_span.get()
+        if parent is None:
+            trace_id = f"{random.getrandbits(128):032x}"
+            span = Span(name, trace_id, None, self.sampler.should_sample(trace_id), kind)
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, parent.sampled, kind)
+        if attributes:
+            span.set_attributes(attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            if type(e).__name__ not in _CONTROL_FLOW_EXCEPTIONS:
+                span.set_status(STATUS_ERROR, str(e) or type(e).__name__)
+                span.set_attribute('exception.type', type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if span.sampled:
+                self.processor.on_end(span)
+
+    def inject(self, headers: MutableMapping[str, str]) -> None:
+        """Add the ``traceparent`` header of the active span, if any, to outgoing request headers."""
+        span = _current_span.get()
+        if span is not None:
+            headers['traceparent'] = span.traceparent
+
+
+def _exporter_from_config(name: str) -> Optional[SpanExporter]:
+    name = (name or 'none').lower()
+    if name == 'file':
+        return JsonLinesExporter()
+    if name == 'otlp':
+        return OtlpHttpExporter()
+    if name != 'none':
+        logger.warning("Unknown TRACING_EXPORTER %r, tracing disabled", name)
+    return None
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                exporter = _exporter_from_config(TRACING_EXPORTER)
+                _tracer = Tracer(BatchSpanProcessor(exporter) if exporter is not None else None)
+    return _tracer
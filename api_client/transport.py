@@ -0,0 +1,216 @@
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from constants import API_TRANSPORT, API_CASSETTE_PATH, REPLAY_LATENCY_SCALE
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Never written to a cassette; tokens in recorded response bodies (e.g. login) are kept as they are
+_UNRECORDED_RESPONSE_HEADERS = frozenset({'set-cookie'})
+
+InteractionKey = Tuple[str, str, Optional[str]]
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """A replayed request that has no recorded counterpart."""
+
+
+def request_signature(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """Method and host-independent path with sorted query, so cassettes replay against any base URL."""
+    prepared = requests.PreparedRequest()
+    prepared.prepare_url(url, params)
+    parts = urlsplit(prepared.url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method.upper(), f"{parts.path}?{query}" if query else parts.path
+
+
+def body_digest(kwargs: Dict[str, Any]) -> Optional[str]:
+    """
+    Digest of a JSON or raw body. Streamed multipart bodies (random boundary) and compressed
+    bodies (gzip embeds a timestamp) are not digested; such requests match on method and path.
+    """
+    headers = kwargs.get('headers') or {}
+    if headers.get('Content-Encoding'):
+        return None
+    if kwargs.get('json') is not None:
+        body = json.dumps(kwargs['json'], sort_keys=True, separators=(',', ':')).encode('utf-8')
+    else:
+        body = kwargs.get('data')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        if not isinstance(body, bytes):
+            return None
+    return hashlib.sha256(body).hexdigest()
+
+
+class Transport:
+    """Sends a prepared call on a pooled session; ``passthrough`` is a plain ``session.request``."""
+
+    name = 'passthrough'
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        return session.request(method, url, **kwargs)
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through and appends each request/response pair, with its latency, to a
+    JSON lines cassette. Streamed responses are read in full before they are returned, so
+    recording trades incremental rendering for a complete cassette.
+    """
+
+    name = 'record'
+
+    def __init__(self, path: str = API_CASSETTE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        started = time.monotonic()
+        response = session.request(method, url, **kwargs)
+        body = response.content
+        latency = time.monotonic() - started
+
+        recorded_method, path = request_signature(method, url, kwargs.get('params'))
+        interaction = {
+            'version': CASSETTE_VERSION,
+            'method': recorded_method,
+            'path': path,
+            'body_sha256': body_digest(kwargs),
+            'latency': round(latency, 6),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {name: value for name, value in response.headers.items()
+                        if name.lower() not in _UNRECORDED_RESPONSE_HEADERS},
+            'encoding': response.encoding,
+            'body': base64.b64encode(body).decode('ascii') if body else ''
+        }
+        line = json.dumps(interaction) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as cassette:
+                cassette.write(line)
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette without touching the network.
+
+    Interactions are matched on method, path, query and body digest, falling back to method,
+    path and query. Repeated requests get the recorded responses in their recorded order (the
+    last one is repeated once they run out), so sequences such as successive
+    ``interview/next/{id}`` calls replay faithfully. Each response is delayed by its recorded
+    latency times ``latency_scale``; 0 replays as fast as possible.
+    """
+
+    name = 'replay'
+
+    def __init__(self, path: str = API_CASSETTE_PATH, latency_scale: float = REPLAY_LATENCY_SCALE):
+        self.path = path
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._exact: Dict[InteractionKey, Deque[Dict[str, Any]]] = {}
+        self._by_path: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        with open(self.path, 'r', encoding='utf-8') as cassette:
+            for line_number, line in enumerate(cassette, 1):
+                if not line.strip():
+                    continue
+                try:
+                    interaction = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping unreadable cassette line %d in %s", line_number, self.path)
+                    continue
+                key = (interaction['method'], interaction['path'])
+                self._exact.setdefault(key + (interaction.get('body_sha256'),), deque()).append(interaction)
+                self._by_path.setdefault(key, deque()).append(interaction)
+        logger.info("Loaded %d recorded interactions from %s",
+                    sum(len(interactions) for interactions in self._by_path.values()), self.path)
+
+    @staticmethod
+    def _take(interactions: Optional[Deque[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        if not interactions:
+            return None
+        return interactions.popleft() if len(interactions) > 1 else interactions[0]
+
+    def _match(self, method: str, path: str, digest: Optional[str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            interaction = self._take(self._exact.get((method, path, digest)))
+            if interaction is None:
+                interaction = self._take(self._by_path.get((method, path)))
+            return interaction
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        recorded_method, path = request_signature(method, url, kwargs.get('params'))
+        body = kwargs.get('data')
+        if body is not None and hasattr(body, 'read') and not isinstance(body, (bytes, str)):
+            # Drain streamed uploads so files are read and progress callbacks fire as they would live
+            while body.read(1024 * 1024):
+                pass
+
+        interaction = self._match(recorded_method, path, body_digest(kwargs))
+        if interaction is None:
+            raise CassetteMiss(f"No recorded response for {recorded_method} {path} in {self.path}")
+
+        if self.latency_scale > 0:
+            time.sleep(interaction.get('latency', 0) * self.latency_scale)
+        return self._build_response(interaction, method, url, kwargs)
+
+    @staticmethod
+    def _build_response(interaction: Dict[str, Any], method: str, url: str,
+                        kwargs: Dict[str, Any]) -> requests.Response:
+        prepared = requests.PreparedRequest()
+        prepared.method = method.upper()
+        prepared.url = url
+        prepared.headers = CaseInsensitiveDict(kwargs.get('headers') or {})
+        prepared.body = kwargs.get('data')
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        # As with a live response, headers may still name a Content-Encoding while content is decoded
+        response.headers = CaseInsensitiveDict(interaction.get('headers') or {})
+        response.encoding = interaction.get('encoding')
+        response.url = url
+        response.request = prepared
+        response._content = base64.b64decode(interaction.get('body') or '')
+        response._content_consumed = True
+        return response
+
+
+def _transport_from_config(name: str) -> Transport:
+    name = (name or 'passthrough').lower()
+    if name == 'record':
+        logger.warning("Recording API traffic to %s", API_CASSETTE_PATH)
+        return RecordingTransport()
+    if name == 'replay':
+        return ReplayTransport()
+    if name != 'passthrough':
+        logger.warning("Unknown API_TRANSPORT %r, using passthrough", name)
+    return Transport()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = _transport_from_config(API_TRANSPORT)
+    return _transport
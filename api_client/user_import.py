@@ -0,0 +1,218 @@
+import csv
+import importlib.util
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+
+from constants import BULK_CONCURRENCY, USER_IMPORT_MAX_ROWS, USER_IMPORT_DEFAULT_ROLES
+from .base_client import ApiResponse
+from .bulk import BulkOutcome, BulkResult, RateLimiter, run_bulk
+
+if TYPE_CHECKING:
+    from .services.user_service import UserService
+
+ROLES = ("GUEST", "USER", "ADMIN")
+# Normalised column key -> name used in messages
+REQUIRED_COLUMNS = {"username": "username", "email": "email", "firstname": "firstName", "lastname": "lastName",
+                    "password": "password", "birthdate": "birthDate"}
+
+# Used exactly as written: surrounding spaces in a password are part of it
+_UNSTRIPPED_COLUMNS = frozenset({"password"})
+
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_ROLE_SEPARATORS = re.compile(r'[,;|\s]+')
+
+
+def xlsx_supported() -> bool:
+    """Whether .xlsx files can be read, which needs the optional openpyxl package."""
+    return importlib.util.find_spec('openpyxl') is not None
+
+
+def _column_key(header: Any) -> str:
+    # "First Name", "first_name" and "firstName" all name the same column
+    return re.sub(r'[^a-z0-9]', '', str(header or '').lower())
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        for row in csv.DictReader(text):
+            yield {_column_key(header): value for header, value in row.items() if header is not None}
+    finally:
+        # Leave the caller's file open
+        text.detach()
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    if not xlsx_supported():
+        raise ValueError("Reading .xlsx files requires openpyxl (pip install openpyxl)")
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_column_key(header) for header in next(rows, ())]
+        for values in rows:
+            if any(value not in (None, '') for value in values):
+                yield dict(zip(headers, values))
+    finally:
+        workbook.close()
+
+
+def read_user_rows(file: BinaryIO, filename: str) -> Iterator[Dict[str, Any]]:
+    """Rows of a .csv or .xlsx file as dicts keyed by normalised column name, read lazily."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        return _csv_rows(file)
+    if extension == '.xlsx':
+        return _xlsx_rows(file)
+    raise ValueError(f"Unsupported file type {extension or filename}; use .csv or .xlsx")
+
+
+@dataclass
+class UserImportRow:
+    line: int
+    username: str
+    email: str
+    first_name: str
+    last_name: str
+    password: str
+    birth_date: Optional[str]
+    roles: List[str]
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def describe(self) -> Dict[str, Any]:
+        """Report columns; the password is never included."""
+        return {
+            'line': self.line,
+            'username': self.username,
+            'email': self.email,
+            'firstName': self.first_name,
+            'lastName': self.last_name,
+            'roles': ' '.join(self.roles)
+        }
+
+
+def _cell(value: Any) -> str:
+    """A cell as text; whole numbers, which XLSX stores as floats, lose the trailing ``.0``."""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _text(value: Any) -> str:
+    return _cell(value).strip()
+
+
+def _column_text(row: Dict[str, Any], column: str) -> str:
+    return _cell(row.get(column)) if column in _UNSTRIPPED_COLUMNS else _text(row.get(column))
+
+
+def _birth_date(value: Any, errors: List[str]) -> Optional[str]:
+    if isinstance(value, datetime):
+        parsed = value.date()
+    elif isinstance(value, date):
+        parsed = value
+    else:
+        text = _text(value)
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00')).date()
+        except ValueError:
+            errors.append(f"birthDate {text!r} is not a date (YYYY-MM-DD)")
+            return None
+    if not date(1900, 1, 1) <= parsed <= date.today():
+        errors.append(f"birthDate {parsed.isoformat()} is out of range")
+        return None
+    # Same format as the single user dialog
+    return parsed.strftime('%Y-%m-%dT00:00:00Z')
+
+
+def validate_user_row(line: int, row: Dict[str, Any]) -> UserImportRow:
+    errors = [f"{name} is required" for column, name in REQUIRED_COLUMNS.items() if not _column_text(row, column)]
+
+    email = _text(row.get('email'))
+    if email and not _EMAIL.match(email):
+        errors.append(f"email {email!r} is not valid")
+
+    birth_date = _birth_date(row['birthdate'], errors) if _text(row.get('birthdate')) else None
+
+    roles = [role.upper() for role in _ROLE_SEPARATORS.split(_text(row.get('roles'))) if role]
+    unknown = [role for role in roles if role not in ROLES]
+    if unknown:
+        errors.append(f"unknown roles {', '.join(unknown)}")
+
+    return UserImportRow(
+        line=line,
+        username=_text(row.get('username')),
+        email=email,
+        first_name=_text(row.get('firstname')),
+        last_name=_text(row.get('lastname')),
+        password=_column_text(row, 'password'),
+        birth_date=birth_date,
+        roles=roles or list(USER_IMPORT_DEFAULT_ROLES),
+        errors=errors
+    )
+
+
+def parse_user_import(file: BinaryIO, filename: str, max_rows: int = USER_IMPORT_MAX_ROWS) -> List[UserImportRow]:
+    """
+    Read and validate every row before anything is sent. Besides per-row checks, usernames and
+    emails repeated within the file are errors on every row after the first. Line numbers
+    count the header as line 1.
+    """
+    rows: List[UserImportRow] = []
+    seen_usernames: Dict[str, int] = {}
+    seen_emails: Dict[str, int] = {}
+    for line, raw_row in enumerate(read_user_rows(file, filename), start=2):
+        if len(rows) >= max_rows:
+            raise ValueError(f"The file has more than {max_rows} users; split it into smaller files")
+        row = validate_user_row(line, raw_row)
+        for value, seen, name in ((row.username.lower(), seen_usernames, "username"),
+                                  (row.email.lower(), seen_emails, "email")):
+            if value and value in seen:
+                row.errors.append(f"{name} already used on line {seen[value]}")
+            elif value:
+                seen[value] = line
+        rows.append(row)
+    return rows
+
+
+def import_users(user_service: 'UserService', rows: List[UserImportRow], concurrency: int = BULK_CONCURRENCY,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 progress_callback: Optional[Callable[[int, int, BulkOutcome[UserImportRow]], None]] = None
+                 ) -> BulkResult[UserImportRow]:
+    """Register every valid row through ``user_service.register``; invalid rows are skipped."""
+
+    def register(row: UserImportRow) -> ApiResponse:
+        return user_service.register(
+            username=row.username,
+            password=row.password,
+            email=row.email,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            birth_date=row.birth_date,
+            roles=row.roles
+        )
+
+    return run_bulk([row for row in rows if row.valid], register, concurrency=concurrency,
+                    rate_limiter=rate_limiter, progress_callback=progress_callback)
+
+
+def user_import_report(rows: List[UserImportRow], result: Optional[BulkResult[UserImportRow]] = None) -> bytes:
+    """CSV report with one row per line of the file, including the rows that failed validation and were not sent."""
+    sent = {outcome.item.line: outcome for outcome in result.outcomes} if result is not None else {}
+    outcomes = [
+        sent.get(row.line) or BulkOutcome(index, row, ApiResponse(
+            success=False, status_code=0, error=f"Not sent: {'; '.join(row.errors) or 'import not run'}"))
+        for index, row in enumerate(rows)
+    ]
+    return BulkResult(outcomes=outcomes).report_csv(UserImportRow.describe)
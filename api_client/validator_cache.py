@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple, TYPE_CHECKING
+
+from constants import VALIDATOR_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from .base_client import ApiResponse
+
+
+def request_key(scope: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Tuple[Hashable, ...]:
+    """Cache key for a GET within one auth scope; params are order independent and None values dropped."""
+    normalized_params = tuple(sorted(
+        (str(name), str(value)) for name, value in (params or {}).items() if value is not None
+    ))
+    return scope, url, normalized_params
+
+
+@dataclass
+class CachedRepresentation:
+    response: "ApiResponse"
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """
+    Bounded LRU of the last representation received for each GET, with its ETag/Last-Modified
+    validators. Keys include the auth scope, so one user's data never answers another's request.
+    """
+
+    def __init__(self, max_entries: int = VALIDATOR_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], CachedRepresentation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.revalidated = 0
+        self.stored = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[CachedRepresentation]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Tuple[Hashable, ...], entry: CachedRepresentation) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stored += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_revalidation(self) -> None:
+        with self._lock:
+            self.revalidated += 1
+
+    def discard(self, key: Tuple[Hashable, ...]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_validator_cache = ValidatorCache()
+
+
+def get_validator_cache() -> ValidatorCache:
+    return _validator_cache
@@ -0,0 +1,135 @@
+"""
+Compare the original response handling (stdlib json, eager header copy, dataclass) with
+BaseApiClient._handle_response on a ~5 MB interview-history payload.
+
+    python benchmarks/bench_response_decoding.py
+"""
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api_client.base_client import BaseApiClient
+from api_client.codec import JSON_BACKEND
+
+TARGET_BYTES = 5 * 1024 * 1024
+ROUNDS = 10
+
+
+@dataclass
+class LegacyApiResponse:
+    success: bool
+    status_code: int
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+def legacy_handle_response(response: requests.Response) -> LegacyApiResponse:
+    try:
+        data = response.json() if response.content else None
+    except json.JSONDecodeError:
+        data = response.text if response.content else None
+
+    return LegacyApiResponse(
+        success=200 <= response.status_code < 300,
+        status_code=response.status_code,
+        data=data,
+        headers=dict(response.headers)
+    )
+
+
+def build_interview_history(target_bytes: int) -> bytes:
+    question_template = {
+        "questionId": "",
+        "questionOrder": 0,
+        "questionText": "Which statement about dependency injection in Spring Boot is correct? " * 2,
+        "optionA": "Beans are created lazily by default and injected through reflection only.",
+        "optionB": "Constructor injection makes required dependencies explicit and eases testing.",
+        "optionC": "Field injection is required for @Configuration classes to work.",
+        "optionD": "The container cannot inject interfaces, only concrete classes.",
+        "correctOption": "B",
+        "submittedAnswer": "B",
+        "isCorrect": True,
+        "answerTimeInMillis": 18342,
+        "explanation": "Constructor injection documents required collaborators and allows immutable fields. " * 3
+    }
+
+    interviews = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        questions = [dict(question_template, questionId=f"{index}-{order}", questionOrder=order)
+                     for order in range(1, 11)]
+        interview = {
+            "interviewId": f"interview-{index}",
+            "name": f"Java Spring Boot Technical Interview #{index}",
+            "description": "Backend engineering assessment based on the onboarding manual.",
+            "status": "COMPLETED",
+            "difficulty": "MEDIUM",
+            "documentTitle": "Spring Boot Reference Guide",
+            "durationInSeconds": 1260,
+            "createdBy": {"username": "admin", "firstName": "Ada", "lastName": "Lovelace"},
+            "candidateReview": "Solid understanding of the core concepts. " * 5,
+            "questions": questions
+        }
+        interviews.append(interview)
+        size += len(json.dumps(interview))
+        index += 1
+
+    return json.dumps(interviews).encode('utf-8')
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = body
+    response.encoding = 'utf-8'
+    response.headers = CaseInsensitiveDict({
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(body)),
+        'Date': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        'Cache-Control': 'no-cache, no-store, max-age=0, must-revalidate',
+        'X-Content-Type-Options': 'nosniff',
+        'X-Frame-Options': 'DENY',
+        'Vary': 'Origin, Access-Control-Request-Method, Access-Control-Request-Headers'
+    })
+    return response
+
+
+def measure(label: str, handler, body: bytes, touch_data: bool) -> float:
+    best = float('inf')
+    for _ in range(ROUNDS):
+        response = make_response(body)
+        started = time.perf_counter()
+        api_response = handler(response)
+        if touch_data:
+            len(api_response.data)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<48} {best * 1000:8.1f} ms")
+    return best
+
+
+def main():
+    body = build_interview_history(TARGET_BYTES)
+    client = BaseApiClient()
+    print(f"Payload: {len(body) / 1024 / 1024:.2f} MB, JSON backend: {JSON_BACKEND}, best of {ROUNDS}\n")
+
+    legacy = measure("legacy: json + dict(headers) + dataclass", legacy_handle_response, body, touch_data=True)
+    current = measure("current: decode on access", client._handle_response, body, touch_data=True)
+    status_only = measure("current: status check only (no decode)", client._handle_response, body, touch_data=False)
+
+    print(f"\nSpeed-up with data access: {legacy / current:.1f}x")
+    print(f"Speed-up when data is unused: {legacy / status_only:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,147 @@
 import base64
+import os
 
 BACKEND_BASE_URL = "http://localhost:8080"
 BACKEND_BASE_PATH = "api/v1"
 DEFAULT_TIMEOUT = 120
+DEFAULT_CONNECT_TIMEOUT = 5
 DEFAULT_CONTENT_TYPE = "application/json"
 BEARER_PREFIX = "Bearer"
 HTTP_SUCCESS_MIN = 200
 HTTP_SUCCESS_MAX = 300
+HTTP_NOT_MODIFIED = 304
+HTTP_UNSUPPORTED_MEDIA_TYPE = 415
+
+POOL_SIZE = 20
+POOL_KEEP_ALIVE = True
+POOL_MAX_IDLE_SECONDS = 60
+POOL_ACQUIRE_TIMEOUT = 30
+
+VALIDATOR_CACHE_MAX_ENTRIES = 256
+
+# Client-side response cache, TTLs in seconds
+RESPONSE_CACHE_MAX_ENTRIES = 512
+CACHE_TTL_DOCUMENTS = 60
+CACHE_TTL_USERS = 30
+CACHE_TTL_CURRENT_USER = 30
+CACHE_TTL_ASSIGNED_INTERVIEWS = 10
+CACHE_TTL_INTERVIEW_HISTORY = 30
+
+# Document tables of contents and subsections are kept on disk across restarts, up to this many bytes (0 disables)
+DOCUMENT_CACHE_DIR = os.environ.get("QUALIFAIZE_DOCUMENT_CACHE_DIR",
+                                    os.path.join(os.path.expanduser("~"), ".cache", "qualifaize", "documents"))
+DOCUMENT_CACHE_MAX_BYTES = int(os.environ.get("QUALIFAIZE_DOCUMENT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Retries (idempotent requests only) and per-endpoint circuit breakers
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8
+RETRY_AFTER_MAX = 30
+BREAKER_WINDOW_SIZE = 20
+BREAKER_MIN_REQUESTS = 5
+BREAKER_FAILURE_RATE = 0.5
+BREAKER_OPEN_SECONDS = 30
+
+# Per service method timeout profiles in seconds (connect, read). With adaptive timeouts the read
+# timeout follows the endpoint's observed p99 * multiplier, kept between read_floor and read_ceiling.
+TIMEOUT_PROFILES = {
+    "fast": {"connect": 3, "read": 10, "read_floor": 2, "read_ceiling": 10},
+    "default": {"connect": 5, "read": 30, "read_floor": 5, "read_ceiling": 30},
+    "generation": {"connect": 5, "read": 120, "read_floor": 30, "read_ceiling": 120},
+    "upload": {"connect": 5, "read": 300, "read_floor": 60, "read_ceiling": 300},
+}
+ADAPTIVE_TIMEOUTS = False
+ADAPTIVE_TIMEOUT_WINDOW = 200
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+ADAPTIVE_TIMEOUT_MULTIPLIER = 1.5
+
+# Response encodings to negotiate, best first; br and zstd are only advertised when brotli/zstandard
+# are installed. Request bodies are compressed only when an encoding is set; a backend that answers a
+# compressed body with 415 gets that request again uncompressed, and no compressed bodies after it.
+RESPONSE_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+REQUEST_BODY_ENCODING = None
+REQUEST_COMPRESSION_MIN_BYTES = 16 * 1024
+
+# Uploads are streamed in chunks; at most UPLOAD_MAX_CONCURRENT run at once per process
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_MAX_CONCURRENT = 4
+UPLOAD_SLOT_TIMEOUT = 60
+
+# Files of at least RESUMABLE_UPLOAD_THRESHOLD bytes use the chunked, resumable upload protocol
+# (pdf/uploads) when the backend supports it; the manifest directory remembers unfinished uploads
+RESUMABLE_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+UPLOAD_PART_SIZE = 4 * 1024 * 1024
+UPLOAD_PARALLEL_PARTS = 4
+UPLOAD_PART_ROUNDS = 3
+UPLOAD_MANIFEST_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qualifaize", "uploads")
+
+# Streaming list endpoints: bytes per read, items a page renders before "Show more", and the
+# longest list a stream still stores in the response cache
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_RENDER_WINDOW = 48
+STREAM_CACHE_MAX_ITEMS = 1000
+
+# Interviews per page of the history page. INTERVIEW_HISTORY_ENDPOINT says whether the backend
+# has interview/history: "auto" probes it once per backend URL, "on" and "off" skip the probe
+HISTORY_PAGE_SIZE = 20
+INTERVIEW_HISTORY_ENDPOINT = os.environ.get("QUALIFAIZE_INTERVIEW_HISTORY", "auto").lower()
+
+# Prometheus metrics are served on this side port (0 disables it). The endpoint has no
+# authentication, so it only listens on loopback unless METRICS_HOST is set to e.g. 0.0.0.0
+METRICS_HOST = os.environ.get("QUALIFAIZE_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("QUALIFAIZE_METRICS_PORT", "9464"))
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Tracing: TRACING_EXPORTER is "none", "file" (JSON lines at TRACING_FILE_PATH) or "otlp"
+# (OTLP/HTTP JSON to TRACING_OTLP_ENDPOINT). TRACING_SAMPLE_RATIO of page runs are recorded.
+TRACING_EXPORTER = os.environ.get("QUALIFAIZE_TRACING_EXPORTER", "none")
+TRACING_SAMPLE_RATIO = float(os.environ.get("QUALIFAIZE_TRACING_SAMPLE_RATIO", "0.05"))
+TRACING_FILE_PATH = os.environ.get("QUALIFAIZE_TRACING_FILE",
+                                   os.path.join(os.path.expanduser("~"), ".cache", "qualifaize", "traces.jsonl"))
+TRACING_OTLP_ENDPOINT = os.environ.get("QUALIFAIZE_TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACING_SERVICE_NAME = "qualifaize-ui"
+TRACING_QUEUE_SIZE = 4096
+TRACING_EXPORT_BATCH_SIZE = 256
+TRACING_EXPORT_INTERVAL = 5
+
+# API transport: "passthrough" talks to the backend, "record" also appends every exchange to
+# API_CASSETTE_PATH, "replay" answers from that cassette offline, waiting the recorded latency
+# times REPLAY_LATENCY_SCALE (0 for no delay)
+API_TRANSPORT = os.environ.get("QUALIFAIZE_TRANSPORT", "passthrough")
+API_CASSETTE_PATH = os.environ.get("QUALIFAIZE_CASSETTE", "qualifaize_cassette.jsonl")
+REPLAY_LATENCY_SCALE = float(os.environ.get("QUALIFAIZE_REPLAY_LATENCY_SCALE", "1.0"))
+
+# Questions generated ahead per interview once an answer is accepted, and the threads doing it
+INTERVIEW_PREFETCH_DEPTH = 1
+PREFETCH_MAX_WORKERS = 8
+
+# Subsections of an opened document fetched in parallel per reader, and the threads doing it for all readers
+SUBSECTION_PREFETCH_CONCURRENCY = 4
+SUBSECTION_PREFETCH_MAX_WORKERS = 16
+
+# Assigned interviews are replicated per user: changes since the last sync are fetched at most every
+# ASSIGNED_SYNC_INTERVAL seconds, the whole list every ASSIGNED_FULL_SYNC_INTERVAL to drop removed ones
+ASSIGNED_SYNC_INTERVAL = 15
+ASSIGNED_FULL_SYNC_INTERVAL = 600
+ASSIGNED_REPLICA_MAX_USERS = 1000
+
+# Bulk operations (user import, interview assignment): requests in flight per run, requests per
+# second per run, and the threads shared by all runs
+BULK_CONCURRENCY = 8
+BULK_RATE_LIMIT = 50
+BULK_MAX_WORKERS = 32
+BULK_TICK_INTERVAL = 0.25
+
+# Batch PDF uploads: files in flight at once, at most UPLOAD_MAX_CONCURRENT (the process-wide cap)
+BATCH_UPLOAD_CONCURRENCY = 3
+
+# Bulk user import files; roles given to rows without a roles column
+USER_IMPORT_MAX_ROWS = 5000
+USER_IMPORT_DEFAULT_ROLES = ("GUEST", "USER")
+
+ASYNC_MAX_WORKERS = 20
+FAN_OUT_MAX_WORKERS = 16
+FAN_OUT_CALL_TIMEOUT = DEFAULT_TIMEOUT
 
 DIFFICULTY = ["EASY", "MEDIUM", "HARD"]
 
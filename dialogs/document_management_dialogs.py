@@ -1,5 +1,12 @@
 import time
+from datetime import datetime
+
 import streamlit as st
+
+from api_client.batch_upload import BatchUploadItem, read_title_mapping, title_from_filename, upload_documents
+from api_client.bulk import BulkResult
+from api_client.user_import import xlsx_supported
+from constants import BATCH_UPLOAD_CONCURRENCY, UPLOAD_MAX_CONCURRENT
 from utils import format_file_size
 
 
@@ -8,12 +15,17 @@ def upload_document_dialog(document_service):
 
     st.markdown("*Upload a PDF document to generate AI-powered interview questions*")
 
+    # A new key after each successful upload drops the previous file from Streamlit's memory
+    if 'document_uploader_generation' not in st.session_state:
+        st.session_state.document_uploader_generation = 0
+
     st.markdown("#### 📄 Select Document")
     uploaded_file = st.file_uploader(
         "Choose PDF file",
         type=['pdf'],
         help="Select a PDF document (max 50MB)",
-        accept_multiple_files=False
+        accept_multiple_files=False,
+        key=f"document_uploader_{st.session_state.document_uploader_generation}"
     )
 
     st.markdown("#### 📝 Document Details")
@@ -67,14 +79,33 @@ def upload_document_dialog(document_service):
                         st.write(f"Debug: File size: {uploaded_file.size}")
                         st.write(f"Debug: Document title: '{document_title.strip()}'")
 
+                        progress_bar = st.progress(0.0, text="Uploading...")
+                        last_percent = [-1]
+
+                        def report_progress(bytes_sent, total_bytes):
+                            # Only redraw when the whole percentage changes
+                            percent = bytes_sent * 100 // total_bytes if total_bytes else 100
+                            if percent != last_percent[0]:
+                                last_percent[0] = percent
+                                progress_bar.progress(
+                                    percent / 100,
+                                    text=f"Uploading... {format_file_size(bytes_sent)} of "
+                                         f"{format_file_size(total_bytes)}"
+                                )
+
                         # Upload the file
                         response = document_service.upload_pdf_from_buffer(
                             file_buffer=uploaded_file,
                             secondary_file_name=document_title.strip(),
-                            filename=uploaded_file.name
+                            filename=uploaded_file.name,
+                            progress_callback=report_progress
                         )
 
                         if response.is_success:
+                            progress_bar.progress(1.0, text="Upload complete")
+                            # Release the in-memory copy and reset the uploader for the next file
+                            uploaded_file.close()
+                            st.session_state.document_uploader_generation += 1
                             st.success(f"✅ Document '{document_title}' uploaded successfully!")
                             st.info("🔄 The page will refresh to show the new document...")
                             time.sleep(2)
@@ -136,4 +167,152 @@ def update_document_title_dialog(document_service, document_id, current_title):
                             st.error(f"❌ Update failed: {error_msg}")
 
                     except Exception as e:
-                        st.error(f"❌ Error updating title: {str(e)}")
\ No newline at end of file
+                        st.error(f"❌ Error updating title: {str(e)}")
+
+def batch_upload_documents_dialog(document_service):
+    """Dialog for uploading many PDF documents at once"""
+
+    st.markdown("*Upload several PDF documents at once; titles come from the filenames or a mapping file*")
+
+    if 'batch_uploader_generation' not in st.session_state:
+        st.session_state.batch_uploader_generation = 0
+    generation = st.session_state.batch_uploader_generation
+
+    st.markdown("#### 📄 Select Documents")
+    uploaded_files = st.file_uploader(
+        "Choose PDF files",
+        type=['pdf'],
+        help="Select any number of PDF documents (max 50MB each)",
+        accept_multiple_files=True,
+        key=f"batch_uploader_{generation}"
+    )
+
+    mapping_types = ["csv", "xlsx"] if xlsx_supported() else ["csv"]
+    mapping_file = st.file_uploader(
+        "Titles file (optional)",
+        type=mapping_types,
+        help="A file with filename and title columns; files it does not list are titled after their filename",
+        key=f"batch_titles_{generation}"
+    )
+
+    if not uploaded_files:
+        st.session_state.pop('batch_upload_result', None)
+        return
+
+    titles = {}
+    if mapping_file is not None:
+        try:
+            mapping_file.seek(0)
+            titles = read_title_mapping(mapping_file, mapping_file.name)
+        except (ValueError, UnicodeDecodeError) as e:
+            st.error(f"❌ Could not read the titles file: {str(e)}")
+
+    oversized = [file.name for file in uploaded_files if file.size > 50 * 1024 * 1024]
+    if oversized:
+        st.warning(f"⚠️ Skipping files over 50MB: {', '.join(oversized)}")
+    # Files are told apart by their uploader file_id; PDFs from different folders may share a name
+    files = [file for file in uploaded_files if file.size <= 50 * 1024 * 1024]
+
+    st.markdown("#### 📝 Document Titles")
+    edited_rows = st.data_editor(
+        [{"File": file.name, "Size": format_file_size(file.size),
+          "Title": titles.get(file.name) or title_from_filename(file.name)} for file in files],
+        disabled=["File", "Size"],
+        hide_index=True,
+        use_container_width=True,
+        key=f"batch_titles_editor_{generation}_{hash(tuple(file.file_id for file in files))}"
+    )
+    if hasattr(edited_rows, "to_dict"):
+        edited_rows = edited_rows.to_dict("records")
+    # Rows cannot be added or removed, so they stay in the order of the files
+    items = [BatchUploadItem(file=file, filename=file.name, title=str(row["Title"] or "").strip(), size=file.size)
+             for file, row in zip(files, edited_rows)]
+    untitled = [item.filename for item in items if not item.title]
+
+    concurrency = st.slider(
+        "Parallel uploads",
+        min_value=1,
+        max_value=UPLOAD_MAX_CONCURRENT,
+        value=min(BATCH_UPLOAD_CONCURRENCY, UPLOAD_MAX_CONCURRENT),
+        help="How many files are sent at the same time"
+    )
+
+    st.divider()
+
+    result_state = st.session_state.get('batch_upload_result')
+    if result_state is not None and result_state['generation'] != generation:
+        result_state = None
+
+    if result_state is not None:
+        if result_state['failed']:
+            st.warning(f"⚠️ Uploaded {result_state['uploaded']} of {len(items)} documents; "
+                       f"{len(result_state['failed'])} failed")
+        else:
+            st.success(f"✅ Uploaded all {result_state['uploaded']} documents")
+        outcomes = list(result_state['outcomes'].values())
+        st.dataframe([{"File": outcome.item.filename, "Title": outcome.item.title,
+                       "Result": "✅ Uploaded" if outcome.success else f"❌ {outcome.error}"}
+                      for outcome in outcomes],
+                     hide_index=True, use_container_width=True)
+        st.download_button(
+            "📄 Download Report",
+            data=BulkResult(outcomes=outcomes).report_csv(BatchUploadItem.describe),
+            file_name=f"document_upload_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+    pending = [item for item in items
+               if result_state is None or item.file.file_id in result_state['failed']]
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if st.button("✅ Done" if result_state is not None else "❌ Cancel", use_container_width=True):
+            if result_state is not None:
+                st.session_state.pop('batch_upload_result', None)
+                st.session_state.batch_uploader_generation += 1
+            st.rerun()
+
+    with col2:
+        label = (f"🔁 Retry {len(pending)} Failed Files" if result_state is not None
+                 else f"🚀 Upload {len(pending)} Documents")
+        start = st.button(label, type="primary", use_container_width=True, disabled=not pending or bool(untitled))
+        if untitled:
+            st.caption(f"Enter a title for: {', '.join(untitled)}")
+
+    if not start:
+        return
+
+    progress_bars = {index: st.progress(0.0, text=f"{item.filename}: waiting...")
+                     for index, item in enumerate(pending)}
+
+    def redraw(sent):
+        for index, (bytes_sent, total_bytes) in sent.items():
+            if index in progress_bars:
+                progress_bars[index].progress(
+                    bytes_sent / total_bytes if total_bytes else 1.0,
+                    text=f"{pending[index].filename}: {format_file_size(bytes_sent)} of "
+                         f"{format_file_size(total_bytes)}"
+                )
+
+    def finished(done, total, outcome):
+        bar = progress_bars.pop(outcome.index)
+        if outcome.success:
+            bar.progress(1.0, text=f"✅ {outcome.item.filename}")
+        else:
+            bar.progress(0.0, text=f"❌ {outcome.item.filename}: {outcome.error}")
+
+    result = upload_documents(document_service, pending, concurrency=concurrency,
+                              progress_callback=finished, byte_progress=redraw)
+
+    # A retry replaces the outcome of each file it sends again
+    outcomes = dict(result_state['outcomes']) if result_state is not None else {}
+    outcomes.update({outcome.item.file.file_id: outcome for outcome in result.outcomes})
+    st.session_state.batch_upload_result = {
+        'generation': generation,
+        'uploaded': sum(1 for outcome in outcomes.values() if outcome.success),
+        'failed': [outcome.item.file.file_id for outcome in result.failed],
+        'outcomes': outcomes
+    }
+    st.rerun(scope="fragment")
@@ -1,4 +1,8 @@
 import streamlit as st
+from api_client.fan_out import gather
+from api_client.interview_assignment import assign_interviews, read_usernames, resolve_usernames, \
+    staggered_assignments
+from api_client.user_import import xlsx_supported
 from api_client.services.interview_service import InterviewService
 from api_client.services.document_service import DocumentService
 from api_client.services.user_service import UserService
@@ -17,6 +21,12 @@ def assign_interview_dialog():
     document_service = DocumentService()
     user_service = UserService()
 
+    # Documents and users are independent, load them concurrently
+    documents_response, users_response = gather(
+        document_service.get_all_documents,
+        user_service.get_all_users
+    )
+
     st.markdown("*Create and assign interviews based on uploaded documents*")
 
     # Interview Basic Information
@@ -88,7 +98,6 @@ def assign_interview_dialog():
 
     # Document Selection
     st.markdown("#### 📄 Base Document")
-    documents_response = document_service.get_all_documents()
     selected_document_id = None
 
     if documents_response.is_success and documents_response.data:
@@ -110,8 +119,18 @@ def assign_interview_dialog():
 
     # User Assignment (Required)
     st.markdown("#### 👤 Assign to User")
-    users_response = user_service.get_all_users()
     selected_user_id = None
+    selected_user_display = None
+    bulk_users = {}
+
+    assignment_mode = st.radio(
+        "Assign to",
+        options=["One user", "Many users"],
+        horizontal=True,
+        label_visibility="collapsed",
+        help="Many users creates the same interview once for every selected user"
+    )
+    bulk_mode = assignment_mode == "Many users"
 
     if users_response.is_success and users_response.data:
         user_options = {}
@@ -133,17 +152,40 @@ def assign_interview_dialog():
 
             user_options[display_name] = user['userId']
 
-        selected_user_display = st.selectbox(
-            "Select User *",
-            options=[None] + list(user_options.keys()),
-            format_func=lambda x: "-- Select a user --" if x is None else x,
-            help="Choose the user who will take this interview"
-        )
-        selected_user_id = user_options.get(selected_user_display) if selected_user_display else None
+        if bulk_mode:
+            bulk_users = render_bulk_user_selection(user_options, users_response.data)
+        else:
+            selected_user_display = st.selectbox(
+                "Select User *",
+                options=[None] + list(user_options.keys()),
+                format_func=lambda x: "-- Select a user --" if x is None else x,
+                help="Choose the user who will take this interview"
+            )
+            selected_user_id = user_options.get(selected_user_display) if selected_user_display else None
     else:
         st.error("❌ Could not load users. Cannot create interview without user assignment.")
         selected_user_id = None
 
+    stagger_minutes = 0
+    if bulk_mode and len(bulk_users) > 1:
+        stagger_minutes = st.number_input(
+            "Minutes between interviews",
+            min_value=0,
+            max_value=24 * 60,
+            value=0,
+            step=15,
+            help="0 schedules every interview at the selected time; otherwise each user's interview "
+                 "starts this many minutes after the previous one, in the order listed"
+        )
+        if stagger_minutes:
+            last_start = scheduled_datetime + timedelta(minutes=stagger_minutes * (len(bulk_users) - 1))
+            st.caption(f"The last interview starts {last_start.strftime('%A, %B %d, %Y at %I:%M %p')}")
+
+    bulk_result_state = st.session_state.get('bulk_assignment_result')
+    if bulk_mode and bulk_result_state is not None:
+        st.divider()
+        render_bulk_assignment_result(bulk_result_state)
+        return
 
     # Dialog Action Buttons
     st.divider()
@@ -159,12 +201,28 @@ def assign_interview_dialog():
                 interview_description and interview_description.strip() and
                 difficulty_level and
                 selected_document_id and
-                selected_user_id and
+                (bulk_users if bulk_mode else selected_user_id) and
                 schedule_date and
                 schedule_time
         )
 
-        if st.button(
+        if bulk_mode:
+            if st.button(
+                    f"🚀 Create {len(bulk_users)} Interviews",
+                    type="primary",
+                    use_container_width=True,
+                    disabled=create_disabled
+            ):
+                st.session_state.bulk_assignment_result = create_bulk_interviews(
+                    interview_service,
+                    staggered_assignments(bulk_users, scheduled_datetime, timedelta(minutes=stagger_minutes)),
+                    name=interview_name.strip(),
+                    document_id=selected_document_id,
+                    description=interview_description.strip(),
+                    difficulty=difficulty_level
+                )
+                st.rerun(scope="fragment")
+        elif st.button(
                 "🚀 Create Interview",
                 type="primary",
                 use_container_width=True,
@@ -230,6 +288,94 @@ def assign_interview_dialog():
         - **HARD**: Advanced questions requiring deep understanding
         """)
 
+def render_bulk_user_selection(user_options, users):
+    """Pick users from the list and/or a file of usernames; returns {username: user_id} in selection order"""
+    usernames_by_id = {user['userId']: user.get('username', '') for user in users if user.get('userId')}
+
+    selected_displays = st.multiselect(
+        "Select Users",
+        options=list(user_options.keys()),
+        help="Every selected user gets their own copy of this interview"
+    )
+    selected = {usernames_by_id[user_options[display]]: user_options[display] for display in selected_displays}
+
+    file_types = ["csv", "xlsx"] if xlsx_supported() else ["csv"]
+    usernames_file = st.file_uploader(
+        "Or add users from a file",
+        type=file_types,
+        help="A file with a username column, one user per row"
+    )
+    if usernames_file is not None:
+        try:
+            usernames_file.seek(0)
+            file_users, unknown = resolve_usernames(read_usernames(usernames_file, usernames_file.name), users)
+        except (ValueError, UnicodeDecodeError) as e:
+            st.error(f"❌ Could not read the file: {str(e)}")
+        else:
+            if unknown:
+                st.warning(f"⚠️ {len(unknown)} usernames are not known and will be skipped: "
+                           f"{', '.join(unknown[:20])}{' ...' if len(unknown) > 20 else ''}")
+            for username, user_id in file_users.items():
+                selected.setdefault(username, user_id)
+
+    if selected:
+        st.caption(f"👥 {len(selected)} users selected")
+    return selected
+
+
+def create_bulk_interviews(interview_service, assignments, **interview):
+    """Create one interview per assignment concurrently, showing progress; returns the state to render"""
+    progress_bar = st.progress(0.0, text="Creating interviews...")
+    failures = []
+
+    def on_progress(done, total, outcome):
+        if not outcome.success:
+            failures.append(outcome)
+        progress_bar.progress(done / total,
+                              text=f"Created {done - len(failures)} of {total} interviews, {len(failures)} failed")
+
+    result = assign_interviews(interview_service, assignments, progress_callback=on_progress, **interview)
+    return {
+        'name': interview['name'],
+        'created': len(result.succeeded),
+        'failed': len(result.failed),
+        'elapsed': result.elapsed,
+        'rows': [{"User": f"@{outcome.item.username}",
+                  "Scheduled": outcome.item.scheduled_date,
+                  "Result": "✅ Created" if outcome.success else f"❌ {outcome.error}"}
+                 for outcome in result.outcomes],
+        'report': result.report_csv(lambda assignment: assignment.describe())
+    }
+
+
+def render_bulk_assignment_result(result_state):
+    """Per-user results of a bulk assignment, kept across the reruns its buttons cause"""
+    if result_state['failed']:
+        st.warning(f"⚠️ Created '{result_state['name']}' for {result_state['created']} users in "
+                   f"{result_state['elapsed']:.1f}s; {result_state['failed']} failed")
+    else:
+        st.success(f"✅ Created '{result_state['name']}' for {result_state['created']} users in "
+                   f"{result_state['elapsed']:.1f}s")
+
+    st.dataframe(result_state['rows'], hide_index=True, use_container_width=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.download_button(
+            "📄 Download Report",
+            data=result_state['report'],
+            file_name=f"interview_assignment_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+    with col2:
+        if st.button("✅ Done", type="primary", use_container_width=True):
+            st.session_state.pop('bulk_assignment_result', None)
+            st.rerun()
+
+
 def completion_dialog(total_questions, correct_answers, accuracy):
     """Show completion dialog with results"""
 
@@ -3,6 +3,9 @@ from datetime import date, datetime
 
 import streamlit as st
 
+from api_client.user_import import import_users, parse_user_import, user_import_report, xlsx_supported
+from constants import USER_IMPORT_DEFAULT_ROLES
+
 
 def add_new_user_dialog(user_service):
     """Dialog for adding new users"""
@@ -284,4 +287,111 @@ def edit_user_dialog(user_id, current_user_data, user_service):
                         st.error(f"❌ Role change failed: {error_msg}")
 
                 except Exception as e:
-                    st.error(f"❌ Error changing role: {str(e)}")
\ No newline at end of file
+                    st.error(f"❌ Error changing role: {str(e)}")
+
+def bulk_import_users_dialog(user_service):
+    """Dialog for registering many users from a CSV or XLSX file"""
+
+    st.markdown("*Create user accounts from a spreadsheet, one user per row*")
+
+    file_types = ["csv", "xlsx"] if xlsx_supported() else ["csv"]
+    st.caption("Columns: username, email, firstName, lastName, password, birthDate (YYYY-MM-DD) "
+               f"and optionally roles (e.g. \"GUEST USER\", default {' '.join(USER_IMPORT_DEFAULT_ROLES)})")
+    uploaded_file = st.file_uploader(
+        "Users file *",
+        type=file_types,
+        help="Rows are checked before any user is created" +
+             ("" if "xlsx" in file_types else "; install openpyxl to import .xlsx files")
+    )
+
+    if uploaded_file is None:
+        st.session_state.pop('user_import_result', None)
+        return
+
+    # Keep the outcome of an import for this file across the reruns its download button causes
+    result_state = st.session_state.get('user_import_result')
+    if result_state is not None and result_state['file_id'] != uploaded_file.file_id:
+        st.session_state.pop('user_import_result')
+        result_state = None
+
+    try:
+        uploaded_file.seek(0)
+        rows = parse_user_import(uploaded_file, uploaded_file.name)
+    except (ValueError, UnicodeDecodeError) as e:
+        st.error(f"❌ Could not read the file: {str(e)}")
+        return
+
+    valid_rows = [row for row in rows if row.valid]
+    invalid_rows = [row for row in rows if not row.valid]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rows", len(rows))
+    col2.metric("Ready to import", len(valid_rows))
+    col3.metric("With errors", len(invalid_rows))
+
+    if invalid_rows:
+        with st.expander(f"⚠️ {len(invalid_rows)} rows will be skipped", expanded=not valid_rows):
+            st.dataframe([{"Line": row.line, "Username": row.username, "Errors": "; ".join(row.errors)}
+                          for row in invalid_rows],
+                         hide_index=True, use_container_width=True)
+
+    st.divider()
+
+    if result_state is None:
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            if st.button("❌ Cancel", use_container_width=True):
+                st.rerun()
+
+        with col2:
+            start = st.button(
+                f"🚀 Import {len(valid_rows)} Users",
+                type="primary",
+                use_container_width=True,
+                disabled=not valid_rows
+            )
+
+        if not start:
+            return
+
+        progress_bar = st.progress(0.0, text="Creating users...")
+        failures = []
+
+        def on_progress(done, total, outcome):
+            if not outcome.success:
+                failures.append(outcome)
+            progress_bar.progress(done / total,
+                                  text=f"Created {done - len(failures)} of {total} users, {len(failures)} failed")
+
+        result = import_users(user_service, rows, progress_callback=on_progress)
+        result_state = {
+            'file_id': uploaded_file.file_id,
+            'created': len(result.succeeded),
+            'failed': len(result.failed),
+            'elapsed': result.elapsed,
+            'report': user_import_report(rows, result)
+        }
+        st.session_state.user_import_result = result_state
+
+    if result_state['failed']:
+        st.warning(f"⚠️ Created {result_state['created']} users in {result_state['elapsed']:.1f}s; "
+                   f"{result_state['failed']} failed")
+    else:
+        st.success(f"✅ Created {result_state['created']} users in {result_state['elapsed']:.1f}s")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.download_button(
+            "📄 Download Report",
+            data=result_state['report'],
+            file_name=f"user_import_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+    with col2:
+        if st.button("✅ Done", type="primary", use_container_width=True):
+            st.session_state.pop('user_import_result', None)
+            st.rerun()
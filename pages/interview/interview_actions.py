@@ -1,13 +1,16 @@
 import streamlit as st
 
-from dialogs.interview_page_dialogs import completion_dialog
+from api_client.question_prefetch import QuestionPrefetcher
+from api_client.tracing import get_tracer
+
 from pages.interview.interview_state_manager import set_interview_active, get_interview_state, set_current_question, \
-    add_question_to_history, update_progress, set_answer_feedback, reset_interview_state
+    add_question_to_history, update_progress, set_answer_feedback, reset_interview_state, get_question_prefetcher, \
+    set_question_prefetcher, set_interview_completed, set_interview_error, update_interview_state
 
+# These actions are widget callbacks: they run before the script run the click causes and only
+# update the state that run renders, so they never call st.rerun() and report errors through
+# set_interview_error instead of drawing them.
 
-@st.dialog("🎉 Interview Completed!", width="large")
-def show_completion_dialog(total_questions, correct_answers, accuracy):
-    completion_dialog(total_questions, correct_answers, accuracy)
 
 def start_interview(interview_service, interview_id, interview_name):
     """Start an interview and change status to IN_PROGRESS"""
@@ -21,38 +24,57 @@ def start_interview(interview_service, interview_id, interview_name):
 
                 # Get first question
                 get_next_question(interview_service)
-                st.success("Interview started successfully!")
-                st.rerun()
             else:
-                st.error(f"Failed to start interview: {response.error}")
+                set_interview_error(f"Failed to start interview: {response.error}")
         except Exception as e:
-            st.error(f"Error starting interview: {str(e)}")
+            set_interview_error(f"Error starting interview: {str(e)}")
+
+
+def question_prefetcher(interview_service, interview_id):
+    """Get the question prefetcher of this interview, creating it if needed"""
+    prefetcher = get_question_prefetcher()
+    if prefetcher is None or prefetcher.interview_id != interview_id:
+        prefetcher = QuestionPrefetcher(interview_service, interview_id)
+        set_question_prefetcher(prefetcher)
+    return prefetcher
 
 
 def get_next_question(interview_service):
-    """Fetch the next question from the API"""
+    """Fetch the next question, from the prefetch queue when it already has it"""
     interview_state = get_interview_state()
     interview_id = interview_state["interview_id"]
 
-    with st.spinner("Loading next question..."):
+    with st.spinner("Loading next question..."), \
+            get_tracer().start_span("interview.get_next_question", attributes={'interview.id': interview_id}) as span:
         try:
-            response = interview_service.get_next_question(interview_id)
+            response = question_prefetcher(interview_service, interview_id).take()
+            if span is not None:
+                span.set_attribute('interview.prefetched', response is not None)
+            if response is None:
+                response = interview_service.get_next_question(interview_id)
             if response.is_success:
                 question_data = response.data
                 set_current_question(question_data)
-                st.rerun()
             else:
-                st.error(f"Failed to load question: {response.error}")
                 # If no more questions, complete the interview
                 if "no more questions" in str(response.error).lower():
                     complete_interview(interview_service)
+                else:
+                    set_interview_error(f"Failed to load question: {response.error}")
         except Exception as e:
-            st.error(f"Error loading question: {str(e)}")
+            set_interview_error(f"Error loading question: {str(e)}")
 
 
-def submit_answer(interview_service, question_id, selected_answer):
-    """Submit the selected answer"""
-    with st.spinner("Submitting answer..."):
+def submit_answer(interview_service, question_id, answer_key):
+    """Submit the answer selected in the radio stored under answer_key"""
+    selected_answer = st.session_state.get(answer_key)
+    if selected_answer is None:
+        set_interview_error("Select an answer first")
+        return
+    update_interview_state("selected_answer", selected_answer)
+
+    with st.spinner("Submitting answer..."), \
+            get_tracer().start_span("interview.submit_answer", attributes={'question.id': question_id}):
         try:
             response = interview_service.submit_answer(question_id, selected_answer)
             if response.is_success:
@@ -78,18 +100,19 @@ def submit_answer(interview_service, question_id, selected_answer):
                     complete_interview(interview_service)
                     return
 
+                # Generate the next question while the candidate reads the feedback
+                question_prefetcher(interview_service, interview_state["interview_id"]).schedule()
+
                 # Show result and wait for next question
                 set_answer_feedback(answer_data)
-
-                st.rerun()
             else:
-                st.error(f"Failed to submit answer: {response.error}")
+                set_interview_error(f"Failed to submit answer: {response.error}")
         except Exception as e:
-            st.error(f"Error submitting answer: {str(e)}")
+            set_interview_error(f"Error submitting answer: {str(e)}")
 
 
 def complete_interview(interview_service):
-    """Complete the interview and return to normal view"""
+    """Record the final statistics; the page shows them and returns to the normal view"""
     interview_state = get_interview_state()
 
     # Calculate final statistics
@@ -99,11 +122,7 @@ def complete_interview(interview_service):
                           if q.get("is_correct", False) == True)
     accuracy = (correct_answers / total_questions * 100) if total_questions > 0 else 0
 
-    # Show completion dialog
-    show_completion_dialog(total_questions, correct_answers, accuracy)
-
-    # Reset interview state
-    reset_interview_state()
+    set_interview_completed(total_questions, correct_answers, accuracy)
 
 
 def cancel_interview(interview_service):
@@ -115,7 +134,7 @@ def cancel_interview(interview_service):
     try:
         response = interview_service.change_interview_status(interview_id, "CANCELLED")
     except Exception as e:
-        st.warning(f"Could not update interview status: {str(e)}")
+        set_interview_error(f"Could not update interview status: {str(e)}")
 
     # Reset interview state
-    reset_interview_state()
\ No newline at end of file
+    reset_interview_state()
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from pages.interview.interview_state_manager import get_interview_state
+from pages.interview.interview_state_manager import get_interview_state, get_question_prefetcher
 
 
 def render_answer_feedback(get_next_question, interview_service):
@@ -85,12 +85,15 @@ def render_statistics(interview_state):
 def render_next_question_button(interview_state, get_next_question, interview_service):
     """Render the next question button"""
     next_question_key = f"next_question_btn_{len(interview_state['question_history'])}"
-    if st.button("➡️ Next Question",
-                 type="primary",
-                 use_container_width=True,
-                 help="Continue to the next question",
-                 key=next_question_key):
-        get_next_question(interview_service)
+    prefetcher = get_question_prefetcher()
+    next_ready = prefetcher is not None and prefetcher.ready()
+    st.button("➡️ Next Question",
+              type="primary",
+              use_container_width=True,
+              help="The next question is ready" if next_ready else "Continue to the next question",
+              key=next_question_key,
+              on_click=get_next_question,
+              args=(interview_service,))
 
 
 def render_question_history_sidebar():
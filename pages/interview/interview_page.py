@@ -1,13 +1,16 @@
+import time
+
 import streamlit as st
 from datetime import datetime
 import constants
+from api_client.interview_replica import get_assigned_interview_replica
 from api_client.services.interview_service import InterviewService
 from custom_styles import interview_page_styles
-from dialogs.interview_page_dialogs import assign_interview_dialog
+from dialogs.interview_page_dialogs import assign_interview_dialog, completion_dialog
 from pages.interview.interview_actions import start_interview, submit_answer, get_next_question, cancel_interview
 from pages.interview.interview_components import render_answer_feedback
 from pages.interview.interview_state_manager import get_interview_state, initialize_interview_state, \
-    reset_interview_state
+    reset_interview_state, count_interview_page_run, pop_interview_error, PHASE_FEEDBACK, PHASE_COMPLETED
 
 st.set_page_config(page_title="Interview - QualifAIze", layout="wide", page_icon="🎯")
 
@@ -20,6 +23,7 @@ user_roles = current_user.get('roles', [])
 is_admin = constants.ROLE_ADMIN in user_roles
 
 initialize_interview_state()
+count_interview_page_run()
 
 
 @st.dialog("Assign New Interview", width="large")
@@ -27,6 +31,11 @@ def show_assign_dialog():
     assign_interview_dialog()
 
 
+@st.dialog("🎉 Interview Completed!", width="large")
+def show_completion_dialog(total_questions, correct_answers, accuracy):
+    completion_dialog(total_questions, correct_answers, accuracy)
+
+
 def render_interview_view():
     """Render the active interview interface"""
     interview_state = get_interview_state()
@@ -49,13 +58,13 @@ def render_interview_view():
         st.progress(progress / 100, text=f"Progress: {progress}%")
 
     with progress_col2:
-        if st.button("❌ Quit",
-                     type="secondary",
-                     use_container_width=True,
-                     help="Quit interview",
-                     key="quit_interview_btn"):
-            cancel_interview(interview_service)
-            st.rerun()
+        st.button("❌ Quit",
+                  type="secondary",
+                  use_container_width=True,
+                  help="Quit interview",
+                  key="quit_interview_btn",
+                  on_click=cancel_interview,
+                  args=(interview_service,))
 
     st.divider()
 
@@ -65,7 +74,7 @@ def render_interview_view():
         st.info("🔄 Loading question...")
         return
 
-    if interview_state["is_waiting_for_next"]:
+    if interview_state["phase"] == PHASE_FEEDBACK:
         render_answer_feedback(get_next_question, interview_service)
     else:
         render_current_question(current_question)
@@ -99,27 +108,27 @@ def render_current_question(current_question):
         "D": current_question['optionD']
     }
 
-    selected_option = st.radio(
-        "Select one:",
-        options=list(options.keys()),
-        format_func=lambda x: f"**{x}.** {options[x]}",
-        key=f"question_{current_question['questionId']}_radio",
-        help="Choose the best answer from the options below"
-    )
-
-    st.session_state.current_interview_state["selected_answer"] = selected_option
+    # Inside a form, picking an option does not rerun the script; only submitting does
+    answer_key = f"question_{current_question['questionId']}_radio"
+    with st.form(key=f"question_{current_question['questionId']}_form", border=False):
+        st.radio(
+            "Select one:",
+            options=list(options.keys()),
+            format_func=lambda x: f"**{x}.** {options[x]}",
+            key=answer_key,
+            help="Choose the best answer from the options below"
+        )
 
-    st.divider()
+        st.divider()
 
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("📤 Submit Answer",
-                     type="primary",
-                     use_container_width=True,
-                     disabled=selected_option is None,
-                     help="Submit your selected answer",
-                     key=f"submit_answer_{current_question['questionId']}_btn"):
-            submit_answer(interview_service, current_question['questionId'], selected_option)
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.form_submit_button("📤 Submit Answer",
+                                  type="primary",
+                                  use_container_width=True,
+                                  help="Submit your selected answer",
+                                  on_click=submit_answer,
+                                  args=(interview_service, current_question['questionId'], answer_key))
 
 
 def render_normal_view():
@@ -131,17 +140,22 @@ def render_normal_view():
                      icon="🚀",
                      use_container_width=True,
                      key="assign_new_interview_btn"):
+            # Results of an earlier bulk assignment are not shown in a newly opened dialog
+            st.session_state.pop('bulk_assignment_result', None)
             show_assign_dialog()
         st.divider()
 
-    try:
-        assigned_interviews_response = interview_service.get_assigned_interviews(status="SCHEDULED")
-    except Exception as e:
-        st.error(f"Error loading interviews: {str(e)}")
+    replica = get_assigned_interview_replica()
+    # The cards below read the replica after this sync, so this run needs no rerun to show changes
+    st.session_state.assigned_interviews_full_run = True
+    sync_assigned_interviews()
+    if not replica.synced:
         return
 
-    if assigned_interviews_response.is_success and assigned_interviews_response.data and len(
-            assigned_interviews_response.data) > 0:
+    # Read before the interviews, so a change landing in between only costs one extra rerun
+    st.session_state.assigned_interviews_version = replica.version
+    assigned_interviews = replica.interviews(status="SCHEDULED")
+    if assigned_interviews:
         st.markdown("""
         <div class="interview-container">
             <h3 style="margin-top: 0; color: #1f2937;">
@@ -153,12 +167,35 @@ def render_normal_view():
         </div>
         """, unsafe_allow_html=True)
 
-        for interview in assigned_interviews_response.data:
+        for interview in assigned_interviews:
             render_interview_card(interview)
     else:
         render_empty_state()
 
 
+@st.fragment(run_every=constants.ASSIGNED_SYNC_INTERVAL)
+def sync_assigned_interviews():
+    """Bring the assigned interviews replica up to date; rerun the page when it is newer than the cards"""
+    replica = get_assigned_interview_replica()
+    full_run = st.session_state.pop('assigned_interviews_full_run', False)
+    try:
+        error = replica.sync(interview_service).error
+    except Exception as e:
+        error = str(e)
+
+    if error and not replica.synced:
+        st.error(f"Error loading interviews: {error}")
+        return
+    if not full_run and replica.version != st.session_state.get('assigned_interviews_version'):
+        # Only the fragment reran; the cards outside it need a full run to show the change, which
+        # may have come from a sync in another session of the same user
+        st.rerun()
+
+    if replica.last_synced_at is not None:
+        seconds = int(time.monotonic() - replica.last_synced_at)
+        st.caption(f"🔄 Updated {seconds}s ago" if seconds else "🔄 Up to date")
+
+
 def render_interview_card(interview):
     """Render individual interview card"""
     with st.container(border=True):
@@ -212,12 +249,13 @@ def render_interview_card(interview):
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             start_button_key = f"start_interview_{interview_id}_btn"
-            if st.button(f"🚀 Start Interview: {interview_name}",
-                         key=start_button_key,
-                         type="primary",
-                         use_container_width=True,
-                         help=f"Begin the {interview.get('difficulty', 'MEDIUM').lower()} difficulty interview"):
-                start_interview(interview_service, interview_id, interview_name)
+            st.button(f"🚀 Start Interview: {interview_name}",
+                      key=start_button_key,
+                      type="primary",
+                      use_container_width=True,
+                      help=f"Begin the {interview.get('difficulty', 'MEDIUM').lower()} difficulty interview",
+                      on_click=start_interview,
+                      args=(interview_service, interview_id, interview_name))
 
         st.divider()
 
@@ -248,7 +286,17 @@ def render_empty_state():
         """, unsafe_allow_html=True)
 
 
-if st.session_state.current_interview_state["is_active"]:
+interview_error = pop_interview_error()
+if interview_error:
+    st.error(interview_error)
+
+if st.session_state.current_interview_state["phase"] == PHASE_COMPLETED:
+    # Shown once: the state is reset in the same run, so the next run is the normal view
+    completion_summary = st.session_state.current_interview_state["completion_summary"]
+    reset_interview_state()
+    show_completion_dialog(**completion_summary)
+    render_normal_view()
+elif st.session_state.current_interview_state["is_active"]:
     render_interview_view()
 else:
     render_normal_view()
@@ -1,5 +1,11 @@
 import streamlit as st
 
+# The answer cycle: a question is shown, the answer's feedback is shown, and after the last
+# answer the completion summary is shown once
+PHASE_QUESTION = "question"
+PHASE_FEEDBACK = "feedback"
+PHASE_COMPLETED = "completed"
+
 def initialize_interview_state():
     """Initialize interview state if not exists"""
     if "current_interview_state" not in st.session_state:
@@ -11,12 +17,14 @@ def initialize_interview_state():
             "selected_answer": None,
             "progress": 0,
             "question_history": [],
-            "is_waiting_for_next": False,
-            "last_answer_result": None
+            "phase": PHASE_QUESTION,
+            "last_answer_result": None,
+            "completion_summary": None
         }
 
 def reset_interview_state():
     """Reset interview state to default"""
+    cancel_question_prefetch()
     st.session_state.current_interview_state = {
         "is_active": False,
         "interview_id": None,
@@ -25,8 +33,9 @@ def reset_interview_state():
         "selected_answer": None,
         "progress": 0,
         "question_history": [],
-        "is_waiting_for_next": False,
-        "last_answer_result": None
+        "phase": PHASE_QUESTION,
+        "last_answer_result": None,
+        "completion_summary": None
     }
 
 def get_interview_state():
@@ -39,6 +48,7 @@ def update_interview_state(key, value):
 
 def set_interview_active(interview_id, interview_name):
     """Set interview as active"""
+    cancel_question_prefetch()
     st.session_state.current_interview_state.update({
         "is_active": True,
         "interview_id": interview_id,
@@ -47,8 +57,9 @@ def set_interview_active(interview_id, interview_name):
         "selected_answer": None,
         "progress": 0,
         "question_history": [],
-        "is_waiting_for_next": False,
-        "last_answer_result": None
+        "phase": PHASE_QUESTION,
+        "last_answer_result": None,
+        "completion_summary": None
     })
 
 def add_question_to_history(question_info):
@@ -60,17 +71,56 @@ def set_current_question(question_data):
     st.session_state.current_interview_state.update({
         "current_question": question_data,
         "selected_answer": None,
-        "is_waiting_for_next": False,
+        "phase": PHASE_QUESTION,
         "last_answer_result": None
     })
 
 def set_answer_feedback(answer_data):
     """Set answer feedback data"""
     st.session_state.current_interview_state.update({
-        "is_waiting_for_next": True,
+        "phase": PHASE_FEEDBACK,
         "last_answer_result": answer_data
     })
 
+def set_interview_completed(total_questions, correct_answers, accuracy):
+    """Mark the interview as completed; the page shows the summary and resets the state"""
+    st.session_state.current_interview_state.update({
+        "phase": PHASE_COMPLETED,
+        "completion_summary": {
+            "total_questions": total_questions,
+            "correct_answers": correct_answers,
+            "accuracy": accuracy
+        }
+    })
+
 def update_progress(progress):
     """Update interview progress"""
-    st.session_state.current_interview_state["progress"] = progress
\ No newline at end of file
+    st.session_state.current_interview_state["progress"] = progress
+
+def get_question_prefetcher():
+    """Get the question prefetcher of the active interview, if any"""
+    return st.session_state.get("question_prefetcher")
+
+def set_question_prefetcher(prefetcher):
+    """Replace the question prefetcher, cancelling the previous one"""
+    cancel_question_prefetch()
+    st.session_state.question_prefetcher = prefetcher
+
+def cancel_question_prefetch():
+    """Cancel and drop the question prefetcher"""
+    prefetcher = st.session_state.pop("question_prefetcher", None)
+    if prefetcher is not None:
+        prefetcher.cancel()
+
+def set_interview_error(message):
+    """Remember an error raised in a widget callback so the page can show it"""
+    st.session_state.interview_error = message
+
+def pop_interview_error():
+    """Get and clear the error of the last widget callback"""
+    return st.session_state.pop("interview_error", None)
+
+def count_interview_page_run():
+    """Count executions of the interview page script; one user action should cause one"""
+    st.session_state.interview_page_runs = st.session_state.get("interview_page_runs", 0) + 1
+    return st.session_state.interview_page_runs
@@ -1,6 +1,7 @@
 import streamlit as st
 
-from api_client.services.interview_service import InterviewService
+from api_client.services.interview_service import InterviewService, HISTORY_STATUSES
+from constants import HISTORY_PAGE_SIZE
 from custom_styles import interview_page_styles, history_page_styles
 
 st.set_page_config(page_title="Interview History - QualifAIze", layout="wide", page_icon="📋")
@@ -173,8 +174,20 @@ def render_question_details(questions):
                 st.divider()
 
 
+def summary_stats(interview):
+    """Performance statistics of an interview summary (question counts instead of questions)"""
+    answered = interview.get('answeredCount', 0)
+    correct = interview.get('correctCount', 0)
+    return {
+        'total': interview.get('questionCount', 0),
+        'answered': answered,
+        'correct': correct,
+        'accuracy': (correct / answered * 100) if answered > 0 else 0.0
+    }
+
+
 def render_interview_summary(interview):
-    """Render summary information for interview in expanded state"""
+    """Render the one-line summary of an interview"""
     created_by = interview.get('createdBy', {})
     created_by_name = f"{created_by.get('firstName', '')} {created_by.get('lastName', '')}".strip()
     if not created_by_name:
@@ -183,7 +196,7 @@ def render_interview_summary(interview):
     difficulty = interview.get('difficulty', 'MEDIUM')
     difficulty_color = get_difficulty_color(difficulty)
 
-    stats = calculate_performance_stats(interview.get('questions', []))
+    stats = summary_stats(interview)
 
     st.markdown(f"""
     <div class="interview-summary">
@@ -211,191 +224,251 @@ def render_interview_summary(interview):
     """, unsafe_allow_html=True)
 
 
-with st.spinner("Loading interview history..."):
-    try:
-        response = interview_service.get_assigned_interviews()
+def render_interview_details(interview):
+    """Render the full details of an interview, including its questions"""
+    detail_col1, detail_col2 = st.columns(2)
 
-        if response.is_success and response.data:
-            detailed_response = interview_service.get_interviews_with_questions()
+    with detail_col1:
+        st.markdown("### 📝 Interview Information")
 
-            if detailed_response.is_success and detailed_response.data:
-                all_interviews = detailed_response.data
-                filtered_interviews = [
-                    interview for interview in all_interviews
-                    if interview.get('status') in ['COMPLETED', 'CANCELLED']
-                ]
+        description = interview.get('description', 'No description provided')
+        st.markdown(f"**Description:** {description}")
 
-                interviews = filtered_interviews
+        created_by = interview.get('createdBy', {})
+        created_by_name = f"{created_by.get('firstName', '')} {created_by.get('lastName', '')}".strip()
+        if not created_by_name:
+            created_by_name = created_by.get('username', 'Unknown')
+        st.markdown(f"**Created by:** {created_by_name}")
 
+        document_title = interview.get('documentTitle', 'Unknown Document')
+        st.markdown(f"**Based on:** {document_title}")
+
+    with detail_col2:
+        st.markdown("### 📊 Performance Metrics")
+
+        stats = calculate_performance_stats(interview.get('questions', []))
+
+        metric_col1, metric_col2 = st.columns(2)
+
+        with metric_col1:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div style="font-size: 24px; font-weight: 700; color: #3b82f6;">
+                    {stats['total']}
+                </div>
+                <div style="font-size: 14px; color: #6b7280;">
+                    Total Questions
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if stats['answered'] > 0:
                 st.markdown(f"""
-                <div style="
-                    background: rgba(59, 130, 246, 0.08);
-                    border-left: 3px solid #3b82f6;
-                    border-radius: 0 4px 4px 0;
-                    padding: 12px 16px;
-                    margin: 16px 0;
-                ">
-                    <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
-                        📊 Interview History Overview
-                    </h3>
-                    <p style="margin: 4px 0 0 0; color: #6b7280; font-size: 14px;">
-                        You have {len(interviews)} interview(s) in your history
-                    </p>
+                <div class="metric-card" style="margin-top: 8px;">
+                    <div style="font-size: 24px; font-weight: 700; color: #10b981;">
+                        {stats['accuracy']:.1f}%
+                    </div>
+                    <div style="font-size: 14px; color: #6b7280;">
+                        Accuracy
+                    </div>
                 </div>
                 """, unsafe_allow_html=True)
 
-
-                def sort_key(interview):
-                    status_priority = {
-                        'COMPLETED': 0,
-                        'IN_PROGRESS': 1,
-                        'SCHEDULED': 2,
-                        'CANCELLED': 3
-                    }
-                    return status_priority.get(interview.get('status', 'UNKNOWN'), 4), interview.get('name', '')
-
-
-                sorted_interviews = sorted(interviews, key=sort_key)
-
-                for interview in sorted_interviews:
-                    interview_name = interview.get('name', 'Unnamed Interview')
-                    status = interview.get('status', 'UNKNOWN')
-
-                    with st.expander(
-                            f"{interview_name} ({status.replace('_', ' ').title()})",
-                            expanded=False
-                    ):
-                        render_interview_summary(interview)
-
-                        st.divider()
-
-                        detail_col1, detail_col2 = st.columns(2)
-
-                        with detail_col1:
-                            st.markdown("### 📝 Interview Information")
-
-                            description = interview.get('description', 'No description provided')
-                            st.markdown(f"**Description:** {description}")
-
-                            created_by = interview.get('createdBy', {})
-                            created_by_name = f"{created_by.get('firstName', '')} {created_by.get('lastName', '')}".strip()
-                            if not created_by_name:
-                                created_by_name = created_by.get('username', 'Unknown')
-                            st.markdown(f"**Created by:** {created_by_name}")
-
-                            document_title = interview.get('documentTitle', 'Unknown Document')
-                            st.markdown(f"**Based on:** {document_title}")
-
-                        with detail_col2:
-                            st.markdown("### 📊 Performance Metrics")
-
-                            stats = calculate_performance_stats(interview.get('questions', []))
-
-                            metric_col1, metric_col2 = st.columns(2)
-
-                            with metric_col1:
-                                st.markdown(f"""
-                                <div class="metric-card">
-                                    <div style="font-size: 24px; font-weight: 700; color: #3b82f6;">
-                                        {stats['total']}
-                                    </div>
-                                    <div style="font-size: 14px; color: #6b7280;">
-                                        Total Questions
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
-
-                                if stats['answered'] > 0:
-                                    st.markdown(f"""
-                                    <div class="metric-card" style="margin-top: 8px;">
-                                        <div style="font-size: 24px; font-weight: 700; color: #10b981;">
-                                            {stats['accuracy']:.1f}%
-                                        </div>
-                                        <div style="font-size: 14px; color: #6b7280;">
-                                            Accuracy
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-
-                            with metric_col2:
-                                st.markdown(f"""
-                                <div class="metric-card">
-                                    <div style="font-size: 24px; font-weight: 700; color: #f59e0b;">
-                                        {stats['answered']}/{stats['total']}
-                                    </div>
-                                    <div style="font-size: 14px; color: #6b7280;">
-                                        Answered
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
-
-                                duration = interview.get('durationInSeconds')
-                                if duration:
-                                    st.markdown(f"""
-                                    <div class="metric-card" style="margin-top: 8px;">
-                                        <div style="font-size: 24px; font-weight: 700; color: #8b5cf6;">
-                                            {format_duration(duration)}
-                                        </div>
-                                        <div style="font-size: 14px; color: #6b7280;">
-                                            Duration
-                                        </div>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-
-                        if interview.get('questions'):
-                            st.divider()
-                            render_question_details(interview.get('questions', []))
-
-                        st.divider()
-                        st.markdown("### 💬 Feedback")
-
-                        candidate_review = interview.get('candidateReview')
-
-                        if candidate_review and candidate_review.strip():
-                            with st.expander("📝 Your review is ready! (click to see it)", expanded=False):
-                                with st.container(border=True):
-                                    st.markdown(candidate_review)
-                        else:
-                            st.markdown(f"""
-                            <div class="feedback-section feedback-pending">
-                                <h4 style="margin-top: 0; color: #d97706;">
-                                    ⏳ Feedback Pending
-                                </h4>
-                                <p style="margin: 8px 0 0 0; color: #92400e;">
-                                    Your feedback is not ready yet. Please check back later or contact the interview creator.
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-            else:
-                error_msg = detailed_response.error or "Failed to load detailed interview data"
-                st.error(f"❌ {error_msg}")
-
-        elif response.is_success and not response.data:
-            st.markdown("""
-            <div style="text-align: center; padding: 60px 20px;">
-                <div style="font-size: 64px; margin-bottom: 20px;">📭</div>
-                <h3 style="color: #6b7280; margin-bottom: 16px;">No Interview History</h3>
-                <p style="color: #9ca3af; font-size: 16px;">
-                    You haven't taken any interviews yet.<br>
-                    Check the Interview page to see if there are any assigned to you.
-                </p>
+        with metric_col2:
+            st.markdown(f"""
+            <div class="metric-card">
+                <div style="font-size: 24px; font-weight: 700; color: #f59e0b;">
+                    {stats['answered']}/{stats['total']}
+                </div>
+                <div style="font-size: 14px; color: #6b7280;">
+                    Answered
+                </div>
             </div>
             """, unsafe_allow_html=True)
 
+            duration = interview.get('durationInSeconds')
+            if duration:
+                st.markdown(f"""
+                <div class="metric-card" style="margin-top: 8px;">
+                    <div style="font-size: 24px; font-weight: 700; color: #8b5cf6;">
+                        {format_duration(duration)}
+                    </div>
+                    <div style="font-size: 14px; color: #6b7280;">
+                        Duration
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    if interview.get('questions'):
+        st.divider()
+        render_question_details(interview.get('questions', []))
+
+    st.divider()
+    st.markdown("### 💬 Feedback")
+
+    candidate_review = interview.get('candidateReview')
+
+    if candidate_review and candidate_review.strip():
+        with st.expander("📝 Your review is ready! (click to see it)", expanded=False):
+            with st.container(border=True):
+                st.markdown(candidate_review)
+    else:
+        st.markdown(f"""
+        <div class="feedback-section feedback-pending">
+            <h4 style="margin-top: 0; color: #d97706;">
+                ⏳ Feedback Pending
+            </h4>
+            <p style="margin: 8px 0 0 0; color: #92400e;">
+                Your feedback is not ready yet. Please check back later or contact the interview creator.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def toggle_history_details(interview_id):
+    if st.session_state.history_open_interview == interview_id:
+        st.session_state.history_open_interview = None
+    else:
+        st.session_state.history_open_interview = interview_id
+
+
+def render_history_entry(interview):
+    """Render one history summary; its details are only fetched and built while it is open"""
+    interview_id = interview.get('interviewId')
+    is_open = st.session_state.history_open_interview == interview_id
+
+    with st.container(border=True):
+        render_interview_summary(interview)
+
+        st.button("🔼 Hide details" if is_open else "🔽 Show details",
+                  key=f"history_details_{interview_id}_btn",
+                  type="secondary",
+                  on_click=toggle_history_details,
+                  args=(interview_id,))
+
+        if not is_open:
+            return
+
+        with st.spinner("Loading interview details..."):
+            try:
+                details_response = interview_service.get_interview_details(interview_id)
+            except Exception as e:
+                st.error(f"❌ Error loading interview details: {str(e)}")
+                return
+
+        if not details_response.is_success:
+            st.error(f"❌ Failed to load interview details: {details_response.error}")
+        elif details_response.data is None:
+            st.warning("This interview is no longer available")
         else:
-            error_msg = response.error or "Unknown error occurred"
-            st.error(f"❌ Failed to load interview history: {error_msg}")
+            st.divider()
+            render_interview_details(details_response.data)
+
+
+def change_history_page(delta):
+    st.session_state.history_page = max(0, st.session_state.history_page + delta)
+    st.session_state.history_open_interview = None
+
+
+def reset_history_page():
+    st.session_state.history_page = 0
+    st.session_state.history_open_interview = None
+
 
-            if st.button("🔄 Retry", type="secondary"):
-                st.rerun()
+if 'history_page' not in st.session_state:
+    st.session_state.history_page = 0
+if 'history_open_interview' not in st.session_state:
+    st.session_state.history_open_interview = None
 
+status_filter = st.multiselect(
+    "Status",
+    options=list(HISTORY_STATUSES),
+    default=list(HISTORY_STATUSES),
+    format_func=lambda status: status.replace('_', ' ').title(),
+    key="history_status_filter",
+    on_change=reset_history_page
+)
+
+with st.spinner("Loading interview history..."):
+    try:
+        # Only one page of summaries is loaded; question details are fetched for the opened interview
+        history_response = interview_service.get_interview_history(
+            page=st.session_state.history_page,
+            size=HISTORY_PAGE_SIZE,
+            statuses=status_filter or HISTORY_STATUSES
+        )
     except Exception as e:
+        history_response = None
         st.error(f"❌ Error loading interview history: {str(e)}")
 
         if st.button("🔄 Retry", type="secondary"):
             st.rerun()
 
+if history_response is not None and history_response.is_success:
+    history_page = history_response.data or {}
+    interviews = history_page.get('content', [])
+    total_count = history_page.get('totalElements', len(interviews))
+    total_pages = max(1, history_page.get('totalPages', 1))
+
+    if not interviews and st.session_state.history_page > 0:
+        # The history shrank below the current page since it was opened
+        reset_history_page()
+        st.rerun()
+
+    if total_count == 0:
+        st.markdown("""
+        <div style="text-align: center; padding: 60px 20px;">
+            <div style="font-size: 64px; margin-bottom: 20px;">📭</div>
+            <h3 style="color: #6b7280; margin-bottom: 16px;">No Interview History</h3>
+            <p style="color: #9ca3af; font-size: 16px;">
+                You haven't taken any interviews yet.<br>
+                Check the Interview page to see if there are any assigned to you.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown(f"""
+        <div style="
+            background: rgba(59, 130, 246, 0.08);
+            border-left: 3px solid #3b82f6;
+            border-radius: 0 4px 4px 0;
+            padding: 12px 16px;
+            margin: 16px 0;
+        ">
+            <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
+                📊 Interview History Overview
+            </h3>
+            <p style="margin: 4px 0 0 0; color: #6b7280; font-size: 14px;">
+                You have {total_count} interview(s) in your history
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        for interview in interviews:
+            render_history_entry(interview)
+
+        if total_pages > 1:
+            page_col1, page_col2, page_col3 = st.columns([1, 2, 1])
+            with page_col1:
+                st.button("◀ Previous", use_container_width=True, key="history_previous_page_btn",
+                          disabled=st.session_state.history_page == 0,
+                          on_click=change_history_page, args=(-1,))
+            with page_col2:
+                st.markdown(f"<div style='text-align: center; color: #6b7280;'>"
+                            f"Page {st.session_state.history_page + 1} of {total_pages}</div>",
+                            unsafe_allow_html=True)
+            with page_col3:
+                st.button("Next ▶", use_container_width=True, key="history_next_page_btn",
+                          disabled=st.session_state.history_page + 1 >= total_pages,
+                          on_click=change_history_page, args=(1,))
+
+elif history_response is not None:
+    error_msg = history_response.error or "Unknown error occurred"
+    st.error(f"❌ Failed to load interview history: {error_msg}")
+
+    if st.button("🔄 Retry", type="secondary"):
+        st.rerun()
+
 # Help section
 with st.expander("ℹ️ Interview History Help"):
     st.markdown("""
@@ -2,8 +2,10 @@ import streamlit as st
 
 from api_client.services.document_service import DocumentService
 from custom_styles import document_management_styles
-from dialogs.document_management_dialogs import upload_document_dialog, update_document_title_dialog
-from utils import truncate_text, format_date
+from dialogs.document_management_dialogs import upload_document_dialog, update_document_title_dialog, \
+    batch_upload_documents_dialog
+from constants import STREAM_RENDER_WINDOW
+from utils import truncate_text, format_date, batched
 
 document_service = DocumentService()
 
@@ -13,6 +15,11 @@ def show_upload_dialog():
     upload_document_dialog(document_service)
 
 
+@st.dialog("📚 Upload Many Documents", width="large")
+def show_batch_upload_dialog():
+    batch_upload_documents_dialog(document_service)
+
+
 @st.dialog("✏️ Update Document Title", width="large")
 def show_update_title_dialog(document_id, current_title):
     update_document_title_dialog(document_service, document_id, current_title)
@@ -41,6 +48,10 @@ def confirm_delete_document(document_id, document_title):
                 st.error(f"❌ Error deleting document: {str(e)}")
 
 
+def show_more_documents():
+    st.session_state.document_library_visible_count += STREAM_RENDER_WINDOW
+
+
 st.set_page_config(page_title="Document Management - QualifAIze", layout="wide", page_icon="📁")
 
 st.markdown(document_management_styles, unsafe_allow_html=True)
@@ -62,142 +73,165 @@ if "ADMIN" not in user_roles:
     st.info("Contact your system administrator for access")
     st.stop()
 
-if st.button("📤 Upload New Document", type="primary", use_container_width=True):
-    show_upload_dialog()
+upload_col, batch_col = st.columns(2)
+
+with upload_col:
+    if st.button("📤 Upload New Document", type="primary", use_container_width=True):
+        show_upload_dialog()
+
+with batch_col:
+    if st.button("📚 Upload Many Documents", type="secondary", use_container_width=True,
+                 help="Upload several PDFs in parallel"):
+        show_batch_upload_dialog()
 
 st.divider()
 
+if 'document_library_visible_count' not in st.session_state:
+    st.session_state.document_library_visible_count = STREAM_RENDER_WINDOW
+
 with st.spinner("Loading documents..."):
     try:
-        response = document_service.get_all_documents()
-
-        if response.is_success and response.data:
-            documents = response.data
-
-            st.markdown(f"""
-            <div class="section-header">
-                <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
-                    📋 Document Library
-                </h3>
-                <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
-                    {len(documents)} documents available
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            for row_index in range(0, len(documents), 3):
-                doc_cols = st.columns(3)
-                row_docs = documents[row_index:row_index + 3]
-
-                for col_index, doc in enumerate(row_docs):
-                    with doc_cols[col_index]:
-                        with st.container(border=True):
-                            doc_id = doc.get('id')
-                            full_title = doc.get('secondaryFilename', 'Untitled Document')
-
-                            st.markdown(f""" #### 📄 {truncate_text(full_title, 50)} """, unsafe_allow_html=True)
-
-                            original_name = doc.get('filename', 'Unknown')
-                            upload_date = format_date(doc.get('createdAt'))
-
-                            st.markdown(f"""
-                            <div class='doc-meta' title='{original_name}'>
-                                📎 {truncate_text(original_name, 50)}
-                            </div>
-                            <div class='doc-meta'>
-                                📅 {upload_date}
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                            uploader_name = "Unknown"
-                            if doc.get('uploadedBy'):
-                                uploader_info = doc['uploadedBy']
-                                first_name = uploader_info.get('firstName', '')
-                                last_name = uploader_info.get('lastName', '')
-                                uploader_name = f"{first_name} {last_name}".strip()
-                                if not uploader_name:
-                                    uploader_name = uploader_info.get('username', 'Unknown')
-
-                            st.markdown(f"""
-                            <div class='uploader-badge' title='{uploader_name}'>
-                                👤 {truncate_text(uploader_name, 15)}
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                            action_col1, action_col2 = st.columns(2)
-
-                            with action_col1:
-                                if st.button("✏️ Edit",
-                                             key=f"edit_{doc_id}",
-                                             help="Edit document title",
-                                             use_container_width=True,
-                                             type="secondary"):
-                                    show_update_title_dialog(doc_id, doc.get('secondaryFilename', ''))
-
-                            with action_col2:
-                                delete_key = f"delete_confirm_{doc_id}"
-                                if delete_key not in st.session_state:
-                                    st.session_state[delete_key] = False
+        with document_service.stream_all_documents() as stream:
+            if stream.is_success:
+                # Cards render row by row as the list streams in; past the visible window the
+                # rest is only counted, so memory stays bounded however long the list is
+                header_placeholder = st.empty()
+                document_count = 0
+                shown_count = 0
 
-                                if not st.session_state[delete_key]:
-                                    if st.button("🗑️ Delete",
-                                                 key=f"delete_{doc_id}",
-                                                 help="Delete document",
-                                                 use_container_width=True,
-                                                 type="secondary"):
-                                        st.session_state[delete_key] = True
-                                        st.rerun()
-                                else:
-                                    if st.button("❌ Cancel",
-                                                 key=f"cancel_delete_{doc_id}",
-                                                 help="Cancel deletion",
-                                                 use_container_width=True,
-                                                 type="secondary"):
-                                        st.session_state[delete_key] = False
-                                        st.rerun()
+                for row_index, row_docs in enumerate(batched(stream.iter_items(), 3)):
+                    document_count += len(row_docs)
+                    if shown_count >= st.session_state.document_library_visible_count:
+                        continue
+
+                    if row_index > 0:
+                        st.markdown('<div style="margin: 12px 0;"></div>', unsafe_allow_html=True)
+
+                    doc_cols = st.columns(3)
+                    shown_count += len(row_docs)
+
+                    for col_index, doc in enumerate(row_docs):
+                        with doc_cols[col_index]:
+                            with st.container(border=True):
+                                doc_id = doc.get('id')
+                                full_title = doc.get('secondaryFilename', 'Untitled Document')
 
-                            delete_key = f"delete_confirm_{doc_id}"
-                            if st.session_state.get(delete_key, False):
-                                st.markdown('<div class="delete-confirmation">', unsafe_allow_html=True)
+                                st.markdown(f""" #### 📄 {truncate_text(full_title, 50)} """, unsafe_allow_html=True)
+
+                                original_name = doc.get('filename', 'Unknown')
+                                upload_date = format_date(doc.get('createdAt'))
+
+                                st.markdown(f"""
+                                <div class='doc-meta' title='{original_name}'>
+                                    📎 {truncate_text(original_name, 50)}
+                                </div>
+                                <div class='doc-meta'>
+                                    📅 {upload_date}
+                                </div>
+                                """, unsafe_allow_html=True)
+
+                                uploader_name = "Unknown"
+                                if doc.get('uploadedBy'):
+                                    uploader_info = doc['uploadedBy']
+                                    first_name = uploader_info.get('firstName', '')
+                                    last_name = uploader_info.get('lastName', '')
+                                    uploader_name = f"{first_name} {last_name}".strip()
+                                    if not uploader_name:
+                                        uploader_name = uploader_info.get('username', 'Unknown')
 
                                 st.markdown(f"""
-                                <div style="margin-bottom: 6px;">
-                                    <span style="font-size: 14px; font-weight: 500; color: #dc2626;">
-                                        ⚠️ Delete this document?
-                                    </span>
+                                <div class='uploader-badge' title='{uploader_name}'>
+                                    👤 {truncate_text(uploader_name, 15)}
                                 </div>
                                 """, unsafe_allow_html=True)
 
-                                confirm_col1, confirm_col2 = st.columns(2)
-                                with confirm_col1:
-                                    if st.button("Cancel", key=f"cancel_confirm_{doc_id}", type="secondary",
-                                                 use_container_width=True):
+                                action_col1, action_col2 = st.columns(2)
+
+                                with action_col1:
+                                    if st.button("✏️ Edit",
+                                                 key=f"edit_{doc_id}",
+                                                 help="Edit document title",
+                                                 use_container_width=True,
+                                                 type="secondary"):
+                                        show_update_title_dialog(doc_id, doc.get('secondaryFilename', ''))
+
+                                with action_col2:
+                                    delete_key = f"delete_confirm_{doc_id}"
+                                    if delete_key not in st.session_state:
                                         st.session_state[delete_key] = False
-                                        st.rerun()
-                                with confirm_col2:
-                                    confirm_delete_document(doc_id, full_title)
-
-                                st.markdown('</div>', unsafe_allow_html=True)
-
-                if row_index + 3 < len(documents):
-                    st.markdown('<div style="margin: 12px 0;"></div>', unsafe_allow_html=True)
-
-        elif response.is_success and not response.data:
-            st.info("📭 No documents found in the system")
-            st.markdown("""
-            **Get started by uploading your first document:**
-            1. Click the "Upload New Document" button above
-            2. Select a PDF file from your computer
-            3. Enter a descriptive title
-            4. Click "Upload Document" to process it
-            """)
-
-        else:
-            error_msg = response.error or "Unknown error occurred"
-            st.error(f"❌ Failed to load documents: {error_msg}")
-
-            if st.button("🔄 Retry", type="secondary"):
-                st.rerun()
+
+                                    if not st.session_state[delete_key]:
+                                        if st.button("🗑️ Delete",
+                                                     key=f"delete_{doc_id}",
+                                                     help="Delete document",
+                                                     use_container_width=True,
+                                                     type="secondary"):
+                                            st.session_state[delete_key] = True
+                                            st.rerun()
+                                    else:
+                                        if st.button("❌ Cancel",
+                                                     key=f"cancel_delete_{doc_id}",
+                                                     help="Cancel deletion",
+                                                     use_container_width=True,
+                                                     type="secondary"):
+                                            st.session_state[delete_key] = False
+                                            st.rerun()
+
+                                delete_key = f"delete_confirm_{doc_id}"
+                                if st.session_state.get(delete_key, False):
+                                    st.markdown('<div class="delete-confirmation">', unsafe_allow_html=True)
+
+                                    st.markdown(f"""
+                                    <div style="margin-bottom: 6px;">
+                                        <span style="font-size: 14px; font-weight: 500; color: #dc2626;">
+                                            ⚠️ Delete this document?
+                                        </span>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+
+                                    confirm_col1, confirm_col2 = st.columns(2)
+                                    with confirm_col1:
+                                        if st.button("Cancel", key=f"cancel_confirm_{doc_id}", type="secondary",
+                                                     use_container_width=True):
+                                            st.session_state[delete_key] = False
+                                            st.rerun()
+                                    with confirm_col2:
+                                        confirm_delete_document(doc_id, full_title)
+
+                                    st.markdown('</div>', unsafe_allow_html=True)
+
+                if document_count == 0:
+                    with header_placeholder.container():
+                        st.info("📭 No documents found in the system")
+                        st.markdown("""
+                        **Get started by uploading your first document:**
+                        1. Click the "Upload New Document" button above
+                        2. Select a PDF file from your computer
+                        3. Enter a descriptive title
+                        4. Click "Upload Document" to process it
+                        """)
+                else:
+                    header_placeholder.markdown(f"""
+                    <div class="section-header">
+                        <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
+                            📋 Document Library
+                        </h3>
+                        <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
+                            {document_count} documents available
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                if shown_count < document_count:
+                    st.button(f"Show more ({document_count - shown_count} remaining)", type="secondary",
+                              use_container_width=True, on_click=show_more_documents)
+
+            else:
+                error_msg = stream.error or "Unknown error occurred"
+                st.error(f"❌ Failed to load documents: {error_msg}")
+
+                if st.button("🔄 Retry", type="secondary"):
+                    st.rerun()
 
     except Exception as e:
         st.error(f"❌ Error loading documents: {str(e)}")
@@ -2,8 +2,9 @@ import streamlit as st
 
 from api_client.services.user_service import UserService
 from custom_styles import user_management_styles
-from dialogs.user_management_dialogs import add_new_user_dialog, edit_user_dialog
-from utils import truncate_text, format_date, get_role_display, get_role_color
+from dialogs.user_management_dialogs import add_new_user_dialog, edit_user_dialog, bulk_import_users_dialog
+from constants import STREAM_RENDER_WINDOW
+from utils import truncate_text, format_date, get_role_display, get_role_color, batched
 
 user_service = UserService()
 
@@ -17,6 +18,11 @@ def show_add_user_dialog():
     add_new_user_dialog(user_service)
 
 
+@st.dialog("📥 Import Users", width="large")
+def show_import_users_dialog():
+    bulk_import_users_dialog(user_service)
+
+
 def confirm_delete_user(user_to_delete_id):
     """Confirm and delete user"""
     if st.button(
@@ -33,13 +39,17 @@ def confirm_delete_user(user_to_delete_id):
                     st.success(f"✅ User '{username}' deleted successfully!")
                     st.rerun()
                 else:
-                    error_message = response.error or "Unknown error occurred"
+                    error_message = delete_response.error or "Unknown error occurred"
                     st.error(f"❌ Delete failed: {error_message}")
 
             except Exception as e:
                 st.error(f"❌ Error deleting user: {str(e)}")
 
 
+def show_more_users():
+    st.session_state.user_directory_visible_count += STREAM_RENDER_WINDOW
+
+
 st.set_page_config(page_title="User Management - QualifAIze", layout="wide", page_icon="👥")
 
 st.markdown(user_management_styles, unsafe_allow_html=True)
@@ -61,172 +71,194 @@ if "ADMIN" not in user_roles:
     st.info("Contact your system administrator for access")
     st.stop()
 
-if st.button("👤 Add New User", type="primary", use_container_width=True):
-    show_add_user_dialog()
+add_col, import_col = st.columns(2)
+
+with add_col:
+    if st.button("👤 Add New User", type="primary", use_container_width=True):
+        show_add_user_dialog()
+
+with import_col:
+    if st.button("📥 Import Users", type="secondary", use_container_width=True,
+                 help="Create many users from a CSV or XLSX file"):
+        show_import_users_dialog()
 
 st.divider()
 
+if 'user_directory_visible_count' not in st.session_state:
+    st.session_state.user_directory_visible_count = STREAM_RENDER_WINDOW
+
 with st.spinner("Loading users..."):
     try:
-        response = user_service.get_all_users()
-
-        if response.is_success and response.data:
-            users = response.data
-
-            st.markdown(f"""
-            <div class="section-header">
-                <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
-                    👥 User Directory
-                </h3>
-                <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
-                    {len(users)} users available
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            for row_index in range(0, len(users), 3):
-                user_cols = st.columns(3)
-                row_users = users[row_index:row_index + 3]
-
-                for col_index, user in enumerate(row_users):
-                    with user_cols[col_index]:
-                        with st.container(border=True):
-                            user_id = user.get('userId')
-                            username = user.get('username', 'Unknown')
-                            first_name = user.get('firstName', '')
-                            last_name = user.get('lastName', '')
-                            email = user.get('email', '')
-                            user_roles_display = user.get('roles', ['GUEST'])
-
-                            full_name = f"{first_name} {last_name}".strip()
-                            if not full_name:
-                                full_name = username
-
-                            display_name = full_name if full_name != username else username
-                            st.markdown(f"""#### 👨🏻‍💼 {truncate_text(display_name, 25)}""")
-
-                            if display_name != username:
-                                st.markdown(f"""
-                                <div class='user-meta'>
-                                    🏷️ @{truncate_text(username, 20)}
-                                </div>
-                                """, unsafe_allow_html=True)
+        with user_service.stream_all_users() as stream:
+            if stream.is_success:
+                # Cards render row by row as the list streams in; past the visible window the
+                # rest is only counted, so memory stays bounded however long the list is
+                header_placeholder = st.empty()
+                user_count = 0
+                shown_count = 0
+
+                for row_index, row_users in enumerate(batched(stream.iter_items(), 3)):
+                    user_count += len(row_users)
+                    if shown_count >= st.session_state.user_directory_visible_count:
+                        continue
+
+                    if row_index > 0:
+                        st.markdown('<div style="margin: 12px 0;"></div>', unsafe_allow_html=True)
+
+                    user_cols = st.columns(3)
+                    shown_count += len(row_users)
+
+                    for col_index, user in enumerate(row_users):
+                        with user_cols[col_index]:
+                            with st.container(border=True):
+                                user_id = user.get('userId')
+                                username = user.get('username', 'Unknown')
+                                first_name = user.get('firstName', '')
+                                last_name = user.get('lastName', '')
+                                email = user.get('email', '')
+                                user_roles_display = user.get('roles', ['GUEST'])
+
+                                full_name = f"{first_name} {last_name}".strip()
+                                if not full_name:
+                                    full_name = username
+
+                                display_name = full_name if full_name != username else username
+                                st.markdown(f"""#### 👨🏻‍💼 {truncate_text(display_name, 25)}""")
+
+                                if display_name != username:
+                                    st.markdown(f"""
+                                    <div class='user-meta'>
+                                        🏷️ @{truncate_text(username, 20)}
+                                    </div>
+                                    """, unsafe_allow_html=True)
+
+                                if email:
+                                    st.markdown(f"""
+                                    <div class='user-meta' title='{email}'>
+                                        📧 {truncate_text(email, 22)}
+                                    </div>
+                                    """, unsafe_allow_html=True)
+
+                                member_since = "Unknown"
+                                if user.get('memberSince'):
+                                    member_since = format_date(user.get('memberSince'))
 
-                            if email:
                                 st.markdown(f"""
-                                <div class='user-meta' title='{email}'>
-                                    📧 {truncate_text(email, 22)}
+                                <div class='user-meta'>
+                                    📅 Member since {member_since}
                                 </div>
                                 """, unsafe_allow_html=True)
 
-                            member_since = "Unknown"
-                            if user.get('memberSince'):
-                                member_since = format_date(user.get('memberSince'))
-
-                            st.markdown(f"""
-                            <div class='user-meta'>
-                                📅 Member since {member_since}
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                            role_display = get_role_display(user_roles_display)
-                            role_color = get_role_color(user_roles_display)
-
-                            st.markdown(f"""
-                                <div class='role-badge' style='color: {role_color}; border-color: {role_color}; background: {role_color}15;'>
-                                    🛡️ {role_display}
-                                </div>
-                                """, unsafe_allow_html=True)
+                                role_display = get_role_display(user_roles_display)
+                                role_color = get_role_color(user_roles_display)
 
-                            action_col1, action_col2 = st.columns(2)
+                                st.markdown(f"""
+                                    <div class='role-badge' style='color: {role_color}; border-color: {role_color}; background: {role_color}15;'>
+                                        🛡️ {role_display}
+                                    </div>
+                                    """, unsafe_allow_html=True)
 
-                            current_user_data = st.session_state.get('authenticated_user', {})
-                            current_user_id = current_user_data.get('user_id')
+                                action_col1, action_col2 = st.columns(2)
 
-                            can_delete = (str(user_id) != str(current_user_id) and
-                                          not ("ADMIN" in user_roles_display and str(current_user_id) != str(user_id)))
+                                current_user_data = st.session_state.get('authenticated_user', {})
+                                current_user_id = current_user_data.get('user_id')
 
-                            with action_col1:
-                                if st.button("✏️ Edit",
-                                             key=f"edit_user_{user_id}",
-                                             help="Edit user details",
-                                             use_container_width=True,
-                                             type="secondary"):
-                                    show_edit_user_dialog(user_id, user)
+                                can_delete = (str(user_id) != str(current_user_id) and
+                                              not ("ADMIN" in user_roles_display and str(current_user_id) != str(user_id)))
 
-                            with action_col2:
-                                delete_key = f"delete_confirm_user_{user_id}"
-                                if delete_key not in st.session_state:
-                                    st.session_state[delete_key] = False
-
-                                if not can_delete:
-                                    st.button("🔒 Protected",
-                                              key=f"protected_user_{user_id}",
-                                              help="Cannot delete this user",
-                                              use_container_width=True,
-                                              disabled=True,
-                                              type="secondary")
-                                elif not st.session_state[delete_key]:
-                                    if st.button("🗑️ Delete",
-                                                 key=f"delete_user_{user_id}",
-                                                 help="Delete user",
-                                                 use_container_width=True,
-                                                 type="secondary"):
-                                        st.session_state[delete_key] = True
-                                        st.rerun()
-                                else:
-                                    if st.button("❌ Cancel",
-                                                 key=f"cancel_delete_user_{user_id}",
-                                                 help="Cancel deletion",
+                                with action_col1:
+                                    if st.button("✏️ Edit",
+                                                 key=f"edit_user_{user_id}",
+                                                 help="Edit user details",
                                                  use_container_width=True,
                                                  type="secondary"):
+                                        show_edit_user_dialog(user_id, user)
+
+                                with action_col2:
+                                    delete_key = f"delete_confirm_user_{user_id}"
+                                    if delete_key not in st.session_state:
                                         st.session_state[delete_key] = False
-                                        st.rerun()
 
-                            delete_key = f"delete_confirm_user_{user_id}"
-                            if st.session_state.get(delete_key, False):
-                                st.markdown('<div class="delete-confirmation">', unsafe_allow_html=True)
+                                    if not can_delete:
+                                        st.button("🔒 Protected",
+                                                  key=f"protected_user_{user_id}",
+                                                  help="Cannot delete this user",
+                                                  use_container_width=True,
+                                                  disabled=True,
+                                                  type="secondary")
+                                    elif not st.session_state[delete_key]:
+                                        if st.button("🗑️ Delete",
+                                                     key=f"delete_user_{user_id}",
+                                                     help="Delete user",
+                                                     use_container_width=True,
+                                                     type="secondary"):
+                                            st.session_state[delete_key] = True
+                                            st.rerun()
+                                    else:
+                                        if st.button("❌ Cancel",
+                                                     key=f"cancel_delete_user_{user_id}",
+                                                     help="Cancel deletion",
+                                                     use_container_width=True,
+                                                     type="secondary"):
+                                            st.session_state[delete_key] = False
+                                            st.rerun()
 
-                                st.markdown(f"""
-                                <div style="margin-bottom: 6px;">
-                                    <span style="font-size: 14px; font-weight: 500; color: #dc2626;">
-                                        ⚠️ Delete this user?
-                                    </span>
-                                </div>
-                                """, unsafe_allow_html=True)
-
-                                confirm_col1, confirm_col2 = st.columns(2)
-                                with confirm_col1:
-                                    if st.button("Cancel", key=f"cancel_confirm_user_{user_id}", type="secondary",
-                                                 use_container_width=True):
-                                        st.session_state[delete_key] = False
-                                        st.rerun()
-                                with confirm_col2:
-                                    confirm_delete_user(user_id)
-
-                                st.markdown('</div>', unsafe_allow_html=True)
-
-                if row_index + 3 < len(users):
-                    st.markdown('<div style="margin: 12px 0;"></div>', unsafe_allow_html=True)
-
-        elif response.is_success and not response.data:
-            st.markdown("""
-            <div class="section-header">
-                <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
-                    👥 User Directory
-                </h3>
-                <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
-                    0 users available • Get started by adding your first user
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        else:
-            error_msg = response.error or "Unknown error occurred"
-            st.error(f"❌ Failed to load users: {error_msg}")
-
-            if st.button("🔄 Retry", type="secondary"):
-                st.rerun()
+                                delete_key = f"delete_confirm_user_{user_id}"
+                                if st.session_state.get(delete_key, False):
+                                    st.markdown('<div class="delete-confirmation">', unsafe_allow_html=True)
+
+                                    st.markdown(f"""
+                                    <div style="margin-bottom: 6px;">
+                                        <span style="font-size: 14px; font-weight: 500; color: #dc2626;">
+                                            ⚠️ Delete this user?
+                                        </span>
+                                    </div>
+                                    """, unsafe_allow_html=True)
+
+                                    confirm_col1, confirm_col2 = st.columns(2)
+                                    with confirm_col1:
+                                        if st.button("Cancel", key=f"cancel_confirm_user_{user_id}", type="secondary",
+                                                     use_container_width=True):
+                                            st.session_state[delete_key] = False
+                                            st.rerun()
+                                    with confirm_col2:
+                                        confirm_delete_user(user_id)
+
+                                    st.markdown('</div>', unsafe_allow_html=True)
+
+                if user_count == 0:
+                    header_placeholder.markdown("""
+                    <div class="section-header">
+                        <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
+                            👥 User Directory
+                        </h3>
+                        <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
+                            0 users available • Get started by adding your first user
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    header_placeholder.markdown(f"""
+                    <div class="section-header">
+                        <h3 style="margin: 0; color: #1e40af; font-size: 18px;">
+                            👥 User Directory
+                        </h3>
+                        <p style="margin: 2px 0 0 0; color: #6b7280; font-size: 14px;">
+                            {user_count} users available
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                if shown_count < user_count:
+                    st.button(f"Show more ({user_count - shown_count} remaining)", type="secondary",
+                              use_container_width=True, on_click=show_more_users)
+
+            else:
+                error_msg = stream.error or "Unknown error occurred"
+                st.error(f"❌ Failed to load users: {error_msg}")
+
+                if st.button("🔄 Retry", type="secondary"):
+                    st.rerun()
 
     except Exception as e:
         st.error(f"❌ Error loading users: {str(e)}")
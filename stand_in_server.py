@@ -0,0 +1,466 @@
+"""
+Local stand-in for the parts of the backend API that the client implements ahead of it, so
+those code paths can be exercised offline. State lives in memory (uploaded parts in a
+temporary directory) and is lost when the server stops. Authentication is not checked.
+
+    python stand_in_server.py --port 8080 [--part-failure-rate 0.2] [--seed-interviews 500]
+        [--no-history-endpoint]
+
+Point BACKEND_BASE_URL at it (the default already is http://localhost:8080).
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import tempfile
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from constants import BACKEND_BASE_PATH, UPLOAD_PART_SIZE
+
+logger = logging.getLogger("stand_in_server")
+
+MIN_PART_SIZE = 256 * 1024
+MAX_PART_SIZE = 64 * 1024 * 1024
+MAX_PAGE_SIZE = 100
+
+
+class StandInError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class StandInBackend:
+    """In-memory state and route handlers; each handler takes (request, *path groups) and returns (status, body)."""
+
+    def __init__(self, part_failure_rate: float = 0.0, seed_interviews: int = 0, history_endpoint: bool = True):
+        self.part_failure_rate = part_failure_rate
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.interviews: Dict[str, Dict[str, Any]] = {}
+        self.upload_dir = tempfile.mkdtemp(prefix="qualifaize-stand-in-")
+        self.lock = threading.Lock()
+        self.routes: List[Tuple[str, Pattern, Callable]] = []
+        self._last_update: Optional[datetime] = None
+
+        self.route('GET', r'pdf', self.list_documents)
+        self.route('POST', r'pdf', self.upload_document)
+        self.route('POST', r'pdf/uploads', self.create_upload)
+        self.route('GET', r'pdf/uploads/([^/]+)', self.upload_status)
+        self.route('DELETE', r'pdf/uploads/([^/]+)', self.abort_upload)
+        self.route('PUT', r'pdf/uploads/([^/]+)/parts/(\d+)', self.put_part)
+        self.route('POST', r'pdf/uploads/([^/]+)/commit', self.commit_upload)
+        if history_endpoint:
+            self.route('GET', r'interview/history', self.interview_history)
+        self.route('GET', r'interview/with-questions', self.interviews_with_questions)
+        self.route('GET', r'interview/assigned', self.assigned_interviews)
+        self.route('POST', r'interview', self.create_interview)
+        # Matches every single-segment path, so it goes after the literal interview/... routes. Like
+        # the backend, without the history route interview/history lands here and answers 400
+        self.route('GET', r'interview/([^/]+)', self.change_interview_status)
+
+        for number in range(seed_interviews):
+            self._seed_interview(number)
+
+    def route(self, method: str, pattern: str, handler: Callable) -> None:
+        self.routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def dispatch(self, request: 'StandInRequestHandler', method: str, path: str) -> Tuple[int, Any]:
+        path_matched = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match:
+                path_matched = True
+                if route_method == method:
+                    return handler(request, *match.groups())
+        if path_matched:
+            raise StandInError(405, f"{method} not allowed on {path}")
+        raise StandInError(404, f"No stand-in route for {method} {path}")
+
+    def close(self) -> None:
+        shutil.rmtree(self.upload_dir, ignore_errors=True)
+
+    # Documents
+
+    def _add_document(self, filename: str, secondary_filename: str) -> Dict[str, Any]:
+        document = {
+            "id": uuid.uuid4().hex,
+            "filename": filename,
+            "secondaryFilename": secondary_filename,
+            "createdAt": _now(),
+            "uploadedBy": {"username": "stand-in", "firstName": "Stand", "lastName": "In"}
+        }
+        with self.lock:
+            self.documents[document["id"]] = document
+        return document
+
+    def list_documents(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        with self.lock:
+            return 200, list(self.documents.values())
+
+    def upload_document(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        content_type = request.headers.get('Content-Type', '')
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode('latin-1') + request.read_body()
+        )
+        fields, filename = {}, None
+        for part in message.iter_parts():
+            name = part.get_param('name', header='content-disposition')
+            if part.get_filename():
+                filename = part.get_filename()
+            else:
+                fields[name] = part.get_content().strip()
+        if filename is None or not fields.get('secondary_file_name'):
+            raise StandInError(400, "A file and secondary_file_name are required")
+        return 201, self._add_document(filename, fields['secondary_file_name'])
+
+    # Interviews
+
+    def _touch(self, interview: Dict[str, Any]) -> None:
+        """Stamp a change with a strictly increasing updatedAt, so updatedSince misses none. Call under the lock."""
+        now = datetime.now(timezone.utc)
+        if self._last_update is not None and now <= self._last_update:
+            now = self._last_update + timedelta(microseconds=1)
+        self._last_update = now
+        # Fixed width, so timestamps also order correctly as strings
+        interview["updatedAt"] = now.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    def _seed_interview(self, number: int) -> Dict[str, Any]:
+        rng = random.Random(number)
+        status = rng.choice(("COMPLETED", "COMPLETED", "CANCELLED", "SCHEDULED"))
+        answered = status == "COMPLETED"
+        questions = []
+        for order in range(1, rng.randint(5, 12) + 1):
+            correct_option = rng.choice("ABCD")
+            submitted = rng.choice("ABCD") if answered else None
+            questions.append({
+                "questionId": uuid.UUID(int=rng.getrandbits(128)).hex,
+                "questionOrder": order,
+                "questionText": f"Stand-in question {order} of interview {number}?",
+                "optionA": "First option", "optionB": "Second option",
+                "optionC": "Third option", "optionD": "Fourth option",
+                "correctOption": correct_option,
+                "submittedAnswer": submitted,
+                "isCorrect": submitted == correct_option if submitted else None,
+                "answerTimeInMillis": rng.randint(2000, 60000) if submitted else None
+            })
+        interview = {
+            "interviewId": uuid.UUID(int=rng.getrandbits(128)).hex,
+            "name": f"Stand-in interview {number}",
+            "description": "Generated by the stand-in backend",
+            "status": status,
+            "difficulty": rng.choice(("EASY", "MEDIUM", "HARD")),
+            "documentTitle": "Stand-in document",
+            "createdBy": {"username": "stand-in", "firstName": "Stand", "lastName": "In"},
+            "scheduledDate": (datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=number))
+            .isoformat().replace('+00:00', 'Z'),
+            "durationInSeconds": rng.randint(300, 3600) if answered else None,
+            "candidateReview": "Solid understanding of the material." if answered and rng.random() < 0.5 else None,
+            "questions": questions
+        }
+        with self.lock:
+            self._touch(interview)
+            self.interviews[interview["interviewId"]] = interview
+        return interview
+
+    @staticmethod
+    def _summary(interview: Dict[str, Any]) -> Dict[str, Any]:
+        questions = interview["questions"]
+        summary = {key: value for key, value in interview.items() if key not in ("questions", "candidateReview")}
+        summary["questionCount"] = len(questions)
+        summary["answeredCount"] = sum(1 for q in questions if q["submittedAnswer"] is not None)
+        summary["correctCount"] = sum(1 for q in questions if q["isCorrect"] is True)
+        summary["hasReview"] = bool(interview.get("candidateReview"))
+        return summary
+
+    def interview_history(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        query = request.query
+        try:
+            page = max(0, int(query.get("page", ["0"])[0]))
+            size = min(MAX_PAGE_SIZE, max(1, int(query.get("size", ["20"])[0])))
+        except ValueError:
+            raise StandInError(400, "page and size must be integers")
+        # Both status=A&status=B and status=A,B are accepted, as Spring does
+        statuses = {status for value in query.get("status", []) for status in value.split(',') if status}
+
+        with self.lock:
+            history = [interview for interview in self.interviews.values()
+                       if not statuses or interview["status"] in statuses]
+        history.sort(key=lambda interview: interview["scheduledDate"] or '', reverse=True)
+        return 200, {
+            "content": [self._summary(interview) for interview in history[page * size:(page + 1) * size]],
+            "page": page,
+            "size": size,
+            "totalElements": len(history),
+            "totalPages": -(-len(history) // size)
+        }
+
+    def interviews_with_questions(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        interview_id = request.query.get("interviewId", [None])[0]
+        with self.lock:
+            if interview_id is None:
+                return 200, list(self.interviews.values())
+            interview = self.interviews.get(interview_id)
+        if interview is None:
+            raise StandInError(404, f"Interview {interview_id} not found")
+        return 200, [interview]
+
+    def assigned_interviews(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        query = request.query
+        status = query.get("status", [None])[0]
+        updated_since = query.get("updatedSince", [None])[0]
+        with self.lock:
+            assigned = [{key: value for key, value in interview.items() if key not in ("questions", "candidateReview")}
+                        for interview in self.interviews.values()
+                        if (status is None or interview["status"] == status)
+                        and (updated_since is None or interview["updatedAt"] > updated_since)]
+        assigned.sort(key=lambda interview: interview["scheduledDate"] or '')
+        return 200, assigned
+
+    def create_interview(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        body = request.read_json()
+        if not body.get("name") or not body.get("documentId"):
+            raise StandInError(400, "name and documentId are required")
+        interview = {
+            "interviewId": uuid.uuid4().hex,
+            "name": body["name"],
+            "description": body.get("description"),
+            "status": "SCHEDULED",
+            "difficulty": body.get("difficulty") or "MEDIUM",
+            "documentTitle": self.documents.get(body["documentId"], {}).get("secondaryFilename"),
+            "createdBy": {"username": "stand-in", "firstName": "Stand", "lastName": "In"},
+            "scheduledDate": body.get("scheduledDate") or _now(),
+            "durationInSeconds": None,
+            "candidateReview": None,
+            "questions": []
+        }
+        with self.lock:
+            self._touch(interview)
+            self.interviews[interview["interviewId"]] = interview
+        return 201, {key: value for key, value in interview.items() if key != "questions"}
+
+    def change_interview_status(self, request: 'StandInRequestHandler', interview_id: str) -> Tuple[int, Any]:
+        new_status = request.query.get("newStatus", [None])[0]
+        if new_status not in ("SCHEDULED", "IN_PROGRESS", "COMPLETED", "CANCELLED"):
+            raise StandInError(400, f"Unknown status {new_status}")
+        with self.lock:
+            interview = self.interviews.get(interview_id)
+            if interview is None:
+                raise StandInError(404, f"Interview {interview_id} not found")
+            interview["status"] = new_status
+            self._touch(interview)
+            return 200, {key: value for key, value in interview.items() if key != "questions"}
+
+    # Resumable uploads
+
+    def _upload(self, upload_id: str) -> Dict[str, Any]:
+        upload = self.uploads.get(upload_id)
+        if upload is None:
+            raise StandInError(404, f"Upload {upload_id} not found")
+        return upload
+
+    @staticmethod
+    def _upload_view(upload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "uploadId": upload["uploadId"],
+            "partSize": upload["partSize"],
+            "totalParts": upload["totalParts"],
+            "receivedParts": sorted(upload["parts"]),
+            "size": upload["size"]
+        }
+
+    def create_upload(self, request: 'StandInRequestHandler') -> Tuple[int, Any]:
+        body = request.read_json()
+        try:
+            size = int(body["size"])
+            filename = str(body["filename"])
+            secondary_file_name = str(body["secondaryFileName"])
+        except (KeyError, TypeError, ValueError):
+            raise StandInError(400, "filename, secondaryFileName and size are required")
+        part_size = min(MAX_PART_SIZE, max(MIN_PART_SIZE, int(body.get("partSize") or UPLOAD_PART_SIZE)))
+
+        upload = {
+            "uploadId": uuid.uuid4().hex,
+            "filename": filename,
+            "secondaryFileName": secondary_file_name,
+            "size": size,
+            "sha256": body.get("sha256"),
+            "partSize": part_size,
+            "totalParts": max(1, -(-size // part_size)),
+            "parts": set()
+        }
+        os.makedirs(os.path.join(self.upload_dir, upload["uploadId"]))
+        with self.lock:
+            self.uploads[upload["uploadId"]] = upload
+        return 201, self._upload_view(upload)
+
+    def upload_status(self, request: 'StandInRequestHandler', upload_id: str) -> Tuple[int, Any]:
+        with self.lock:
+            return 200, self._upload_view(self._upload(upload_id))
+
+    def put_part(self, request: 'StandInRequestHandler', upload_id: str, part: str) -> Tuple[int, Any]:
+        data = request.read_body()
+        part_number = int(part)
+        with self.lock:
+            upload = self._upload(upload_id)
+        if not 1 <= part_number <= upload["totalParts"]:
+            raise StandInError(400, f"Part {part_number} is out of range 1..{upload['totalParts']}")
+        if random.random() < self.part_failure_rate:
+            raise StandInError(503, "Injected part failure")
+
+        expected_size = min(upload["partSize"], upload["size"] - (part_number - 1) * upload["partSize"])
+        if len(data) != expected_size:
+            raise StandInError(400, f"Part {part_number} must be {expected_size} bytes, got {len(data)}")
+        checksum = request.headers.get('X-Content-SHA256')
+        if checksum and hashlib.sha256(data).hexdigest() != checksum:
+            raise StandInError(422, f"Checksum mismatch for part {part_number}")
+
+        with open(os.path.join(self.upload_dir, upload_id, str(part_number)), 'wb') as part_file:
+            part_file.write(data)
+        with self.lock:
+            upload["parts"].add(part_number)
+        return 200, {"partNumber": part_number, "size": len(data)}
+
+    def commit_upload(self, request: 'StandInRequestHandler', upload_id: str) -> Tuple[int, Any]:
+        body = request.read_json()
+        with self.lock:
+            upload = self._upload(upload_id)
+            missing = set(range(1, upload["totalParts"] + 1)) - upload["parts"]
+        if missing:
+            raise StandInError(409, f"Upload {upload_id} is missing parts {sorted(missing)}")
+
+        digest = hashlib.sha256()
+        for part_number in range(1, upload["totalParts"] + 1):
+            with open(os.path.join(self.upload_dir, upload_id, str(part_number)), 'rb') as part_file:
+                digest.update(part_file.read())
+        expected = body.get("sha256") or upload["sha256"]
+        if expected and digest.hexdigest() != expected:
+            raise StandInError(422, "Checksum of the assembled file does not match")
+
+        with self.lock:
+            self.uploads.pop(upload_id, None)
+        shutil.rmtree(os.path.join(self.upload_dir, upload_id), ignore_errors=True)
+        return 201, self._add_document(upload["filename"], upload["secondaryFileName"])
+
+    def abort_upload(self, request: 'StandInRequestHandler', upload_id: str) -> Tuple[int, Any]:
+        with self.lock:
+            self._upload(upload_id)
+            self.uploads.pop(upload_id, None)
+        shutil.rmtree(os.path.join(self.upload_dir, upload_id), ignore_errors=True)
+        return 204, None
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    backend: StandInBackend = None
+    base_path = f"/{BACKEND_BASE_PATH.strip('/')}/"
+
+    @property
+    def query(self) -> Dict[str, List[str]]:
+        return parse_qs(urlsplit(self.path).query)
+
+    def read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def read_json(self) -> Dict[str, Any]:
+        body = self.read_body()
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            raise StandInError(400, "Request body is not valid JSON")
+
+    def _handle(self, method: str) -> None:
+        path = self.path.split('?', 1)[0]
+        try:
+            if not path.startswith(self.base_path):
+                raise StandInError(404, f"Not under {self.base_path}")
+            status, body = self.backend.dispatch(self, method, path[len(self.base_path):].strip('/'))
+        except StandInError as e:
+            status, body = e.status, {"message": str(e), "status": e.status}
+            # Unread request bodies would corrupt the next request on this keep-alive connection
+            self.close_connection = True
+        except Exception as e:
+            logger.exception("Stand-in handler failed")
+            status, body = 500, {"message": str(e), "status": 500}
+            self.close_connection = True
+        self._respond(status, body)
+
+    def _respond(self, status: int, body: Optional[Any]) -> None:
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        if payload:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def log_message(self, format, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8080, **backend_options) -> ThreadingHTTPServer:
+    handler = type("BoundStandInRequestHandler", (StandInRequestHandler,),
+                   {"backend": StandInBackend(**backend_options)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--part-failure-rate", type=float, default=0.0,
+                        help="fraction of upload part requests answered with 503")
+    parser.add_argument("--seed-interviews", type=int, default=0,
+                        help="number of generated interviews (with questions) to start with")
+    parser.add_argument("--no-history-endpoint", action="store_true",
+                        help="leave out interview/history, as backends without it behave")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = make_server(args.host, args.port, part_failure_rate=args.part_failure_rate,
+                         seed_interviews=args.seed_interviews, history_endpoint=not args.no_history_endpoint)
+    logger.info("Stand-in backend listening on http://%s:%d%s", args.host, args.port,
+                StandInRequestHandler.base_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.RequestHandlerClass.backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
 import streamlit as st
 
 import constants
+from api_client.metrics import get_page_metrics, start_metrics_server
+from api_client.tracing import SPAN_KIND_SERVER, get_tracer
+
+start_metrics_server()
 
 if "authenticated_user" not in st.session_state:
     st.session_state.authenticated_user = None
@@ -71,4 +75,8 @@ if st.session_state.authenticated_user is not None:
 else:
     pg = st.navigation(get_available_not_authenticated_pages())
 
-pg.run()
+# Each script run is the root span of a trace; API calls made while it runs become its children
+with get_tracer().start_span(f"page {pg.title}", kind=SPAN_KIND_SERVER,
+                             attributes={'streamlit.page': pg.title, 'streamlit.url_path': pg.url_path}), \
+        get_page_metrics().track_run(pg.title):
+    pg.run()
@@ -1,4 +1,5 @@
 from datetime import datetime
+from itertools import islice
 
 
 def format_file_size(size_bytes):
@@ -33,6 +34,16 @@ def truncate_text(text, max_length=20):
     return text if len(text) <= max_length else text[:max_length - 3] + "..."
 
 
+def batched(items, size):
+    """Group an iterable into lists of up to size items without materializing it"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
 def get_role_display(roles):
     """Convert roles list to display string"""
     if not roles: